@@ -12,6 +12,7 @@ import (
 	protoreflect "google.golang.org/protobuf/reflect/protoreflect"
 	protoimpl "google.golang.org/protobuf/runtime/protoimpl"
 	fieldmaskpb "google.golang.org/protobuf/types/known/fieldmaskpb"
+	timestamppb "google.golang.org/protobuf/types/known/timestamppb"
 	reflect "reflect"
 	sync "sync"
 	unsafe "unsafe"
@@ -24,6 +25,62 @@ const (
 	_ = protoimpl.EnforceVersion(protoimpl.MaxVersion - 20)
 )
 
+type AppItemEvent_Type int32
+
+const (
+	AppItemEvent_TYPE_UNSPECIFIED AppItemEvent_Type = 0
+	AppItemEvent_TYPE_CREATED     AppItemEvent_Type = 1
+	AppItemEvent_TYPE_UPDATED     AppItemEvent_Type = 2
+	AppItemEvent_TYPE_DELETED     AppItemEvent_Type = 3
+	// All initial items have been sent, only live changes follow
+	AppItemEvent_TYPE_SYNCED AppItemEvent_Type = 4
+)
+
+// Enum value maps for AppItemEvent_Type.
+var (
+	AppItemEvent_Type_name = map[int32]string{
+		0: "TYPE_UNSPECIFIED",
+		1: "TYPE_CREATED",
+		2: "TYPE_UPDATED",
+		3: "TYPE_DELETED",
+		4: "TYPE_SYNCED",
+	}
+	AppItemEvent_Type_value = map[string]int32{
+		"TYPE_UNSPECIFIED": 0,
+		"TYPE_CREATED":     1,
+		"TYPE_UPDATED":     2,
+		"TYPE_DELETED":     3,
+		"TYPE_SYNCED":      4,
+	}
+)
+
+func (x AppItemEvent_Type) Enum() *AppItemEvent_Type {
+	p := new(AppItemEvent_Type)
+	*p = x
+	return p
+}
+
+func (x AppItemEvent_Type) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (AppItemEvent_Type) Descriptor() protoreflect.EnumDescriptor {
+	return file_apptemplate_v1_appitems_proto_enumTypes[0].Descriptor()
+}
+
+func (AppItemEvent_Type) Type() protoreflect.EnumType {
+	return &file_apptemplate_v1_appitems_proto_enumTypes[0]
+}
+
+func (x AppItemEvent_Type) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use AppItemEvent_Type.Descriptor instead.
+func (AppItemEvent_Type) EnumDescriptor() ([]byte, []int) {
+	return file_apptemplate_v1_appitems_proto_rawDescGZIP(), []int{19, 0}
+}
+
 // AppItemInfo represents a appitem in the catalog
 type AppItemInfo struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
@@ -233,9 +290,13 @@ func (x *ListAppItemsResponse) GetPagination() *PaginationResponse {
 }
 
 type GetAppItemRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Id            string                 `protobuf:"bytes,1,opt,name=id,proto3" json:"id,omitempty"`
-	Version       string                 `protobuf:"bytes,2,opt,name=version,proto3" json:"version,omitempty"` // Optional, defaults to default_version
+	state protoimpl.MessageState `protogen:"open.v1"`
+	Id    string                 `protobuf:"bytes,1,opt,name=id,proto3" json:"id,omitempty"`
+	// *
+	// Version of the item the caller already has (GetAppItemResponse.version).
+	// If it is still current the response sets not_modified and omits the
+	// appitem.  Optional - without it the item is always returned.
+	Version       string `protobuf:"bytes,2,opt,name=version,proto3" json:"version,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -285,8 +346,15 @@ func (x *GetAppItemRequest) GetVersion() string {
 }
 
 type GetAppItemResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Appitem       *AppItem               `protobuf:"bytes,1,opt,name=appitem,proto3" json:"appitem,omitempty"`
+	state   protoimpl.MessageState `protogen:"open.v1"`
+	Appitem *AppItem               `protobuf:"bytes,1,opt,name=appitem,proto3" json:"appitem,omitempty"`
+	// *
+	// Opaque version of the item, changes whenever the item does.  Send it
+	// back as GetAppItemRequest.version to revalidate a cached copy.
+	Version string `protobuf:"bytes,2,opt,name=version,proto3" json:"version,omitempty"`
+	// *
+	// The version in the request is current, appitem is not set.
+	NotModified   bool `protobuf:"varint,3,opt,name=not_modified,json=notModified,proto3" json:"not_modified,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -328,6 +396,20 @@ func (x *GetAppItemResponse) GetAppitem() *AppItem {
 	return nil
 }
 
+func (x *GetAppItemResponse) GetVersion() string {
+	if x != nil {
+		return x.Version
+	}
+	return ""
+}
+
+func (x *GetAppItemResponse) GetNotModified() bool {
+	if x != nil {
+		return x.NotModified
+	}
+	return false
+}
+
 type GetAppItemContentRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Id            string                 `protobuf:"bytes,1,opt,name=id,proto3" json:"id,omitempty"`
@@ -636,7 +718,11 @@ type GetAppItemsRequest struct {
 	state protoimpl.MessageState `protogen:"open.v1"`
 	// *
 	// IDs of the appitem to be fetched
-	Ids           []string `protobuf:"bytes,1,rep,name=ids,proto3" json:"ids,omitempty"`
+	Ids []string `protobuf:"bytes,1,rep,name=ids,proto3" json:"ids,omitempty"`
+	// *
+	// Versions the caller already has, by id.  Items whose version is still
+	// current are listed in not_modified_ids instead of being returned.
+	Versions      map[string]string `protobuf:"bytes,2,rep,name=versions,proto3" json:"versions,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -678,13 +764,26 @@ func (x *GetAppItemsRequest) GetIds() []string {
 	return nil
 }
 
+func (x *GetAppItemsRequest) GetVersions() map[string]string {
+	if x != nil {
+		return x.Versions
+	}
+	return nil
+}
+
 // *
 // AppItem batch-get response
 type GetAppItemsResponse struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Appitems      map[string]*AppItem    `protobuf:"bytes,1,rep,name=appitems,proto3" json:"appitems,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+	state    protoimpl.MessageState `protogen:"open.v1"`
+	Appitems map[string]*AppItem    `protobuf:"bytes,1,rep,name=appitems,proto3" json:"appitems,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	// *
+	// Current version of every item found, returned or not modified
+	Versions map[string]string `protobuf:"bytes,2,rep,name=versions,proto3" json:"versions,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	// *
+	// IDs whose version in the request is current (not in appitems)
+	NotModifiedIds []string `protobuf:"bytes,3,rep,name=not_modified_ids,json=notModifiedIds,proto3" json:"not_modified_ids,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
 }
 
 func (x *GetAppItemsResponse) Reset() {
@@ -724,6 +823,20 @@ func (x *GetAppItemsResponse) GetAppitems() map[string]*AppItem {
 	return nil
 }
 
+func (x *GetAppItemsResponse) GetVersions() map[string]string {
+	if x != nil {
+		return x.Versions
+	}
+	return nil
+}
+
+func (x *GetAppItemsResponse) GetNotModifiedIds() []string {
+	if x != nil {
+		return x.NotModifiedIds
+	}
+	return nil
+}
+
 // *
 // AppItem creation request object
 type CreateAppItemRequest struct {
@@ -830,11 +943,383 @@ func (x *CreateAppItemResponse) GetFieldErrors() map[string]string {
 	return nil
 }
 
+// *
+// One batch of a CreateAppItems stream.
+type CreateAppItemsRequest struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// *
+	// AppItems to create, in order
+	Appitems      []*AppItem `protobuf:"bytes,1,rep,name=appitems,proto3" json:"appitems,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *CreateAppItemsRequest) Reset() {
+	*x = CreateAppItemsRequest{}
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[15]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CreateAppItemsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreateAppItemsRequest) ProtoMessage() {}
+
+func (x *CreateAppItemsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[15]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreateAppItemsRequest.ProtoReflect.Descriptor instead.
+func (*CreateAppItemsRequest) Descriptor() ([]byte, []int) {
+	return file_apptemplate_v1_appitems_proto_rawDescGZIP(), []int{15}
+}
+
+func (x *CreateAppItemsRequest) GetAppitems() []*AppItem {
+	if x != nil {
+		return x.Appitems
+	}
+	return nil
+}
+
+// *
+// Outcome of one item of a CreateAppItems stream.
+type CreateAppItemResult struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// *
+	// Position of the item in the stream, counted across all batches from 0
+	Index int64 `protobuf:"varint,1,opt,name=index,proto3" json:"index,omitempty"`
+	// *
+	// ID of the created item (or of the existing one if already_exists)
+	Id string `protobuf:"bytes,2,opt,name=id,proto3" json:"id,omitempty"`
+	// *
+	// Error specific to a field if the item was rejected
+	FieldErrors map[string]string `protobuf:"bytes,3,rep,name=field_errors,json=fieldErrors,proto3" json:"field_errors,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	// *
+	// An item with this ID already existed and was left unchanged
+	AlreadyExists bool `protobuf:"varint,4,opt,name=already_exists,json=alreadyExists,proto3" json:"already_exists,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *CreateAppItemResult) Reset() {
+	*x = CreateAppItemResult{}
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[16]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CreateAppItemResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreateAppItemResult) ProtoMessage() {}
+
+func (x *CreateAppItemResult) ProtoReflect() protoreflect.Message {
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[16]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreateAppItemResult.ProtoReflect.Descriptor instead.
+func (*CreateAppItemResult) Descriptor() ([]byte, []int) {
+	return file_apptemplate_v1_appitems_proto_rawDescGZIP(), []int{16}
+}
+
+func (x *CreateAppItemResult) GetIndex() int64 {
+	if x != nil {
+		return x.Index
+	}
+	return 0
+}
+
+func (x *CreateAppItemResult) GetId() string {
+	if x != nil {
+		return x.Id
+	}
+	return ""
+}
+
+func (x *CreateAppItemResult) GetFieldErrors() map[string]string {
+	if x != nil {
+		return x.FieldErrors
+	}
+	return nil
+}
+
+func (x *CreateAppItemResult) GetAlreadyExists() bool {
+	if x != nil {
+		return x.AlreadyExists
+	}
+	return false
+}
+
+// *
+// Summary of a CreateAppItems stream.
+type CreateAppItemsResponse struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// *
+	// Number of items created
+	Created int64 `protobuf:"varint,1,opt,name=created,proto3" json:"created,omitempty"`
+	// *
+	// Number of items skipped because their ID already existed
+	Skipped int64 `protobuf:"varint,2,opt,name=skipped,proto3" json:"skipped,omitempty"`
+	// *
+	// Number of items rejected with field_errors
+	Failed int64 `protobuf:"varint,3,opt,name=failed,proto3" json:"failed,omitempty"`
+	// *
+	// One result per item, in stream order
+	Results       []*CreateAppItemResult `protobuf:"bytes,4,rep,name=results,proto3" json:"results,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *CreateAppItemsResponse) Reset() {
+	*x = CreateAppItemsResponse{}
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[17]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CreateAppItemsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreateAppItemsResponse) ProtoMessage() {}
+
+func (x *CreateAppItemsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[17]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreateAppItemsResponse.ProtoReflect.Descriptor instead.
+func (*CreateAppItemsResponse) Descriptor() ([]byte, []int) {
+	return file_apptemplate_v1_appitems_proto_rawDescGZIP(), []int{17}
+}
+
+func (x *CreateAppItemsResponse) GetCreated() int64 {
+	if x != nil {
+		return x.Created
+	}
+	return 0
+}
+
+func (x *CreateAppItemsResponse) GetSkipped() int64 {
+	if x != nil {
+		return x.Skipped
+	}
+	return 0
+}
+
+func (x *CreateAppItemsResponse) GetFailed() int64 {
+	if x != nil {
+		return x.Failed
+	}
+	return 0
+}
+
+func (x *CreateAppItemsResponse) GetResults() []*CreateAppItemResult {
+	if x != nil {
+		return x.Results
+	}
+	return nil
+}
+
+// *
+// Request to watch the catalog for changes.
+type WatchAppItemsRequest struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// *
+	// Resume after the event with this cursor.  Empty starts at the current
+	// end of the change log.  A cursor that is no longer retained fails with
+	// OUT_OF_RANGE and the client has to resync.
+	Cursor string `protobuf:"bytes,1,opt,name=cursor,proto3" json:"cursor,omitempty"`
+	// *
+	// Without a cursor, first send every existing item as a CREATED event
+	// followed by a SYNCED marker.
+	SendInitial bool `protobuf:"varint,2,opt,name=send_initial,json=sendInitial,proto3" json:"send_initial,omitempty"`
+	// *
+	// Only changes to appitems of this owner.
+	OwnerId       string `protobuf:"bytes,3,opt,name=owner_id,json=ownerId,proto3" json:"owner_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WatchAppItemsRequest) Reset() {
+	*x = WatchAppItemsRequest{}
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[18]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WatchAppItemsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WatchAppItemsRequest) ProtoMessage() {}
+
+func (x *WatchAppItemsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[18]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WatchAppItemsRequest.ProtoReflect.Descriptor instead.
+func (*WatchAppItemsRequest) Descriptor() ([]byte, []int) {
+	return file_apptemplate_v1_appitems_proto_rawDescGZIP(), []int{18}
+}
+
+func (x *WatchAppItemsRequest) GetCursor() string {
+	if x != nil {
+		return x.Cursor
+	}
+	return ""
+}
+
+func (x *WatchAppItemsRequest) GetSendInitial() bool {
+	if x != nil {
+		return x.SendInitial
+	}
+	return false
+}
+
+func (x *WatchAppItemsRequest) GetOwnerId() string {
+	if x != nil {
+		return x.OwnerId
+	}
+	return ""
+}
+
+// *
+// A single change to the catalog.
+type AppItemEvent struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	Type  AppItemEvent_Type      `protobuf:"varint,1,opt,name=type,proto3,enum=apptemplate.v1.AppItemEvent_Type" json:"type,omitempty"`
+	// *
+	// ID of the changed appitem (empty for SYNCED).
+	Id string `protobuf:"bytes,2,opt,name=id,proto3" json:"id,omitempty"`
+	// *
+	// The appitem after the change (the last version for DELETED).
+	Appitem *AppItem `protobuf:"bytes,3,opt,name=appitem,proto3" json:"appitem,omitempty"`
+	// *
+	// When the change happened.
+	UpdatedAt *timestamppb.Timestamp `protobuf:"bytes,4,opt,name=updated_at,json=updatedAt,proto3" json:"updated_at,omitempty"`
+	// *
+	// Position in the change log after this event, pass it back in
+	// WatchAppItemsRequest.cursor to resume.  Empty for initial items.
+	Cursor string `protobuf:"bytes,5,opt,name=cursor,proto3" json:"cursor,omitempty"`
+	// *
+	// Owner of the appitem (empty for SYNCED and for items without one).
+	OwnerId       string `protobuf:"bytes,6,opt,name=owner_id,json=ownerId,proto3" json:"owner_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *AppItemEvent) Reset() {
+	*x = AppItemEvent{}
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[19]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *AppItemEvent) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AppItemEvent) ProtoMessage() {}
+
+func (x *AppItemEvent) ProtoReflect() protoreflect.Message {
+	mi := &file_apptemplate_v1_appitems_proto_msgTypes[19]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use AppItemEvent.ProtoReflect.Descriptor instead.
+func (*AppItemEvent) Descriptor() ([]byte, []int) {
+	return file_apptemplate_v1_appitems_proto_rawDescGZIP(), []int{19}
+}
+
+func (x *AppItemEvent) GetType() AppItemEvent_Type {
+	if x != nil {
+		return x.Type
+	}
+	return AppItemEvent_TYPE_UNSPECIFIED
+}
+
+func (x *AppItemEvent) GetId() string {
+	if x != nil {
+		return x.Id
+	}
+	return ""
+}
+
+func (x *AppItemEvent) GetAppitem() *AppItem {
+	if x != nil {
+		return x.Appitem
+	}
+	return nil
+}
+
+func (x *AppItemEvent) GetUpdatedAt() *timestamppb.Timestamp {
+	if x != nil {
+		return x.UpdatedAt
+	}
+	return nil
+}
+
+func (x *AppItemEvent) GetCursor() string {
+	if x != nil {
+		return x.Cursor
+	}
+	return ""
+}
+
+func (x *AppItemEvent) GetOwnerId() string {
+	if x != nil {
+		return x.OwnerId
+	}
+	return ""
+}
+
 var File_apptemplate_v1_appitems_proto protoreflect.FileDescriptor
 
 const file_apptemplate_v1_appitems_proto_rawDesc = "" +
 	"\n" +
-	"\x1dapptemplate/v1/appitems.proto\x12\x0eapptemplate.v1\x1a google/protobuf/field_mask.proto\x1a\x1bapptemplate/v1/models.proto\x1a\x1cgoogle/api/annotations.proto\x1a.protoc-gen-openapiv2/options/annotations.proto\"\xda\x01\n" +
+	"\x1dapptemplate/v1/appitems.proto\x12\x0eapptemplate.v1\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bapptemplate/v1/models.proto\x1a\x1cgoogle/api/annotations.proto\x1a.protoc-gen-openapiv2/options/annotations.proto\"\xda\x01\n" +
 	"\vAppItemInfo\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n" +
 	"\x04name\x18\x02 \x01(\tR\x04name\x12 \n" +
@@ -858,9 +1343,11 @@ const file_apptemplate_v1_appitems_proto_rawDesc = "" +
 	"pagination\"=\n" +
 	"\x11GetAppItemRequest\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\x12\x18\n" +
-	"\aversion\x18\x02 \x01(\tR\aversion\"G\n" +
+	"\aversion\x18\x02 \x01(\tR\aversion\"\x84\x01\n" +
 	"\x12GetAppItemResponse\x121\n" +
-	"\aappitem\x18\x01 \x01(\v2\x17.apptemplate.v1.AppItemR\aappitem\"D\n" +
+	"\aappitem\x18\x01 \x01(\v2\x17.apptemplate.v1.AppItemR\aappitem\x12\x18\n" +
+	"\aversion\x18\x02 \x01(\tR\aversion\x12!\n" +
+	"\fnot_modified\x18\x03 \x01(\bR\vnotModified\"D\n" +
 	"\x18GetAppItemContentRequest\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\x12\x18\n" +
 	"\aversion\x18\x02 \x01(\tR\aversion\"\x9a\x01\n" +
@@ -878,14 +1365,23 @@ const file_apptemplate_v1_appitems_proto_rawDesc = "" +
 	"\x17*\x15UpdateAppItemResponse\"&\n" +
 	"\x14DeleteAppItemRequest\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\"\x17\n" +
-	"\x15DeleteAppItemResponse\"&\n" +
+	"\x15DeleteAppItemResponse\"\xb1\x01\n" +
 	"\x12GetAppItemsRequest\x12\x10\n" +
-	"\x03ids\x18\x01 \x03(\tR\x03ids\"\xba\x01\n" +
+	"\x03ids\x18\x01 \x03(\tR\x03ids\x12L\n" +
+	"\bversions\x18\x02 \x03(\v20.apptemplate.v1.GetAppItemsRequest.VersionsEntryR\bversions\x1a;\n" +
+	"\rVersionsEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"\xf0\x02\n" +
 	"\x13GetAppItemsResponse\x12M\n" +
-	"\bappitems\x18\x01 \x03(\v21.apptemplate.v1.GetAppItemsResponse.AppitemsEntryR\bappitems\x1aT\n" +
+	"\bappitems\x18\x01 \x03(\v21.apptemplate.v1.GetAppItemsResponse.AppitemsEntryR\bappitems\x12M\n" +
+	"\bversions\x18\x02 \x03(\v21.apptemplate.v1.GetAppItemsResponse.VersionsEntryR\bversions\x12(\n" +
+	"\x10not_modified_ids\x18\x03 \x03(\tR\x0enotModifiedIds\x1aT\n" +
 	"\rAppitemsEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x12-\n" +
-	"\x05value\x18\x02 \x01(\v2\x17.apptemplate.v1.AppItemR\x05value:\x028\x01\"I\n" +
+	"\x05value\x18\x02 \x01(\v2\x17.apptemplate.v1.AppItemR\x05value:\x028\x01\x1a;\n" +
+	"\rVersionsEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"I\n" +
 	"\x14CreateAppItemRequest\x121\n" +
 	"\aappitem\x18\x01 \x01(\v2\x17.apptemplate.v1.AppItemR\aappitem\"\xe5\x01\n" +
 	"\x15CreateAppItemResponse\x121\n" +
@@ -893,7 +1389,40 @@ const file_apptemplate_v1_appitems_proto_rawDesc = "" +
 	"\ffield_errors\x18\x02 \x03(\v26.apptemplate.v1.CreateAppItemResponse.FieldErrorsEntryR\vfieldErrors\x1a>\n" +
 	"\x10FieldErrorsEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
-	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x012\xe2\x05\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"L\n" +
+	"\x15CreateAppItemsRequest\x123\n" +
+	"\bappitems\x18\x01 \x03(\v2\x17.apptemplate.v1.AppItemR\bappitems\"\xfb\x01\n" +
+	"\x13CreateAppItemResult\x12\x14\n" +
+	"\x05index\x18\x01 \x01(\x03R\x05index\x12\x0e\n" +
+	"\x02id\x18\x02 \x01(\tR\x02id\x12W\n" +
+	"\ffield_errors\x18\x03 \x03(\v24.apptemplate.v1.CreateAppItemResult.FieldErrorsEntryR\vfieldErrors\x12%\n" +
+	"\x0ealready_exists\x18\x04 \x01(\bR\ralreadyExists\x1a>\n" +
+	"\x10FieldErrorsEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"\xa3\x01\n" +
+	"\x16CreateAppItemsResponse\x12\x18\n" +
+	"\acreated\x18\x01 \x01(\x03R\acreated\x12\x18\n" +
+	"\askipped\x18\x02 \x01(\x03R\askipped\x12\x16\n" +
+	"\x06failed\x18\x03 \x01(\x03R\x06failed\x12=\n" +
+	"\aresults\x18\x04 \x03(\v2#.apptemplate.v1.CreateAppItemResultR\aresults\"l\n" +
+	"\x14WatchAppItemsRequest\x12\x16\n" +
+	"\x06cursor\x18\x01 \x01(\tR\x06cursor\x12!\n" +
+	"\fsend_initial\x18\x02 \x01(\bR\vsendInitial\x12\x19\n" +
+	"\bowner_id\x18\x03 \x01(\tR\aownerId\"\xdb\x02\n" +
+	"\fAppItemEvent\x125\n" +
+	"\x04type\x18\x01 \x01(\x0e2!.apptemplate.v1.AppItemEvent.TypeR\x04type\x12\x0e\n" +
+	"\x02id\x18\x02 \x01(\tR\x02id\x121\n" +
+	"\aappitem\x18\x03 \x01(\v2\x17.apptemplate.v1.AppItemR\aappitem\x129\n" +
+	"\n" +
+	"updated_at\x18\x04 \x01(\v2\x1a.google.protobuf.TimestampR\tupdatedAt\x12\x16\n" +
+	"\x06cursor\x18\x05 \x01(\tR\x06cursor\x12\x19\n" +
+	"\bowner_id\x18\x06 \x01(\tR\aownerId\"c\n" +
+	"\x04Type\x12\x14\n" +
+	"\x10TYPE_UNSPECIFIED\x10\x00\x12\x10\n" +
+	"\fTYPE_CREATED\x10\x01\x12\x10\n" +
+	"\fTYPE_UPDATED\x10\x02\x12\x10\n" +
+	"\fTYPE_DELETED\x10\x03\x12\x0f\n" +
+	"\vTYPE_SYNCED\x10\x042\xdd\a\n" +
 	"\x0fAppItemsService\x12u\n" +
 	"\rCreateAppItem\x12$.apptemplate.v1.CreateAppItemRequest\x1a%.apptemplate.v1.CreateAppItemResponse\"\x17\x82\xd3\xe4\x93\x02\x11:\x01*\"\f/v1/appitems\x12u\n" +
 	"\vGetAppItems\x12\".apptemplate.v1.GetAppItemsRequest\x1a#.apptemplate.v1.GetAppItemsResponse\"\x1d\x82\xd3\xe4\x93\x02\x17\x12\x15/v1/appitems:batchGet\x12o\n" +
@@ -901,7 +1430,9 @@ const file_apptemplate_v1_appitems_proto_rawDesc = "" +
 	"\n" +
 	"GetAppItem\x12!.apptemplate.v1.GetAppItemRequest\x1a\".apptemplate.v1.GetAppItemResponse\"\x19\x82\xd3\xe4\x93\x02\x13\x12\x11/v1/appitems/{id}\x12y\n" +
 	"\rDeleteAppItem\x12$.apptemplate.v1.DeleteAppItemRequest\x1a%.apptemplate.v1.DeleteAppItemResponse\"\x1b\x82\xd3\xe4\x93\x02\x15*\x13/v1/appitems/{id=*}\x12\x84\x01\n" +
-	"\rUpdateAppItem\x12$.apptemplate.v1.UpdateAppItemRequest\x1a%.apptemplate.v1.UpdateAppItemResponse\"&\x82\xd3\xe4\x93\x02 :\x01*2\x1b/v1/appitems/{appitem.id=*}B\xb1\x01\n" +
+	"\rUpdateAppItem\x12$.apptemplate.v1.UpdateAppItemRequest\x1a%.apptemplate.v1.UpdateAppItemResponse\"&\x82\xd3\xe4\x93\x02 :\x01*2\x1b/v1/appitems/{appitem.id=*}\x12\x85\x01\n" +
+	"\x0eCreateAppItems\x12%.apptemplate.v1.CreateAppItemsRequest\x1a&.apptemplate.v1.CreateAppItemsResponse\"\"\x82\xd3\xe4\x93\x02\x1c:\x01*\"\x17/v1/appitems:bulkCreate(\x01\x12q\n" +
+	"\rWatchAppItems\x12$.apptemplate.v1.WatchAppItemsRequest\x1a\x1c.apptemplate.v1.AppItemEvent\"\x1a\x82\xd3\xe4\x93\x02\x14\x12\x12/v1/appitems:watch0\x01B\xb1\x01\n" +
 	"\x12com.apptemplate.v1B\rAppitemsProtoP\x01Z3github.com/panyam/apptemplate/gen/go/apptemplate/v1\xa2\x02\x03AXX\xaa\x02\x0eApptemplate.V1\xca\x02\x0eApptemplate\\V1\xe2\x02\x1aApptemplate\\V1\\GPBMetadata\xea\x02\x0fApptemplate::V1b\x06proto3"
 
 var (
@@ -916,60 +1447,83 @@ func file_apptemplate_v1_appitems_proto_rawDescGZIP() []byte {
 	return file_apptemplate_v1_appitems_proto_rawDescData
 }
 
-var file_apptemplate_v1_appitems_proto_msgTypes = make([]protoimpl.MessageInfo, 17)
+var file_apptemplate_v1_appitems_proto_enumTypes = make([]protoimpl.EnumInfo, 1)
+var file_apptemplate_v1_appitems_proto_msgTypes = make([]protoimpl.MessageInfo, 25)
 var file_apptemplate_v1_appitems_proto_goTypes = []any{
-	(*AppItemInfo)(nil),               // 0: apptemplate.v1.AppItemInfo
-	(*ListAppItemsRequest)(nil),       // 1: apptemplate.v1.ListAppItemsRequest
-	(*ListAppItemsResponse)(nil),      // 2: apptemplate.v1.ListAppItemsResponse
-	(*GetAppItemRequest)(nil),         // 3: apptemplate.v1.GetAppItemRequest
-	(*GetAppItemResponse)(nil),        // 4: apptemplate.v1.GetAppItemResponse
-	(*GetAppItemContentRequest)(nil),  // 5: apptemplate.v1.GetAppItemContentRequest
-	(*GetAppItemContentResponse)(nil), // 6: apptemplate.v1.GetAppItemContentResponse
-	(*UpdateAppItemRequest)(nil),      // 7: apptemplate.v1.UpdateAppItemRequest
-	(*UpdateAppItemResponse)(nil),     // 8: apptemplate.v1.UpdateAppItemResponse
-	(*DeleteAppItemRequest)(nil),      // 9: apptemplate.v1.DeleteAppItemRequest
-	(*DeleteAppItemResponse)(nil),     // 10: apptemplate.v1.DeleteAppItemResponse
-	(*GetAppItemsRequest)(nil),        // 11: apptemplate.v1.GetAppItemsRequest
-	(*GetAppItemsResponse)(nil),       // 12: apptemplate.v1.GetAppItemsResponse
-	(*CreateAppItemRequest)(nil),      // 13: apptemplate.v1.CreateAppItemRequest
-	(*CreateAppItemResponse)(nil),     // 14: apptemplate.v1.CreateAppItemResponse
-	nil,                               // 15: apptemplate.v1.GetAppItemsResponse.AppitemsEntry
-	nil,                               // 16: apptemplate.v1.CreateAppItemResponse.FieldErrorsEntry
-	(*Pagination)(nil),                // 17: apptemplate.v1.Pagination
-	(*AppItem)(nil),                   // 18: apptemplate.v1.AppItem
-	(*PaginationResponse)(nil),        // 19: apptemplate.v1.PaginationResponse
-	(*fieldmaskpb.FieldMask)(nil),     // 20: google.protobuf.FieldMask
+	(AppItemEvent_Type)(0),            // 0: apptemplate.v1.AppItemEvent.Type
+	(*AppItemInfo)(nil),               // 1: apptemplate.v1.AppItemInfo
+	(*ListAppItemsRequest)(nil),       // 2: apptemplate.v1.ListAppItemsRequest
+	(*ListAppItemsResponse)(nil),      // 3: apptemplate.v1.ListAppItemsResponse
+	(*GetAppItemRequest)(nil),         // 4: apptemplate.v1.GetAppItemRequest
+	(*GetAppItemResponse)(nil),        // 5: apptemplate.v1.GetAppItemResponse
+	(*GetAppItemContentRequest)(nil),  // 6: apptemplate.v1.GetAppItemContentRequest
+	(*GetAppItemContentResponse)(nil), // 7: apptemplate.v1.GetAppItemContentResponse
+	(*UpdateAppItemRequest)(nil),      // 8: apptemplate.v1.UpdateAppItemRequest
+	(*UpdateAppItemResponse)(nil),     // 9: apptemplate.v1.UpdateAppItemResponse
+	(*DeleteAppItemRequest)(nil),      // 10: apptemplate.v1.DeleteAppItemRequest
+	(*DeleteAppItemResponse)(nil),     // 11: apptemplate.v1.DeleteAppItemResponse
+	(*GetAppItemsRequest)(nil),        // 12: apptemplate.v1.GetAppItemsRequest
+	(*GetAppItemsResponse)(nil),       // 13: apptemplate.v1.GetAppItemsResponse
+	(*CreateAppItemRequest)(nil),      // 14: apptemplate.v1.CreateAppItemRequest
+	(*CreateAppItemResponse)(nil),     // 15: apptemplate.v1.CreateAppItemResponse
+	(*CreateAppItemsRequest)(nil),     // 16: apptemplate.v1.CreateAppItemsRequest
+	(*CreateAppItemResult)(nil),       // 17: apptemplate.v1.CreateAppItemResult
+	(*CreateAppItemsResponse)(nil),    // 18: apptemplate.v1.CreateAppItemsResponse
+	(*WatchAppItemsRequest)(nil),      // 19: apptemplate.v1.WatchAppItemsRequest
+	(*AppItemEvent)(nil),              // 20: apptemplate.v1.AppItemEvent
+	nil,                               // 21: apptemplate.v1.GetAppItemsRequest.VersionsEntry
+	nil,                               // 22: apptemplate.v1.GetAppItemsResponse.AppitemsEntry
+	nil,                               // 23: apptemplate.v1.GetAppItemsResponse.VersionsEntry
+	nil,                               // 24: apptemplate.v1.CreateAppItemResponse.FieldErrorsEntry
+	nil,                               // 25: apptemplate.v1.CreateAppItemResult.FieldErrorsEntry
+	(*Pagination)(nil),                // 26: apptemplate.v1.Pagination
+	(*AppItem)(nil),                   // 27: apptemplate.v1.AppItem
+	(*PaginationResponse)(nil),        // 28: apptemplate.v1.PaginationResponse
+	(*fieldmaskpb.FieldMask)(nil),     // 29: google.protobuf.FieldMask
+	(*timestamppb.Timestamp)(nil),     // 30: google.protobuf.Timestamp
 }
 var file_apptemplate_v1_appitems_proto_depIdxs = []int32{
-	17, // 0: apptemplate.v1.ListAppItemsRequest.pagination:type_name -> apptemplate.v1.Pagination
-	18, // 1: apptemplate.v1.ListAppItemsResponse.items:type_name -> apptemplate.v1.AppItem
-	19, // 2: apptemplate.v1.ListAppItemsResponse.pagination:type_name -> apptemplate.v1.PaginationResponse
-	18, // 3: apptemplate.v1.GetAppItemResponse.appitem:type_name -> apptemplate.v1.AppItem
-	18, // 4: apptemplate.v1.UpdateAppItemRequest.appitem:type_name -> apptemplate.v1.AppItem
-	20, // 5: apptemplate.v1.UpdateAppItemRequest.update_mask:type_name -> google.protobuf.FieldMask
-	18, // 6: apptemplate.v1.UpdateAppItemResponse.appitem:type_name -> apptemplate.v1.AppItem
-	15, // 7: apptemplate.v1.GetAppItemsResponse.appitems:type_name -> apptemplate.v1.GetAppItemsResponse.AppitemsEntry
-	18, // 8: apptemplate.v1.CreateAppItemRequest.appitem:type_name -> apptemplate.v1.AppItem
-	18, // 9: apptemplate.v1.CreateAppItemResponse.appitem:type_name -> apptemplate.v1.AppItem
-	16, // 10: apptemplate.v1.CreateAppItemResponse.field_errors:type_name -> apptemplate.v1.CreateAppItemResponse.FieldErrorsEntry
-	18, // 11: apptemplate.v1.GetAppItemsResponse.AppitemsEntry.value:type_name -> apptemplate.v1.AppItem
-	13, // 12: apptemplate.v1.AppItemsService.CreateAppItem:input_type -> apptemplate.v1.CreateAppItemRequest
-	11, // 13: apptemplate.v1.AppItemsService.GetAppItems:input_type -> apptemplate.v1.GetAppItemsRequest
-	1,  // 14: apptemplate.v1.AppItemsService.ListAppItems:input_type -> apptemplate.v1.ListAppItemsRequest
-	3,  // 15: apptemplate.v1.AppItemsService.GetAppItem:input_type -> apptemplate.v1.GetAppItemRequest
-	9,  // 16: apptemplate.v1.AppItemsService.DeleteAppItem:input_type -> apptemplate.v1.DeleteAppItemRequest
-	7,  // 17: apptemplate.v1.AppItemsService.UpdateAppItem:input_type -> apptemplate.v1.UpdateAppItemRequest
-	14, // 18: apptemplate.v1.AppItemsService.CreateAppItem:output_type -> apptemplate.v1.CreateAppItemResponse
-	12, // 19: apptemplate.v1.AppItemsService.GetAppItems:output_type -> apptemplate.v1.GetAppItemsResponse
-	2,  // 20: apptemplate.v1.AppItemsService.ListAppItems:output_type -> apptemplate.v1.ListAppItemsResponse
-	4,  // 21: apptemplate.v1.AppItemsService.GetAppItem:output_type -> apptemplate.v1.GetAppItemResponse
-	10, // 22: apptemplate.v1.AppItemsService.DeleteAppItem:output_type -> apptemplate.v1.DeleteAppItemResponse
-	8,  // 23: apptemplate.v1.AppItemsService.UpdateAppItem:output_type -> apptemplate.v1.UpdateAppItemResponse
-	18, // [18:24] is the sub-list for method output_type
-	12, // [12:18] is the sub-list for method input_type
-	12, // [12:12] is the sub-list for extension type_name
-	12, // [12:12] is the sub-list for extension extendee
-	0,  // [0:12] is the sub-list for field type_name
+	26, // 0: apptemplate.v1.ListAppItemsRequest.pagination:type_name -> apptemplate.v1.Pagination
+	27, // 1: apptemplate.v1.ListAppItemsResponse.items:type_name -> apptemplate.v1.AppItem
+	28, // 2: apptemplate.v1.ListAppItemsResponse.pagination:type_name -> apptemplate.v1.PaginationResponse
+	27, // 3: apptemplate.v1.GetAppItemResponse.appitem:type_name -> apptemplate.v1.AppItem
+	27, // 4: apptemplate.v1.UpdateAppItemRequest.appitem:type_name -> apptemplate.v1.AppItem
+	29, // 5: apptemplate.v1.UpdateAppItemRequest.update_mask:type_name -> google.protobuf.FieldMask
+	27, // 6: apptemplate.v1.UpdateAppItemResponse.appitem:type_name -> apptemplate.v1.AppItem
+	21, // 7: apptemplate.v1.GetAppItemsRequest.versions:type_name -> apptemplate.v1.GetAppItemsRequest.VersionsEntry
+	22, // 8: apptemplate.v1.GetAppItemsResponse.appitems:type_name -> apptemplate.v1.GetAppItemsResponse.AppitemsEntry
+	23, // 9: apptemplate.v1.GetAppItemsResponse.versions:type_name -> apptemplate.v1.GetAppItemsResponse.VersionsEntry
+	27, // 10: apptemplate.v1.CreateAppItemRequest.appitem:type_name -> apptemplate.v1.AppItem
+	27, // 11: apptemplate.v1.CreateAppItemResponse.appitem:type_name -> apptemplate.v1.AppItem
+	24, // 12: apptemplate.v1.CreateAppItemResponse.field_errors:type_name -> apptemplate.v1.CreateAppItemResponse.FieldErrorsEntry
+	27, // 13: apptemplate.v1.CreateAppItemsRequest.appitems:type_name -> apptemplate.v1.AppItem
+	25, // 14: apptemplate.v1.CreateAppItemResult.field_errors:type_name -> apptemplate.v1.CreateAppItemResult.FieldErrorsEntry
+	17, // 15: apptemplate.v1.CreateAppItemsResponse.results:type_name -> apptemplate.v1.CreateAppItemResult
+	0,  // 16: apptemplate.v1.AppItemEvent.type:type_name -> apptemplate.v1.AppItemEvent.Type
+	27, // 17: apptemplate.v1.AppItemEvent.appitem:type_name -> apptemplate.v1.AppItem
+	30, // 18: apptemplate.v1.AppItemEvent.updated_at:type_name -> google.protobuf.Timestamp
+	27, // 19: apptemplate.v1.GetAppItemsResponse.AppitemsEntry.value:type_name -> apptemplate.v1.AppItem
+	14, // 20: apptemplate.v1.AppItemsService.CreateAppItem:input_type -> apptemplate.v1.CreateAppItemRequest
+	12, // 21: apptemplate.v1.AppItemsService.GetAppItems:input_type -> apptemplate.v1.GetAppItemsRequest
+	2,  // 22: apptemplate.v1.AppItemsService.ListAppItems:input_type -> apptemplate.v1.ListAppItemsRequest
+	4,  // 23: apptemplate.v1.AppItemsService.GetAppItem:input_type -> apptemplate.v1.GetAppItemRequest
+	10, // 24: apptemplate.v1.AppItemsService.DeleteAppItem:input_type -> apptemplate.v1.DeleteAppItemRequest
+	8,  // 25: apptemplate.v1.AppItemsService.UpdateAppItem:input_type -> apptemplate.v1.UpdateAppItemRequest
+	16, // 26: apptemplate.v1.AppItemsService.CreateAppItems:input_type -> apptemplate.v1.CreateAppItemsRequest
+	19, // 27: apptemplate.v1.AppItemsService.WatchAppItems:input_type -> apptemplate.v1.WatchAppItemsRequest
+	15, // 28: apptemplate.v1.AppItemsService.CreateAppItem:output_type -> apptemplate.v1.CreateAppItemResponse
+	13, // 29: apptemplate.v1.AppItemsService.GetAppItems:output_type -> apptemplate.v1.GetAppItemsResponse
+	3,  // 30: apptemplate.v1.AppItemsService.ListAppItems:output_type -> apptemplate.v1.ListAppItemsResponse
+	5,  // 31: apptemplate.v1.AppItemsService.GetAppItem:output_type -> apptemplate.v1.GetAppItemResponse
+	11, // 32: apptemplate.v1.AppItemsService.DeleteAppItem:output_type -> apptemplate.v1.DeleteAppItemResponse
+	9,  // 33: apptemplate.v1.AppItemsService.UpdateAppItem:output_type -> apptemplate.v1.UpdateAppItemResponse
+	18, // 34: apptemplate.v1.AppItemsService.CreateAppItems:output_type -> apptemplate.v1.CreateAppItemsResponse
+	20, // 35: apptemplate.v1.AppItemsService.WatchAppItems:output_type -> apptemplate.v1.AppItemEvent
+	28, // [28:36] is the sub-list for method output_type
+	20, // [20:28] is the sub-list for method input_type
+	20, // [20:20] is the sub-list for extension type_name
+	20, // [20:20] is the sub-list for extension extendee
+	0,  // [0:20] is the sub-list for field type_name
 }
 
 func init() { file_apptemplate_v1_appitems_proto_init() }
@@ -983,13 +1537,14 @@ func file_apptemplate_v1_appitems_proto_init() {
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_apptemplate_v1_appitems_proto_rawDesc), len(file_apptemplate_v1_appitems_proto_rawDesc)),
-			NumEnums:      0,
-			NumMessages:   17,
+			NumEnums:      1,
+			NumMessages:   25,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
 		GoTypes:           file_apptemplate_v1_appitems_proto_goTypes,
 		DependencyIndexes: file_apptemplate_v1_appitems_proto_depIdxs,
+		EnumInfos:         file_apptemplate_v1_appitems_proto_enumTypes,
 		MessageInfos:      file_apptemplate_v1_appitems_proto_msgTypes,
 	}.Build()
 	File_apptemplate_v1_appitems_proto = out.File
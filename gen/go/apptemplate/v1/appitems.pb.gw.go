@@ -269,6 +269,75 @@ func local_request_AppItemsService_UpdateAppItem_0(ctx context.Context, marshale
 	return msg, metadata, err
 }
 
+func request_AppItemsService_CreateAppItems_0(ctx context.Context, marshaler runtime.Marshaler, client AppItemsServiceClient, req *http.Request, pathParams map[string]string) (proto.Message, runtime.ServerMetadata, error) {
+	var metadata runtime.ServerMetadata
+	stream, err := client.CreateAppItems(ctx)
+	if err != nil {
+		grpclog.Errorf("Failed to start streaming: %v", err)
+		return nil, metadata, err
+	}
+	dec := marshaler.NewDecoder(req.Body)
+	for {
+		var protoReq CreateAppItemsRequest
+		err = dec.Decode(&protoReq)
+		if errors.Is(err, io.EOF) {
+			break
+		}
+		if err != nil {
+			grpclog.Errorf("Failed to decode request: %v", err)
+			return nil, metadata, status.Errorf(codes.InvalidArgument, "%v", err)
+		}
+		if err = stream.Send(&protoReq); err != nil {
+			if errors.Is(err, io.EOF) {
+				break
+			}
+			grpclog.Errorf("Failed to send request: %v", err)
+			return nil, metadata, err
+		}
+	}
+	if err := stream.CloseSend(); err != nil {
+		grpclog.Errorf("Failed to terminate client stream: %v", err)
+		return nil, metadata, err
+	}
+	header, err := stream.Header()
+	if err != nil {
+		grpclog.Errorf("Failed to get header from client: %v", err)
+		return nil, metadata, err
+	}
+	metadata.HeaderMD = header
+	msg, err := stream.CloseAndRecv()
+	metadata.TrailerMD = stream.Trailer()
+	return msg, metadata, err
+}
+
+var filter_AppItemsService_WatchAppItems_0 = &utilities.DoubleArray{Encoding: map[string]int{}, Base: []int(nil), Check: []int(nil)}
+
+func request_AppItemsService_WatchAppItems_0(ctx context.Context, marshaler runtime.Marshaler, client AppItemsServiceClient, req *http.Request, pathParams map[string]string) (AppItemsService_WatchAppItemsClient, runtime.ServerMetadata, error) {
+	var (
+		protoReq WatchAppItemsRequest
+		metadata runtime.ServerMetadata
+	)
+	if req.Body != nil {
+		_, _ = io.Copy(io.Discard, req.Body)
+	}
+	if err := req.ParseForm(); err != nil {
+		return nil, metadata, status.Errorf(codes.InvalidArgument, "%v", err)
+	}
+	if err := runtime.PopulateQueryParameters(&protoReq, req.Form, filter_AppItemsService_WatchAppItems_0); err != nil {
+		return nil, metadata, status.Errorf(codes.InvalidArgument, "%v", err)
+	}
+	stream, err := client.WatchAppItems(ctx, &protoReq)
+	if err != nil {
+		return nil, metadata, err
+	}
+	header, err := stream.Header()
+	if err != nil {
+		return nil, metadata, err
+	}
+	metadata.HeaderMD = header
+	return stream, metadata, nil
+}
+
 // RegisterAppItemsServiceHandlerServer registers the http handlers for service AppItemsService to "mux".
 // UnaryRPC     :call AppItemsServiceServer directly.
 // StreamingRPC :currently unsupported pending https://github.com/grpc/grpc-go/issues/906.
@@ -395,6 +464,18 @@ func RegisterAppItemsServiceHandlerServer(ctx context.Context, mux *runtime.Serv
 		}
 		forward_AppItemsService_UpdateAppItem_0(annotatedContext, mux, outboundMarshaler, w, req, resp, mux.GetForwardResponseOptions()...)
 	})
+	mux.Handle(http.MethodPost, pattern_AppItemsService_CreateAppItems_0, func(w http.ResponseWriter, req *http.Request, pathParams map[string]string) {
+		err := status.Error(codes.Unimplemented, "streaming calls are not yet supported in the in-process transport")
+		_, outboundMarshaler := runtime.MarshalerForRequest(mux, req)
+		runtime.HTTPError(ctx, mux, outboundMarshaler, w, req, err)
+		return
+	})
+	mux.Handle(http.MethodGet, pattern_AppItemsService_WatchAppItems_0, func(w http.ResponseWriter, req *http.Request, pathParams map[string]string) {
+		err := status.Error(codes.Unimplemented, "streaming calls are not yet supported in the in-process transport")
+		_, outboundMarshaler := runtime.MarshalerForRequest(mux, req)
+		runtime.HTTPError(ctx, mux, outboundMarshaler, w, req, err)
+		return
+	})
 
 	return nil
 }
@@ -537,23 +618,61 @@ func RegisterAppItemsServiceHandlerClient(ctx context.Context, mux *runtime.Serv
 		}
 		forward_AppItemsService_UpdateAppItem_0(annotatedContext, mux, outboundMarshaler, w, req, resp, mux.GetForwardResponseOptions()...)
 	})
+	mux.Handle(http.MethodPost, pattern_AppItemsService_CreateAppItems_0, func(w http.ResponseWriter, req *http.Request, pathParams map[string]string) {
+		ctx, cancel := context.WithCancel(req.Context())
+		defer cancel()
+		inboundMarshaler, outboundMarshaler := runtime.MarshalerForRequest(mux, req)
+		annotatedContext, err := runtime.AnnotateContext(ctx, mux, req, "/apptemplate.v1.AppItemsService/CreateAppItems", runtime.WithHTTPPathPattern("/v1/appitems:bulkCreate"))
+		if err != nil {
+			runtime.HTTPError(ctx, mux, outboundMarshaler, w, req, err)
+			return
+		}
+		resp, md, err := request_AppItemsService_CreateAppItems_0(annotatedContext, inboundMarshaler, client, req, pathParams)
+		annotatedContext = runtime.NewServerMetadataContext(annotatedContext, md)
+		if err != nil {
+			runtime.HTTPError(annotatedContext, mux, outboundMarshaler, w, req, err)
+			return
+		}
+		forward_AppItemsService_CreateAppItems_0(annotatedContext, mux, outboundMarshaler, w, req, resp, mux.GetForwardResponseOptions()...)
+	})
+	mux.Handle(http.MethodGet, pattern_AppItemsService_WatchAppItems_0, func(w http.ResponseWriter, req *http.Request, pathParams map[string]string) {
+		ctx, cancel := context.WithCancel(req.Context())
+		defer cancel()
+		inboundMarshaler, outboundMarshaler := runtime.MarshalerForRequest(mux, req)
+		annotatedContext, err := runtime.AnnotateContext(ctx, mux, req, "/apptemplate.v1.AppItemsService/WatchAppItems", runtime.WithHTTPPathPattern("/v1/appitems:watch"))
+		if err != nil {
+			runtime.HTTPError(ctx, mux, outboundMarshaler, w, req, err)
+			return
+		}
+		resp, md, err := request_AppItemsService_WatchAppItems_0(annotatedContext, inboundMarshaler, client, req, pathParams)
+		annotatedContext = runtime.NewServerMetadataContext(annotatedContext, md)
+		if err != nil {
+			runtime.HTTPError(annotatedContext, mux, outboundMarshaler, w, req, err)
+			return
+		}
+		forward_AppItemsService_WatchAppItems_0(annotatedContext, mux, outboundMarshaler, w, req, func() (proto.Message, error) { return resp.Recv() }, mux.GetForwardResponseOptions()...)
+	})
 	return nil
 }
 
 var (
-	pattern_AppItemsService_CreateAppItem_0 = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, ""))
-	pattern_AppItemsService_GetAppItems_0   = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, "batchGet"))
-	pattern_AppItemsService_ListAppItems_0  = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, ""))
-	pattern_AppItemsService_GetAppItem_0    = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1, 1, 0, 4, 1, 5, 2}, []string{"v1", "appitems", "id"}, ""))
-	pattern_AppItemsService_DeleteAppItem_0 = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1, 1, 0, 4, 1, 5, 2}, []string{"v1", "appitems", "id"}, ""))
-	pattern_AppItemsService_UpdateAppItem_0 = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1, 1, 0, 4, 1, 5, 2}, []string{"v1", "appitems", "appitem.id"}, ""))
+	pattern_AppItemsService_CreateAppItem_0  = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, ""))
+	pattern_AppItemsService_GetAppItems_0    = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, "batchGet"))
+	pattern_AppItemsService_ListAppItems_0   = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, ""))
+	pattern_AppItemsService_GetAppItem_0     = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1, 1, 0, 4, 1, 5, 2}, []string{"v1", "appitems", "id"}, ""))
+	pattern_AppItemsService_DeleteAppItem_0  = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1, 1, 0, 4, 1, 5, 2}, []string{"v1", "appitems", "id"}, ""))
+	pattern_AppItemsService_UpdateAppItem_0  = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1, 1, 0, 4, 1, 5, 2}, []string{"v1", "appitems", "appitem.id"}, ""))
+	pattern_AppItemsService_CreateAppItems_0 = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, "bulkCreate"))
+	pattern_AppItemsService_WatchAppItems_0  = runtime.MustPattern(runtime.NewPattern(1, []int{2, 0, 2, 1}, []string{"v1", "appitems"}, "watch"))
 )
 
 var (
-	forward_AppItemsService_CreateAppItem_0 = runtime.ForwardResponseMessage
-	forward_AppItemsService_GetAppItems_0   = runtime.ForwardResponseMessage
-	forward_AppItemsService_ListAppItems_0  = runtime.ForwardResponseMessage
-	forward_AppItemsService_GetAppItem_0    = runtime.ForwardResponseMessage
-	forward_AppItemsService_DeleteAppItem_0 = runtime.ForwardResponseMessage
-	forward_AppItemsService_UpdateAppItem_0 = runtime.ForwardResponseMessage
+	forward_AppItemsService_CreateAppItem_0  = runtime.ForwardResponseMessage
+	forward_AppItemsService_GetAppItems_0    = runtime.ForwardResponseMessage
+	forward_AppItemsService_ListAppItems_0   = runtime.ForwardResponseMessage
+	forward_AppItemsService_GetAppItem_0     = runtime.ForwardResponseMessage
+	forward_AppItemsService_DeleteAppItem_0  = runtime.ForwardResponseMessage
+	forward_AppItemsService_UpdateAppItem_0  = runtime.ForwardResponseMessage
+	forward_AppItemsService_CreateAppItems_0 = runtime.ForwardResponseMessage
+	forward_AppItemsService_WatchAppItems_0  = runtime.ForwardResponseStream
 )
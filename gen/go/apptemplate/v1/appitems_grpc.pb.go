@@ -19,12 +19,14 @@ import (
 const _ = grpc.SupportPackageIsVersion9
 
 const (
-	AppItemsService_CreateAppItem_FullMethodName = "/apptemplate.v1.AppItemsService/CreateAppItem"
-	AppItemsService_GetAppItems_FullMethodName   = "/apptemplate.v1.AppItemsService/GetAppItems"
-	AppItemsService_ListAppItems_FullMethodName  = "/apptemplate.v1.AppItemsService/ListAppItems"
-	AppItemsService_GetAppItem_FullMethodName    = "/apptemplate.v1.AppItemsService/GetAppItem"
-	AppItemsService_DeleteAppItem_FullMethodName = "/apptemplate.v1.AppItemsService/DeleteAppItem"
-	AppItemsService_UpdateAppItem_FullMethodName = "/apptemplate.v1.AppItemsService/UpdateAppItem"
+	AppItemsService_CreateAppItem_FullMethodName  = "/apptemplate.v1.AppItemsService/CreateAppItem"
+	AppItemsService_GetAppItems_FullMethodName    = "/apptemplate.v1.AppItemsService/GetAppItems"
+	AppItemsService_ListAppItems_FullMethodName   = "/apptemplate.v1.AppItemsService/ListAppItems"
+	AppItemsService_GetAppItem_FullMethodName     = "/apptemplate.v1.AppItemsService/GetAppItem"
+	AppItemsService_DeleteAppItem_FullMethodName  = "/apptemplate.v1.AppItemsService/DeleteAppItem"
+	AppItemsService_UpdateAppItem_FullMethodName  = "/apptemplate.v1.AppItemsService/UpdateAppItem"
+	AppItemsService_CreateAppItems_FullMethodName = "/apptemplate.v1.AppItemsService/CreateAppItems"
+	AppItemsService_WatchAppItems_FullMethodName  = "/apptemplate.v1.AppItemsService/WatchAppItems"
 )
 
 // AppItemsServiceClient is the client API for AppItemsService service.
@@ -48,6 +50,14 @@ type AppItemsServiceClient interface {
 	DeleteAppItem(ctx context.Context, in *DeleteAppItemRequest, opts ...grpc.CallOption) (*DeleteAppItemResponse, error)
 	// GetAppItem returns a specific appitem with metadata
 	UpdateAppItem(ctx context.Context, in *UpdateAppItemRequest, opts ...grpc.CallOption) (*UpdateAppItemResponse, error)
+	// *
+	// Create many appitems over one stream.  Each message carries a batch of
+	// items and the single response reports the outcome of every item.
+	CreateAppItems(ctx context.Context, opts ...grpc.CallOption) (grpc.ClientStreamingClient[CreateAppItemsRequest, CreateAppItemsResponse], error)
+	// *
+	// Stream creates, updates and deletes of appitems as they happen,
+	// optionally resuming after the cursor of an earlier event.
+	WatchAppItems(ctx context.Context, in *WatchAppItemsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[AppItemEvent], error)
 }
 
 type appItemsServiceClient struct {
@@ -118,6 +128,38 @@ func (c *appItemsServiceClient) UpdateAppItem(ctx context.Context, in *UpdateApp
 	return out, nil
 }
 
+func (c *appItemsServiceClient) CreateAppItems(ctx context.Context, opts ...grpc.CallOption) (grpc.ClientStreamingClient[CreateAppItemsRequest, CreateAppItemsResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AppItemsService_ServiceDesc.Streams[0], AppItemsService_CreateAppItems_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[CreateAppItemsRequest, CreateAppItemsResponse]{ClientStream: stream}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AppItemsService_CreateAppItemsClient = grpc.ClientStreamingClient[CreateAppItemsRequest, CreateAppItemsResponse]
+
+func (c *appItemsServiceClient) WatchAppItems(ctx context.Context, in *WatchAppItemsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[AppItemEvent], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AppItemsService_ServiceDesc.Streams[1], AppItemsService_WatchAppItems_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[WatchAppItemsRequest, AppItemEvent]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AppItemsService_WatchAppItemsClient = grpc.ServerStreamingClient[AppItemEvent]
+
 // AppItemsServiceServer is the server API for AppItemsService service.
 // All implementations should embed UnimplementedAppItemsServiceServer
 // for forward compatibility.
@@ -139,6 +181,14 @@ type AppItemsServiceServer interface {
 	DeleteAppItem(context.Context, *DeleteAppItemRequest) (*DeleteAppItemResponse, error)
 	// GetAppItem returns a specific appitem with metadata
 	UpdateAppItem(context.Context, *UpdateAppItemRequest) (*UpdateAppItemResponse, error)
+	// *
+	// Create many appitems over one stream.  Each message carries a batch of
+	// items and the single response reports the outcome of every item.
+	CreateAppItems(grpc.ClientStreamingServer[CreateAppItemsRequest, CreateAppItemsResponse]) error
+	// *
+	// Stream creates, updates and deletes of appitems as they happen,
+	// optionally resuming after the cursor of an earlier event.
+	WatchAppItems(*WatchAppItemsRequest, grpc.ServerStreamingServer[AppItemEvent]) error
 }
 
 // UnimplementedAppItemsServiceServer should be embedded to have
@@ -166,6 +216,12 @@ func (UnimplementedAppItemsServiceServer) DeleteAppItem(context.Context, *Delete
 func (UnimplementedAppItemsServiceServer) UpdateAppItem(context.Context, *UpdateAppItemRequest) (*UpdateAppItemResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method UpdateAppItem not implemented")
 }
+func (UnimplementedAppItemsServiceServer) CreateAppItems(grpc.ClientStreamingServer[CreateAppItemsRequest, CreateAppItemsResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method CreateAppItems not implemented")
+}
+func (UnimplementedAppItemsServiceServer) WatchAppItems(*WatchAppItemsRequest, grpc.ServerStreamingServer[AppItemEvent]) error {
+	return status.Errorf(codes.Unimplemented, "method WatchAppItems not implemented")
+}
 func (UnimplementedAppItemsServiceServer) testEmbeddedByValue() {}
 
 // UnsafeAppItemsServiceServer may be embedded to opt out of forward compatibility for this service.
@@ -294,6 +350,24 @@ func _AppItemsService_UpdateAppItem_Handler(srv interface{}, ctx context.Context
 	return interceptor(ctx, in, info, handler)
 }
 
+func _AppItemsService_CreateAppItems_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(AppItemsServiceServer).CreateAppItems(&grpc.GenericServerStream[CreateAppItemsRequest, CreateAppItemsResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AppItemsService_CreateAppItemsServer = grpc.ClientStreamingServer[CreateAppItemsRequest, CreateAppItemsResponse]
+
+func _AppItemsService_WatchAppItems_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(WatchAppItemsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(AppItemsServiceServer).WatchAppItems(m, &grpc.GenericServerStream[WatchAppItemsRequest, AppItemEvent]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AppItemsService_WatchAppItemsServer = grpc.ServerStreamingServer[AppItemEvent]
+
 // AppItemsService_ServiceDesc is the grpc.ServiceDesc for AppItemsService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -326,6 +400,17 @@ var AppItemsService_ServiceDesc = grpc.ServiceDesc{
 			Handler:    _AppItemsService_UpdateAppItem_Handler,
 		},
 	},
-	Streams:  []grpc.StreamDesc{},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "CreateAppItems",
+			Handler:       _AppItemsService_CreateAppItems_Handler,
+			ClientStreams: true,
+		},
+		{
+			StreamName:    "WatchAppItems",
+			Handler:       _AppItemsService_WatchAppItems_Handler,
+			ServerStreams: true,
+		},
+	},
 	Metadata: "apptemplate/v1/appitems.proto",
 }
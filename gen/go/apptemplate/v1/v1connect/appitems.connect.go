@@ -51,6 +51,12 @@ const (
 	// AppItemsServiceUpdateAppItemProcedure is the fully-qualified name of the AppItemsService's
 	// UpdateAppItem RPC.
 	AppItemsServiceUpdateAppItemProcedure = "/apptemplate.v1.AppItemsService/UpdateAppItem"
+	// AppItemsServiceCreateAppItemsProcedure is the fully-qualified name of the AppItemsService's
+	// CreateAppItems RPC.
+	AppItemsServiceCreateAppItemsProcedure = "/apptemplate.v1.AppItemsService/CreateAppItems"
+	// AppItemsServiceWatchAppItemsProcedure is the fully-qualified name of the AppItemsService's
+	// WatchAppItems RPC.
+	AppItemsServiceWatchAppItemsProcedure = "/apptemplate.v1.AppItemsService/WatchAppItems"
 )
 
 // AppItemsServiceClient is a client for the apptemplate.v1.AppItemsService service.
@@ -70,6 +76,14 @@ type AppItemsServiceClient interface {
 	DeleteAppItem(context.Context, *connect.Request[v1.DeleteAppItemRequest]) (*connect.Response[v1.DeleteAppItemResponse], error)
 	// GetAppItem returns a specific appitem with metadata
 	UpdateAppItem(context.Context, *connect.Request[v1.UpdateAppItemRequest]) (*connect.Response[v1.UpdateAppItemResponse], error)
+	// *
+	// Create many appitems over one stream.  Each message carries a batch of
+	// items and the single response reports the outcome of every item.
+	CreateAppItems(context.Context) *connect.ClientStreamForClient[v1.CreateAppItemsRequest, v1.CreateAppItemsResponse]
+	// *
+	// Stream creates, updates and deletes of appitems as they happen,
+	// optionally resuming after the cursor of an earlier event.
+	WatchAppItems(context.Context, *connect.Request[v1.WatchAppItemsRequest]) (*connect.ServerStreamForClient[v1.AppItemEvent], error)
 }
 
 // NewAppItemsServiceClient constructs a client for the apptemplate.v1.AppItemsService service. By
@@ -119,17 +133,31 @@ func NewAppItemsServiceClient(httpClient connect.HTTPClient, baseURL string, opt
 			connect.WithSchema(appItemsServiceMethods.ByName("UpdateAppItem")),
 			connect.WithClientOptions(opts...),
 		),
+		createAppItems: connect.NewClient[v1.CreateAppItemsRequest, v1.CreateAppItemsResponse](
+			httpClient,
+			baseURL+AppItemsServiceCreateAppItemsProcedure,
+			connect.WithSchema(appItemsServiceMethods.ByName("CreateAppItems")),
+			connect.WithClientOptions(opts...),
+		),
+		watchAppItems: connect.NewClient[v1.WatchAppItemsRequest, v1.AppItemEvent](
+			httpClient,
+			baseURL+AppItemsServiceWatchAppItemsProcedure,
+			connect.WithSchema(appItemsServiceMethods.ByName("WatchAppItems")),
+			connect.WithClientOptions(opts...),
+		),
 	}
 }
 
 // appItemsServiceClient implements AppItemsServiceClient.
 type appItemsServiceClient struct {
-	createAppItem *connect.Client[v1.CreateAppItemRequest, v1.CreateAppItemResponse]
-	getAppItems   *connect.Client[v1.GetAppItemsRequest, v1.GetAppItemsResponse]
-	listAppItems  *connect.Client[v1.ListAppItemsRequest, v1.ListAppItemsResponse]
-	getAppItem    *connect.Client[v1.GetAppItemRequest, v1.GetAppItemResponse]
-	deleteAppItem *connect.Client[v1.DeleteAppItemRequest, v1.DeleteAppItemResponse]
-	updateAppItem *connect.Client[v1.UpdateAppItemRequest, v1.UpdateAppItemResponse]
+	createAppItem  *connect.Client[v1.CreateAppItemRequest, v1.CreateAppItemResponse]
+	getAppItems    *connect.Client[v1.GetAppItemsRequest, v1.GetAppItemsResponse]
+	listAppItems   *connect.Client[v1.ListAppItemsRequest, v1.ListAppItemsResponse]
+	getAppItem     *connect.Client[v1.GetAppItemRequest, v1.GetAppItemResponse]
+	deleteAppItem  *connect.Client[v1.DeleteAppItemRequest, v1.DeleteAppItemResponse]
+	updateAppItem  *connect.Client[v1.UpdateAppItemRequest, v1.UpdateAppItemResponse]
+	createAppItems *connect.Client[v1.CreateAppItemsRequest, v1.CreateAppItemsResponse]
+	watchAppItems  *connect.Client[v1.WatchAppItemsRequest, v1.AppItemEvent]
 }
 
 // CreateAppItem calls apptemplate.v1.AppItemsService.CreateAppItem.
@@ -162,6 +190,16 @@ func (c *appItemsServiceClient) UpdateAppItem(ctx context.Context, req *connect.
 	return c.updateAppItem.CallUnary(ctx, req)
 }
 
+// CreateAppItems calls apptemplate.v1.AppItemsService.CreateAppItems.
+func (c *appItemsServiceClient) CreateAppItems(ctx context.Context) *connect.ClientStreamForClient[v1.CreateAppItemsRequest, v1.CreateAppItemsResponse] {
+	return c.createAppItems.CallClientStream(ctx)
+}
+
+// WatchAppItems calls apptemplate.v1.AppItemsService.WatchAppItems.
+func (c *appItemsServiceClient) WatchAppItems(ctx context.Context, req *connect.Request[v1.WatchAppItemsRequest]) (*connect.ServerStreamForClient[v1.AppItemEvent], error) {
+	return c.watchAppItems.CallServerStream(ctx, req)
+}
+
 // AppItemsServiceHandler is an implementation of the apptemplate.v1.AppItemsService service.
 type AppItemsServiceHandler interface {
 	// *
@@ -179,6 +217,14 @@ type AppItemsServiceHandler interface {
 	DeleteAppItem(context.Context, *connect.Request[v1.DeleteAppItemRequest]) (*connect.Response[v1.DeleteAppItemResponse], error)
 	// GetAppItem returns a specific appitem with metadata
 	UpdateAppItem(context.Context, *connect.Request[v1.UpdateAppItemRequest]) (*connect.Response[v1.UpdateAppItemResponse], error)
+	// *
+	// Create many appitems over one stream.  Each message carries a batch of
+	// items and the single response reports the outcome of every item.
+	CreateAppItems(context.Context, *connect.ClientStream[v1.CreateAppItemsRequest]) (*connect.Response[v1.CreateAppItemsResponse], error)
+	// *
+	// Stream creates, updates and deletes of appitems as they happen,
+	// optionally resuming after the cursor of an earlier event.
+	WatchAppItems(context.Context, *connect.Request[v1.WatchAppItemsRequest], *connect.ServerStream[v1.AppItemEvent]) error
 }
 
 // NewAppItemsServiceHandler builds an HTTP handler from the service implementation. It returns the
@@ -224,6 +270,18 @@ func NewAppItemsServiceHandler(svc AppItemsServiceHandler, opts ...connect.Handl
 		connect.WithSchema(appItemsServiceMethods.ByName("UpdateAppItem")),
 		connect.WithHandlerOptions(opts...),
 	)
+	appItemsServiceCreateAppItemsHandler := connect.NewClientStreamHandler(
+		AppItemsServiceCreateAppItemsProcedure,
+		svc.CreateAppItems,
+		connect.WithSchema(appItemsServiceMethods.ByName("CreateAppItems")),
+		connect.WithHandlerOptions(opts...),
+	)
+	appItemsServiceWatchAppItemsHandler := connect.NewServerStreamHandler(
+		AppItemsServiceWatchAppItemsProcedure,
+		svc.WatchAppItems,
+		connect.WithSchema(appItemsServiceMethods.ByName("WatchAppItems")),
+		connect.WithHandlerOptions(opts...),
+	)
 	return "/apptemplate.v1.AppItemsService/", http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
 		switch r.URL.Path {
 		case AppItemsServiceCreateAppItemProcedure:
@@ -238,6 +296,10 @@ func NewAppItemsServiceHandler(svc AppItemsServiceHandler, opts ...connect.Handl
 			appItemsServiceDeleteAppItemHandler.ServeHTTP(w, r)
 		case AppItemsServiceUpdateAppItemProcedure:
 			appItemsServiceUpdateAppItemHandler.ServeHTTP(w, r)
+		case AppItemsServiceCreateAppItemsProcedure:
+			appItemsServiceCreateAppItemsHandler.ServeHTTP(w, r)
+		case AppItemsServiceWatchAppItemsProcedure:
+			appItemsServiceWatchAppItemsHandler.ServeHTTP(w, r)
 		default:
 			http.NotFound(w, r)
 		}
@@ -270,3 +332,11 @@ func (UnimplementedAppItemsServiceHandler) DeleteAppItem(context.Context, *conne
 func (UnimplementedAppItemsServiceHandler) UpdateAppItem(context.Context, *connect.Request[v1.UpdateAppItemRequest]) (*connect.Response[v1.UpdateAppItemResponse], error) {
 	return nil, connect.NewError(connect.CodeUnimplemented, errors.New("apptemplate.v1.AppItemsService.UpdateAppItem is not implemented"))
 }
+
+func (UnimplementedAppItemsServiceHandler) CreateAppItems(context.Context, *connect.ClientStream[v1.CreateAppItemsRequest]) (*connect.Response[v1.CreateAppItemsResponse], error) {
+	return nil, connect.NewError(connect.CodeUnimplemented, errors.New("apptemplate.v1.AppItemsService.CreateAppItems is not implemented"))
+}
+
+func (UnimplementedAppItemsServiceHandler) WatchAppItems(context.Context, *connect.Request[v1.WatchAppItemsRequest], *connect.ServerStream[v1.AppItemEvent]) error {
+	return connect.NewError(connect.CodeUnimplemented, errors.New("apptemplate.v1.AppItemsService.WatchAppItems is not implemented"))
+}
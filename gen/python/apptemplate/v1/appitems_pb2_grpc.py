@@ -45,6 +45,16 @@ class AppItemsServiceStub(object):
                 request_serializer=apptemplate_dot_v1_dot_appitems__pb2.UpdateAppItemRequest.SerializeToString,
                 response_deserializer=apptemplate_dot_v1_dot_appitems__pb2.UpdateAppItemResponse.FromString,
                 _registered_method=True)
+        self.CreateAppItems = channel.stream_unary(
+                '/apptemplate.v1.AppItemsService/CreateAppItems',
+                request_serializer=apptemplate_dot_v1_dot_appitems__pb2.CreateAppItemsRequest.SerializeToString,
+                response_deserializer=apptemplate_dot_v1_dot_appitems__pb2.CreateAppItemsResponse.FromString,
+                _registered_method=True)
+        self.WatchAppItems = channel.unary_stream(
+                '/apptemplate.v1.AppItemsService/WatchAppItems',
+                request_serializer=apptemplate_dot_v1_dot_appitems__pb2.WatchAppItemsRequest.SerializeToString,
+                response_deserializer=apptemplate_dot_v1_dot_appitems__pb2.AppItemEvent.FromString,
+                _registered_method=True)
 
 
 class AppItemsServiceServicer(object):
@@ -96,6 +106,24 @@ class AppItemsServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateAppItems(self, request_iterator, context):
+        """*
+        Create many appitems over one stream.  Each message carries a batch of
+        items and the single response reports the outcome of every item.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchAppItems(self, request, context):
+        """*
+        Stream creates, updates and deletes of appitems as they happen,
+        optionally resuming after the cursor of an earlier event.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AppItemsServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -129,6 +157,16 @@ def add_AppItemsServiceServicer_to_server(servicer, server):
                     request_deserializer=apptemplate_dot_v1_dot_appitems__pb2.UpdateAppItemRequest.FromString,
                     response_serializer=apptemplate_dot_v1_dot_appitems__pb2.UpdateAppItemResponse.SerializeToString,
             ),
+            'CreateAppItems': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateAppItems,
+                    request_deserializer=apptemplate_dot_v1_dot_appitems__pb2.CreateAppItemsRequest.FromString,
+                    response_serializer=apptemplate_dot_v1_dot_appitems__pb2.CreateAppItemsResponse.SerializeToString,
+            ),
+            'WatchAppItems': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchAppItems,
+                    request_deserializer=apptemplate_dot_v1_dot_appitems__pb2.WatchAppItemsRequest.FromString,
+                    response_serializer=apptemplate_dot_v1_dot_appitems__pb2.AppItemEvent.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'apptemplate.v1.AppItemsService', rpc_method_handlers)
@@ -302,3 +340,57 @@ class AppItemsService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def CreateAppItems(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/apptemplate.v1.AppItemsService/CreateAppItems',
+            apptemplate_dot_v1_dot_appitems__pb2.CreateAppItemsRequest.SerializeToString,
+            apptemplate_dot_v1_dot_appitems__pb2.CreateAppItemsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchAppItems(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/apptemplate.v1.AppItemsService/WatchAppItems',
+            apptemplate_dot_v1_dot_appitems__pb2.WatchAppItemsRequest.SerializeToString,
+            apptemplate_dot_v1_dot_appitems__pb2.AppItemEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
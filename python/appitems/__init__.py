@@ -0,0 +1,21 @@
+"""
+Python tooling for the AppItemsService.
+
+Builds on the generated stubs in gen/python.  When this package is used from
+a checkout (rather than an installed wheel) the generated package is added to
+the import path so `apptemplate.v1` resolves without extra setup.
+
+Submodules are intentionally not imported here so that importing `appitems`
+stays cheap - pull in only what you need, eg:
+
+    from appitems.server import start_local_server
+    from appitems.loadgen import LoadConfig, run_load
+"""
+
+import os
+import sys
+
+# os.path rather than pathlib: this runs on every import and pathlib is slow to import
+_GEN_PYTHON = os.path.normpath(os.path.join(os.path.realpath(__file__), '..', '..', '..', 'gen', 'python'))
+if os.path.isdir(_GEN_PYTHON) and _GEN_PYTHON not in sys.path:
+    sys.path.append(_GEN_PYTHON)
@@ -0,0 +1,174 @@
+"""
+Auto-chunked, parallel GetAppItems for very large id sets.
+
+A single GetAppItems call with 100k ids produces a huge request and an even
+larger map response that runs into message size limits.  `iter_app_items`
+splits any id iterable into batches that fit a byte budget, keeps up to
+`max_in_flight` batches running and yields items as each batch returns:
+
+    for item_id, item in iter_app_items(stub, ids):
+        ...
+
+    items = get_app_items(stub, ids)    # the complete map
+
+Batch size is bounded by the request budget (ids are cheap) and by the
+response budget divided by the average item size, which starts at an
+estimate and tracks the sizes actually seen.  Only failed batches are
+retried: transient errors are retried with backoff, RESOURCE_EXHAUSTED
+(message too large) splits the batch in half.  Requests above
+`compress_over` bytes are sent gzip compressed.
+"""
+
+import queue
+import random
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+RETRYABLE_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.ABORTED)
+
+# Stay under gRPC's default 4MB receive limit
+DEFAULT_MAX_RESPONSE_BYTES = 3 * 1024 * 1024
+DEFAULT_MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class BatchGetError(Exception):
+    """Some batches failed after all retries; `partial` holds everything that did succeed"""
+
+    def __init__(self, failed: Dict[str, grpc.RpcError], partial: Optional[Dict[str, models_pb2.AppItem]] = None):
+        codes = sorted({e.code().name for e in failed.values()})
+        super().__init__(f"{len(failed)} ids failed ({', '.join(codes)})")
+        self.failed = failed
+        self.partial = partial or {}
+
+
+def id_request_bytes(item_id: str) -> int:
+    """Bytes one id adds to a GetAppItemsRequest (tag + length varint + utf-8)"""
+    size = len(item_id.encode('utf-8'))
+    return 1 + (size.bit_length() + 6) // 7 + size if size else 2
+
+
+class _Chunker:
+    """Pulls unique ids off an iterable into batches that fit the byte budgets"""
+
+    def __init__(self, ids: Iterable[str], max_request_bytes: int, max_response_bytes: int,
+                 item_bytes_estimate: int, max_ids: int):
+        self.ids = iter(ids)
+        self.seen = set()
+        self.max_request_bytes = max_request_bytes
+        self.max_response_bytes = max_response_bytes
+        self.item_bytes = float(item_bytes_estimate)
+        self.max_ids = max_ids
+        self.exhausted = False
+
+    def observe(self, items: int, response_bytes: int):
+        """Track the average item size seen in responses (EWMA)"""
+        if items:
+            self.item_bytes = 0.7 * self.item_bytes + 0.3 * (response_bytes / items)
+
+    def next(self) -> List[str]:
+        limit = max(1, min(self.max_ids, int(self.max_response_bytes / max(self.item_bytes, 1.0))))
+        chunk, request_bytes = [], 0
+        for item_id in self.ids:
+            if item_id in self.seen:
+                continue
+            self.seen.add(item_id)
+            chunk.append(item_id)
+            request_bytes += id_request_bytes(item_id)
+            if len(chunk) >= limit or request_bytes >= self.max_request_bytes:
+                return chunk
+        self.exhausted = True
+        return chunk
+
+
+def iter_app_items(stub: appitems_pb2_grpc.AppItemsServiceStub, ids: Iterable[str], max_in_flight: int = 8,
+                   max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES,
+                   max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES, item_bytes_estimate: int = 2048,
+                   max_ids: int = 10000, max_attempts: int = 4, backoff: float = 0.1,
+                   timeout: Optional[float] = 30.0, compress_over: Optional[int] = 64 * 1024,
+                   metadata=None) -> Iterator[Tuple[str, models_pb2.AppItem]]:
+    """Yield (id, AppItem) for every id that exists, as batches complete.
+
+    Ids that do not exist are simply absent (as with GetAppItems).  If some
+    batches still fail after `max_attempts`, BatchGetError is raised once
+    everything else has been yielded.
+    """
+    chunker = _Chunker(ids, max_request_bytes, max_response_bytes, item_bytes_estimate, max_ids)
+    done: queue.Queue = queue.Queue()
+    retries: List[Tuple[float, List[str], int]] = []  # (not_before, chunk, attempt)
+    failed: Dict[str, grpc.RpcError] = {}
+    in_flight = 0
+
+    def launch(chunk: List[str], attempt: int):
+        request = appitems_pb2.GetAppItemsRequest(ids=chunk)
+        compression = None
+        if compress_over is not None and request.ByteSize() >= compress_over:
+            compression = grpc.Compression.Gzip
+        future = stub.GetAppItems.future(request, timeout=timeout, metadata=metadata, compression=compression)
+        future.add_done_callback(lambda f: done.put((chunk, attempt, f)))
+
+    while True:
+        now = time.monotonic()
+        while in_flight < max_in_flight:
+            due = [r for r in retries if r[0] <= now]
+            if due:
+                retries.remove(due[0])
+                launch(due[0][1], due[0][2])
+            elif not chunker.exhausted:
+                chunk = chunker.next()
+                if not chunk:
+                    continue
+                launch(chunk, 1)
+            else:
+                break
+            in_flight += 1
+        if in_flight == 0:
+            if not retries:
+                break
+            time.sleep(max(min(r[0] for r in retries) - time.monotonic(), 0))
+            continue
+
+        wait = None
+        if retries:
+            wait = max(min(r[0] for r in retries) - time.monotonic(), 0.001)
+        try:
+            chunk, attempt, future = done.get(timeout=wait)
+        except queue.Empty:
+            continue
+        in_flight -= 1
+        try:
+            resp = future.result()
+        except grpc.RpcError as e:
+            code = e.code()
+            if code == grpc.StatusCode.RESOURCE_EXHAUSTED and len(chunk) > 1:
+                # Too big for the message limit - shrink future batches and split this one
+                chunker.item_bytes *= 2
+                half = len(chunk) // 2
+                retries.append((time.monotonic(), chunk[:half], attempt))
+                retries.append((time.monotonic(), chunk[half:], attempt))
+            elif code in RETRYABLE_CODES and attempt < max_attempts:
+                delay = backoff * (2 ** (attempt - 1)) * (0.5 + random.random())
+                retries.append((time.monotonic() + delay, chunk, attempt + 1))
+            else:
+                failed.update((item_id, e) for item_id in chunk)
+            continue
+        chunker.observe(len(resp.appitems), resp.ByteSize())
+        yield from resp.appitems.items()
+
+    if failed:
+        raise BatchGetError(failed)
+
+
+def get_app_items(stub: appitems_pb2_grpc.AppItemsServiceStub, ids: Iterable[str], **kwargs) -> Dict[str, models_pb2.AppItem]:
+    """Complete id -> AppItem map (see iter_app_items for options)"""
+    result: Dict[str, models_pb2.AppItem] = {}
+    try:
+        for item_id, item in iter_app_items(stub, ids, **kwargs):
+            result[item_id] = item
+    except BatchGetError as e:
+        e.partial = result
+        raise
+    return result
@@ -0,0 +1,144 @@
+"""
+Client-side AppItem cache revalidated with conditional reads.
+
+Items younger than `ttl` are served from memory.  Older ones are
+revalidated by sending the cached version: the server answers "not
+modified" without the item when it is unchanged, so the revalidation costs
+a small request and response instead of a full fetch and parse:
+
+    cache = AppItemCache(AppItemsServiceStub(channel), max_items=10000, ttl=5)
+    item = cache.get('some-id')                 # GetAppItem with version=
+    items = cache.get_many(ids)                 # one GetAppItems with versions={...}
+    cache.stats                                 # {'hit': .., 'not_modified': .., 'fetched': .., 'missing': ..}
+
+With `ttl=0` every read revalidates, which still avoids the payload for
+unchanged items.  Entries are evicted least recently used first.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple, Optional
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.metrics import MetricsRegistry
+
+RESULTS = ('hit', 'not_modified', 'fetched', 'missing')
+
+
+class CacheEntry(NamedTuple):
+    item: models_pb2.AppItem
+    version: str
+    validated_at: float
+
+
+class AppItemCache:
+    """LRU cache of AppItems in front of a stub (or any object with GetAppItem/GetAppItems)"""
+
+    def __init__(self, stub, max_items: int = 10000, ttl: float = 5.0, timeout: Optional[float] = None,
+                 metadata=None, registry: Optional[MetricsRegistry] = None):
+        self.stub = stub
+        self.max_items = max_items
+        self.ttl = ttl
+        self.timeout = timeout
+        self.metadata = metadata
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.lock = threading.Lock()
+        self.entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self.stats: Dict[str, int] = dict.fromkeys(RESULTS, 0)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.entries
+
+    def invalidate(self, item_id: Optional[str] = None):
+        """Drop one entry, or every entry"""
+        with self.lock:
+            if item_id is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(item_id, None)
+
+    def get(self, item_id: str) -> models_pb2.AppItem:
+        """The item, from the cache while fresh.  Raises the RpcError (eg NOT_FOUND) of a failed read"""
+        entry = self._lookup(item_id)
+        if entry is not None and self._fresh(entry):
+            self._count('hit')
+            return entry.item
+        request = appitems_pb2.GetAppItemRequest(id=item_id, version=entry.version if entry else '')
+        try:
+            resp = self.stub.GetAppItem(request, timeout=self.timeout, metadata=self.metadata)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                self.invalidate(item_id)
+                self._count('missing')
+            raise
+        if resp.not_modified and entry is not None:
+            self._count('not_modified')
+            return self._store(item_id, entry.item, resp.version or entry.version)
+        self._count('fetched')
+        return self._store(item_id, resp.appitem, resp.version)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, models_pb2.AppItem]:
+        """Items by id (missing ids are absent), revalidating everything stale in one GetAppItems"""
+        result: Dict[str, models_pb2.AppItem] = {}
+        stale: Dict[str, Optional[CacheEntry]] = {}
+        for item_id in ids:
+            if item_id in result or item_id in stale:
+                continue
+            entry = self._lookup(item_id)
+            if entry is not None and self._fresh(entry):
+                self._count('hit')
+                result[item_id] = entry.item
+            else:
+                stale[item_id] = entry
+        if not stale:
+            return result
+
+        request = appitems_pb2.GetAppItemsRequest(ids=list(stale))
+        for item_id, entry in stale.items():
+            if entry is not None:
+                request.versions[item_id] = entry.version
+        resp = self.stub.GetAppItems(request, timeout=self.timeout, metadata=self.metadata)
+        not_modified = set(resp.not_modified_ids)
+        for item_id, entry in stale.items():
+            version = resp.versions.get(item_id, '')
+            if item_id in resp.appitems:
+                self._count('fetched')
+                result[item_id] = self._store(item_id, resp.appitems[item_id], version)
+            elif item_id in not_modified and entry is not None:
+                self._count('not_modified')
+                result[item_id] = self._store(item_id, entry.item, version or entry.version)
+            else:
+                self.invalidate(item_id)
+                self._count('missing')
+        return result
+
+    def _lookup(self, item_id: str) -> Optional[CacheEntry]:
+        with self.lock:
+            entry = self.entries.get(item_id)
+            if entry is not None:
+                self.entries.move_to_end(item_id)
+            return entry
+
+    def _fresh(self, entry: CacheEntry) -> bool:
+        return time.monotonic() - entry.validated_at < self.ttl
+
+    def _store(self, item_id: str, item: models_pb2.AppItem, version: str) -> models_pb2.AppItem:
+        with self.lock:
+            self.entries[item_id] = CacheEntry(item, version, time.monotonic())
+            self.entries.move_to_end(item_id)
+            while len(self.entries) > self.max_items:
+                self.entries.popitem(last=False)
+        return item
+
+    def _count(self, result: str):
+        with self.lock:
+            self.stats[result] += 1
+        self.registry.increment('appitems_cache_reads_total', {'result': result},
+                                help_text='AppItem cache reads by outcome')
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Columnar NumPy conversion of AppItem streams for analytics.
+
+Turns a stream of AppItem messages into column arrays instead of one Python
+object per item and per Timestamp:
+
+    id, name          utf-8 bytes + int64 offsets (StringColumn)
+    created_at        int64 epoch nanoseconds
+    updated_at        int64 epoch nanoseconds
+    difficulty        int32 codes into a dictionary of distinct values
+    tags              int64 offsets + int32 codes into a tag dictionary
+
+Rows are buffered into fixed size chunks that are converted to arrays in one
+go, so the Python-side working set is bounded by the chunk size.
+
+What this saves is the objects kept, not the objects built.  Rows given as
+AppItem messages are read through their fields, so a Timestamp object is
+still made per time field and row.  Rows given as appitems.lazy views
+(LazyAppItemsStub pages) fill the columns straight from the wire bytes
+without any message objects.  That is ~1.8x faster on the pure-Python
+protobuf backend.  On upb (the default) decoding into messages in C is
+~3.5x faster than reading the bytes in Python.  LazyAppItemsStub only
+returns views where they win, so there this module changes just the layout.  Columns
+are saved as one .npy file each and can be memory-mapped back without
+copying:
+
+    cols = to_columns(iter_catalog(stub))
+    cols.save('appitems.cols')
+    cols = AppItemColumns.load('appitems.cols')   # np.load(mmap_mode='r')
+
+Needs numpy.
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('appitems.columnar needs numpy: pip install numpy') from None
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.lazy import AppItemView, GetAppItemsView, ListAppItemsView
+
+FORMAT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def iter_response_items(responses: Iterable) -> Iterator[models_pb2.AppItem]:
+    """AppItems out of ListAppItemsResponse / GetAppItemsResponse messages (or their lazy views)"""
+    for resp in responses:
+        if isinstance(resp, (appitems_pb2.ListAppItemsResponse, ListAppItemsView)):
+            yield from resp.items
+        elif isinstance(resp, appitems_pb2.GetAppItemsResponse):
+            yield from resp.appitems.values()
+        elif isinstance(resp, GetAppItemsView):
+            yield from resp.values()
+        else:
+            yield resp
+
+
+class StringColumn:
+    """Variable length strings as a utf-8 byte buffer plus n+1 offsets"""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return bytes(self.data[start:end]).decode('utf-8')
+
+    def tolist(self) -> List[str]:
+        return [self[i] for i in range(len(self))]
+
+    @classmethod
+    def from_strings(cls, values: List[str]) -> 'StringColumn':
+        encoded = [v.encode('utf-8') for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        return cls(offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+    @classmethod
+    def concat(cls, parts: List['StringColumn']) -> 'StringColumn':
+        if not parts:
+            return cls.from_strings([])
+        offsets = [parts[0].offsets]
+        base = parts[0].offsets[-1]
+        for part in parts[1:]:
+            offsets.append(part.offsets[1:] + base)
+            base += part.offsets[-1]
+        return cls(np.concatenate(offsets), np.concatenate([p.data for p in parts]))
+
+
+class AppItemColumns:
+    """Column arrays for a batch of AppItems"""
+
+    STRING_COLUMNS = ('id', 'name', 'difficulty_dict', 'tag_dict')
+    ARRAY_COLUMNS = ('created_at', 'updated_at', 'difficulty', 'tag_offsets', 'tag_values')
+
+    def __init__(self, id: StringColumn, name: StringColumn, created_at: np.ndarray, updated_at: np.ndarray,
+                 difficulty: np.ndarray, difficulty_dict: StringColumn, tag_offsets: np.ndarray,
+                 tag_values: np.ndarray, tag_dict: StringColumn):
+        self.id = id
+        self.name = name
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.difficulty = difficulty
+        self.difficulty_dict = difficulty_dict
+        self.tag_offsets = tag_offsets
+        self.tag_values = tag_values
+        self.tag_dict = tag_dict
+
+    def __len__(self):
+        return len(self.created_at)
+
+    def tags_of(self, row: int) -> List[str]:
+        codes = self.tag_values[self.tag_offsets[row]:self.tag_offsets[row + 1]]
+        return [self.tag_dict[int(code)] for code in codes]
+
+    def difficulty_of(self, row: int) -> str:
+        return self.difficulty_dict[int(self.difficulty[row])]
+
+    def save(self, directory: str):
+        """Write one .npy file per array plus a small meta.json"""
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAY_COLUMNS:
+            np.save(os.path.join(directory, f'{name}.npy'), getattr(self, name))
+        for name in self.STRING_COLUMNS:
+            column = getattr(self, name)
+            np.save(os.path.join(directory, f'{name}.offsets.npy'), column.offsets)
+            np.save(os.path.join(directory, f'{name}.data.npy'), column.data)
+        with open(os.path.join(directory, 'meta.json'), 'w') as f:
+            json.dump({'version': FORMAT_VERSION, 'rows': len(self)}, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'AppItemColumns':
+        """Load columns saved with save(), memory-mapped read-only by default"""
+        mode = 'r' if mmap else None
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported column format version: {meta.get('version')}")
+
+        def load_array(name):
+            return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mode)
+
+        kwargs = {name: load_array(name) for name in cls.ARRAY_COLUMNS}
+        for name in cls.STRING_COLUMNS:
+            kwargs[name] = StringColumn(load_array(f'{name}.offsets'), load_array(f'{name}.data'))
+        return cls(**kwargs)
+
+
+class ColumnBuilder:
+    """Accumulates AppItems and converts them to columns chunk by chunk"""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.difficulty_codes: Dict[str, int] = {}
+        self.tag_codes: Dict[str, int] = {}
+        self.chunks: List[dict] = []
+        self._reset_rows()
+
+    def _reset_rows(self):
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.created: List[int] = []
+        self.updated: List[int] = []
+        self.difficulties: List[int] = []
+        self.tag_counts: List[int] = []
+        self.tags: List[int] = []
+
+    def add(self, item: Union[models_pb2.AppItem, AppItemView]):
+        self.ids.append(item.id)
+        self.names.append(item.name)
+        if isinstance(item, AppItemView):
+            # Read from the wire bytes, without Timestamp objects
+            self.created.append(item.created_at_ns)
+            self.updated.append(item.updated_at_ns)
+        else:
+            created, updated = item.created_at, item.updated_at
+            self.created.append(created.seconds * 1_000_000_000 + created.nanos)
+            self.updated.append(updated.seconds * 1_000_000_000 + updated.nanos)
+        codes = self.difficulty_codes
+        self.difficulties.append(codes.setdefault(item.difficulty, len(codes)))
+        tag_codes = self.tag_codes
+        tags = item.tags
+        self.tag_counts.append(len(tags))
+        self.tags.extend(tag_codes.setdefault(tag, len(tag_codes)) for tag in tags)
+        if len(self.ids) >= self.chunk_size:
+            self.flush()
+
+    def extend(self, items: Iterable[Union[models_pb2.AppItem, AppItemView]]) -> 'ColumnBuilder':
+        for item in items:
+            self.add(item)
+        return self
+
+    def flush(self):
+        """Convert buffered rows into arrays"""
+        if not self.ids:
+            return
+        self.chunks.append({
+            'id': StringColumn.from_strings(self.ids),
+            'name': StringColumn.from_strings(self.names),
+            'created_at': np.array(self.created, dtype=np.int64),
+            'updated_at': np.array(self.updated, dtype=np.int64),
+            'difficulty': np.array(self.difficulties, dtype=np.int32),
+            'tag_counts': np.array(self.tag_counts, dtype=np.int64),
+            'tag_values': np.array(self.tags, dtype=np.int32),
+        })
+        self._reset_rows()
+
+    def finish(self) -> AppItemColumns:
+        self.flush()
+        chunks = self.chunks
+
+        def concat(name, dtype):
+            return np.concatenate([c[name] for c in chunks]) if chunks else np.zeros(0, dtype=dtype)
+
+        tag_counts = concat('tag_counts', np.int64)
+        tag_offsets = np.zeros(len(tag_counts) + 1, dtype=np.int64)
+        np.cumsum(tag_counts, out=tag_offsets[1:])
+        return AppItemColumns(
+            id=StringColumn.concat([c['id'] for c in chunks]),
+            name=StringColumn.concat([c['name'] for c in chunks]),
+            created_at=concat('created_at', np.int64),
+            updated_at=concat('updated_at', np.int64),
+            difficulty=concat('difficulty', np.int32),
+            difficulty_dict=StringColumn.from_strings(list(self.difficulty_codes)),
+            tag_offsets=tag_offsets,
+            tag_values=concat('tag_values', np.int32),
+            tag_dict=StringColumn.from_strings(list(self.tag_codes)),
+        )
+
+
+def to_columns(items: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AppItemColumns:
+    """Columns for a stream of AppItems or AppItemViews (or List/GetAppItems responses or views)"""
+    return ColumnBuilder(chunk_size).extend(iter_response_items(items)).finish()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert AppItems to memory-mappable .npy columns')
+    parser.add_argument('output', help='Directory to write the columns to')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--target', help='host:port of an AppItemsService to page through')
+    source.add_argument('--from-file', help='File written by appitems.export (.pb/.ndjson, optionally .gz/.zst)')
+    parser.add_argument('--page-size', type=int, default=500, help='ListAppItems page size')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows converted per chunk')
+    args = parser.parse_args()
+
+    from appitems.export import iter_catalog, read_items
+
+    started = time.perf_counter()
+    channel = None
+    if args.target:
+        import grpc
+        from appitems.lazy import LazyAppItemsStub
+        channel = grpc.insecure_channel(args.target)
+        # Pages arrive as views where reading the bytes beats decoding them
+        items = iter_catalog(LazyAppItemsStub(channel), page_size=args.page_size)
+    else:
+        items = read_items(args.from_file)
+    try:
+        columns = to_columns(items, chunk_size=args.chunk_size)
+    finally:
+        if channel is not None:
+            channel.close()
+    columns.save(args.output)
+    seconds = time.perf_counter() - started
+    print(json.dumps({
+        'output': args.output,
+        'rows': len(columns),
+        'distinct_tags': len(columns.tag_dict),
+        'seconds': round(seconds, 3),
+        'rows_per_sec': round(len(columns) / seconds, 1) if seconds > 0 else 0.0,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Streaming bulk export and import of the AppItem catalog.
+
+Export streams a consistent snapshot of the catalog from
+WatchAppItems(send_initial=True) and writes each item to disk as it
+arrives, so memory use stays bounded no matter how large the catalog is.
+ListAppItems pages are ordered by updated_at, so an item updated while an
+export pages through them would move behind the page key and be missed.
+Against servers without WatchAppItems the export falls back to paging
+anyway, and reports the file as not consistent.  Import reads the file back
+one record at a time and replays it through CreateAppItem with a bounded
+number of calls in flight.
+
+Files do not record owners.  An export therefore refuses items owned by
+anyone but `owner_id` (everything unowned by default), and import creates
+the items for the owner it is given:
+
+    python -m appitems.export export --owner-id alice alice.pb
+    python -m appitems.export import --owner-id alice alice.pb
+
+Formats:
+    pb      length-delimited protobuf (varint size prefix + AppItem bytes,
+            the same framing as Java's writeDelimitedTo)
+    ndjson  one JSON object per line (proto field names)
+
+Compression (inferred from the extension unless given): none, gzip (.gz) or
+zstd (.zst, needs the `zstandard` package).
+
+Usage:
+    python -m appitems.export export --target localhost:9090 catalog.pb.zst
+    python -m appitems.export import --target localhost:9090 catalog.pb.zst
+    python -m appitems.export export --target local --seed-items 10000 catalog.ndjson.gz
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import threading
+import time
+from typing import BinaryIO, Iterator, Optional
+
+import grpc
+from google.protobuf import json_format
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+FORMATS = ('pb', 'ndjson')
+COMPRESSIONS = ('none', 'gzip', 'zstd')
+
+_READ_CHUNK = 1 << 16
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError('zstd compression needs the zstandard package: pip install zstandard') from None
+    return zstandard
+
+
+def detect_format(path: str) -> str:
+    """Infer 'pb' or 'ndjson' from a path like catalog.ndjson.gz"""
+    stem = path
+    for ext in ('.gz', '.zst'):
+        if stem.endswith(ext):
+            stem = stem[:-len(ext)]
+    return 'ndjson' if stem.endswith(('.ndjson', '.jsonl', '.json')) else 'pb'
+
+
+def detect_compression(path: str) -> str:
+    if path.endswith('.gz'):
+        return 'gzip'
+    if path.endswith('.zst'):
+        return 'zstd'
+    return 'none'
+
+
+def encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def open_output(path: str, compression: str, level: Optional[int] = None) -> BinaryIO:
+    raw = open(path, 'wb')
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=level or 6)
+    if compression == 'zstd':
+        return _zstd().ZstdCompressor(level=level or 3).stream_writer(raw, closefd=True)
+    return raw
+
+
+def open_input(path: str, compression: str) -> BinaryIO:
+    raw = open(path, 'rb')
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+    if compression == 'zstd':
+        return io.BufferedReader(_zstd().ZstdDecompressor().stream_reader(raw, closefd=True), _READ_CHUNK)
+    return raw
+
+
+class ItemWriter:
+    """Writes AppItems to a (possibly compressed) file one at a time"""
+
+    def __init__(self, path: str, fmt: Optional[str] = None, compression: Optional[str] = None,
+                 level: Optional[int] = None):
+        self.path = path
+        self.format = fmt or detect_format(path)
+        self.compression = compression or detect_compression(path)
+        if self.format not in FORMATS:
+            raise ValueError(f'Unknown format: {self.format}')
+        self.stream = open_output(path, self.compression, level)
+        self.count = 0
+
+    def write(self, item: models_pb2.AppItem):
+        if self.format == 'pb':
+            data = item.SerializeToString()
+            self.stream.write(encode_varint(len(data)))
+            self.stream.write(data)
+        else:
+            record = json_format.MessageToDict(item, preserving_proto_field_name=True)
+            self.stream.write(json.dumps(record, separators=(',', ':')).encode('utf-8'))
+            self.stream.write(b'\n')
+        self.count += 1
+
+    def close(self):
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _iter_delimited(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield the payloads of a varint length-delimited stream, reading in chunks"""
+    buf, pos = b'', 0
+
+    def fill(needed: int) -> bool:
+        nonlocal buf, pos
+        while len(buf) - pos < needed:
+            chunk = stream.read(max(needed - (len(buf) - pos), _READ_CHUNK))
+            if not chunk:
+                return False
+            buf, pos = buf[pos:] + chunk, 0
+        return True
+
+    while fill(1):
+        size, shift = 0, 0
+        while True:
+            if not fill(1):
+                raise ValueError('Truncated length prefix at end of stream')
+            byte = buf[pos]
+            pos += 1
+            size |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+            shift += 7
+        if not fill(size):
+            raise ValueError('Truncated record at end of stream')
+        yield buf[pos:pos + size]
+        pos += size
+
+
+def read_items(path: str, fmt: Optional[str] = None, compression: Optional[str] = None,
+               skip: int = 0) -> Iterator[models_pb2.AppItem]:
+    """Stream AppItems back out of a file written by ItemWriter, after the first `skip` records (not parsed)"""
+    fmt = fmt or detect_format(path)
+    compression = compression or detect_compression(path)
+    stream = open_input(path, compression)
+    try:
+        if fmt == 'pb':
+            for data in _iter_delimited(stream):
+                if skip > 0:
+                    skip -= 1
+                    continue
+                yield models_pb2.AppItem.FromString(data)
+        else:
+            for line in stream:
+                if line.strip():
+                    if skip > 0:
+                        skip -= 1
+                        continue
+                    yield json_format.ParseDict(json.loads(line), models_pb2.AppItem())
+    finally:
+        stream.close()
+
+
+class MixedOwners(ValueError):
+    """An export met items of an owner the file cannot record"""
+
+
+def iter_snapshot(stub: appitems_pb2_grpc.AppItemsServiceStub, owner_id: str = '',
+                  timeout: Optional[float] = None) -> Iterator[models_pb2.AppItem]:
+    """Every AppItem (of `owner_id` if given) as of one instant, from WatchAppItems(send_initial=True).
+
+    Raises MixedOwners on an item owned by anyone else, eg an owned item
+    when `owner_id` is empty.
+    """
+    call = stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest(send_initial=True, owner_id=owner_id),
+                              timeout=timeout)
+    try:
+        for event in call:
+            # Initial items carry no cursor; changes since the snapshot (then SYNCED) follow them
+            if event.cursor or event.type == appitems_pb2.AppItemEvent.TYPE_SYNCED:
+                return
+            if event.owner_id != owner_id:
+                raise MixedOwners(f'AppItem {event.id} belongs to {event.owner_id!r}, export each owner '
+                                  'with --owner-id and import it with the same --owner-id')
+            yield event.appitem
+    finally:
+        call.cancel()
+
+
+def iter_catalog(stub: appitems_pb2_grpc.AppItemsServiceStub, page_size: int = 500, owner_id: str = '',
+                 timeout: Optional[float] = 30.0) -> Iterator[models_pb2.AppItem]:
+    """Every AppItem via ListAppItems page keys, one page held at a time.
+
+    Pages follow updated_at, so items updated meanwhile can be missed; use
+    iter_snapshot where the server supports it.
+    """
+    page_key = ''
+    while True:
+        request = appitems_pb2.ListAppItemsRequest(owner_id=owner_id)
+        request.pagination.page_size = page_size
+        request.pagination.page_key = page_key
+        resp = stub.ListAppItems(request, timeout=timeout)
+        yield from resp.items
+        page_key = resp.pagination.next_page_key
+        if not resp.pagination.has_more or not page_key:
+            return
+
+
+def _stats(records: int, started: float, path: str, **extra) -> dict:
+    seconds = time.perf_counter() - started
+    stats = {
+        'path': path,
+        'records': records,
+        'bytes': os.path.getsize(path),
+        'seconds': round(seconds, 3),
+        'records_per_sec': round(records / seconds, 1) if seconds > 0 else 0.0,
+    }
+    stats.update(extra)
+    return stats
+
+
+def export_catalog(stub: appitems_pb2_grpc.AppItemsServiceStub, path: str, fmt: Optional[str] = None,
+                   compression: Optional[str] = None, page_size: int = 500, owner_id: str = '',
+                   level: Optional[int] = None) -> dict:
+    """Stream the whole catalog to `path`, returns stats including records/sec.
+
+    `consistent` in the stats is False when the server lacks WatchAppItems
+    and the export paged through ListAppItems instead.  On MixedOwners the
+    partial file is removed.
+    """
+    started = time.perf_counter()
+    consistent = True
+    try:
+        with ItemWriter(path, fmt, compression, level) as writer:
+            try:
+                for item in iter_snapshot(stub, owner_id=owner_id):
+                    writer.write(item)
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED or writer.count:
+                    raise
+                consistent = False
+                for item in iter_catalog(stub, page_size=page_size, owner_id=owner_id):
+                    writer.write(item)
+    except MixedOwners:
+        os.remove(path)
+        raise
+    return _stats(writer.count, started, path, format=writer.format, compression=writer.compression,
+                  owner_id=owner_id, consistent=consistent)
+
+
+def import_catalog(stub: appitems_pb2_grpc.AppItemsServiceStub, path: str, fmt: Optional[str] = None,
+                   compression: Optional[str] = None, max_in_flight: int = 64,
+                   timeout: Optional[float] = 30.0, owner_id: str = '') -> dict:
+    """Replay a file through CreateAppItem with at most `max_in_flight` calls outstanding.
+
+    The items are created for `owner_id` (sent as x-owner-id metadata).
+    Items that already exist are counted as skipped; items rejected with
+    field errors (or any other RPC failure) are counted as failed.
+    """
+    from appitems.server import OWNER_METADATA_KEY
+
+    metadata = ((OWNER_METADATA_KEY, owner_id),) if owner_id else None
+    started = time.perf_counter()
+    slots = threading.BoundedSemaphore(max_in_flight)
+    lock = threading.Lock()
+    counts = {'created': 0, 'skipped': 0, 'failed': 0}
+
+    def on_done(future):
+        outcome = 'failed'
+        try:
+            resp = future.result()
+            outcome = 'failed' if resp.field_errors else 'created'
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.ALREADY_EXISTS:
+                outcome = 'skipped'
+        finally:
+            # Whatever went wrong, the slot must come back or the final drain blocks forever
+            with lock:
+                counts[outcome] += 1
+            slots.release()
+
+    records = 0
+    for item in read_items(path, fmt, compression):
+        slots.acquire()
+        try:
+            future = stub.CreateAppItem.future(appitems_pb2.CreateAppItemRequest(appitem=item), timeout=timeout,
+                                               metadata=metadata)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(on_done)
+        records += 1
+    for _ in range(max_in_flight):
+        slots.acquire()
+    return _stats(records, started, path, owner_id=owner_id, **counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Streaming AppItem catalog export/import',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m appitems.export export --target localhost:9090 catalog.pb.zst
+  python -m appitems.export import --target localhost:9090 catalog.pb.zst
+  python -m appitems.export export --target local --seed-items 10000 catalog.ndjson.gz
+  python -m appitems.export export --owner-id alice alice.pb    # then import --owner-id alice alice.pb
+        """
+    )
+    parser.add_argument('command', choices=('export', 'import'))
+    parser.add_argument('path', help='File to write (export) or read (import)')
+    parser.add_argument('--target', default='localhost:9090', help="host:port to dial, or 'local' for an in-process server")
+    parser.add_argument('--format', choices=FORMATS, help='Record format (default: from extension)')
+    parser.add_argument('--compression', choices=COMPRESSIONS, help='Compression (default: from extension)')
+    parser.add_argument('--level', type=int, help='Compression level')
+    parser.add_argument('--page-size', type=int, default=500, help='ListAppItems page size for export')
+    parser.add_argument('--owner-id', default='',
+                        help='Export the items of this owner, or import the items for this owner (x-owner-id metadata)')
+    parser.add_argument('--max-in-flight', type=int, default=64, help='Concurrent CreateAppItem calls for import')
+    parser.add_argument('--seed-items', type=int, default=0, help="Synthetic items to create first (useful with --target local)")
+    args = parser.parse_args()
+
+    server = None
+    target = args.target
+    if target == 'local':
+        from appitems.server import start_local_server
+        server, target = start_local_server()
+    channel = grpc.insecure_channel(target)
+    try:
+        stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+        if args.seed_items:
+            from appitems.fixtures import iter_corpus
+            for item in iter_corpus(args.seed_items):
+                stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=item))
+        if args.command == 'export':
+            try:
+                stats = export_catalog(stub, args.path, args.format, args.compression, args.page_size,
+                                       args.owner_id, args.level)
+            except MixedOwners as e:
+                parser.exit(1, f'❌ {e}\n')
+        else:
+            stats = import_catalog(stub, args.path, args.format, args.compression, args.max_in_flight,
+                                   owner_id=args.owner_id)
+        print(json.dumps(stats, indent=2))
+    finally:
+        channel.close()
+        if server is not None:
+            server.stop(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Synthetic AppItem payloads for load runs and benchmarks.
+"""
+
+import random
+import string
+from typing import Iterator, List
+
+from apptemplate.v1 import models_pb2
+
+DIFFICULTIES = ('beginner', 'easy', 'medium', 'hard', 'expert')
+
+_ALPHABET = string.ascii_lowercase + string.digits
+
+
+def random_text(rng: random.Random, size: int) -> str:
+    """Random lowercase/digit string of exactly `size` characters"""
+    return ''.join(rng.choices(_ALPHABET, k=size))
+
+
+def make_appitem(rng: random.Random, num_tags: int = 5, tag_size: int = 8,
+                 description_size: int = 256, item_id: str = '') -> models_pb2.AppItem:
+    """Build an AppItem with the given tag count and field sizes.
+
+    Timestamps are left unset - servers stamp created_at/updated_at.
+    """
+    item = models_pb2.AppItem(
+        id=item_id,
+        name=random_text(rng, 16),
+        description=random_text(rng, description_size),
+        image_url=f'https://example.com/images/{random_text(rng, 12)}.png',
+        difficulty=rng.choice(DIFFICULTIES),
+    )
+    item.tags.extend(random_text(rng, tag_size) for _ in range(num_tags))
+    return item
+
+
+def make_corpus(count: int, seed: int = 0, **kwargs) -> List[models_pb2.AppItem]:
+    """A deterministic list of `count` items with ids item-000000, item-000001..."""
+    return list(iter_corpus(count, seed=seed, **kwargs))
+
+
+def iter_corpus(count: int, seed: int = 0, **kwargs) -> Iterator[models_pb2.AppItem]:
+    """Streaming variant of make_corpus"""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield make_appitem(rng, item_id=f'item-{i:06d}', **kwargs)
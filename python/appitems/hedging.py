@@ -0,0 +1,167 @@
+"""
+Hedged reads and deadline-bounded retries for AppItemsService clients.
+
+`HedgedAppItemsStub` wraps a generated (or lazy) stub and gives every call
+one overall deadline budget:
+
+    stub = HedgedAppItemsStub(AppItemsServiceStub(channel), CallPolicy(hedge_percentile=95))
+    resp = stub.GetAppItem(request, timeout=0.5)
+
+Reads (GetAppItem, GetAppItems, ListAppItems) are idempotent, so when the
+first call has not answered after the method's observed p95 latency a
+duplicate is sent; whichever answers first wins and the other is cancelled.
+Calls failing with UNAVAILABLE are retried with full-jitter exponential
+backoff as long as the next attempt can still start before the deadline.
+Writes are sent exactly once unless the policy sets `retry_writes` (they
+are never hedged).
+
+The hedge delay comes from the latency of every successful read's first
+call (hedged or not); when a hedge wins, the first call's elapsed time at
+that point is recorded, so slow primaries keep pulling the percentile up.
+
+Hedges, hedge wins and retries are counted in a MetricsRegistry as
+`grpc_client_hedges_total`, `grpc_client_hedge_wins_total` and
+`grpc_client_retries_total`.
+"""
+
+import functools
+import queue
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import grpc
+
+from appitems.metrics import LATENCY_BUCKETS, LogHistogram, MetricsRegistry, split_method
+
+SERVICE_PREFIX = '/apptemplate.v1.AppItemsService/'
+READ_METHODS = ('GetAppItem', 'GetAppItems', 'ListAppItems')
+WRITE_METHODS = ('CreateAppItem', 'UpdateAppItem', 'DeleteAppItem')
+
+
+@dataclass
+class CallPolicy:
+    """Hedging and retry settings shared by all calls through a HedgedAppItemsStub"""
+
+    timeout: Optional[float] = 30.0          # overall budget when the caller passes none
+    hedge: bool = True
+    hedge_percentile: float = 95.0
+    hedge_initial_delay: float = 0.05        # used until `hedge_min_samples` latencies are seen
+    hedge_min_delay: float = 0.002
+    hedge_max_delay: float = 1.0
+    hedge_min_samples: int = 20
+    max_hedges: int = 1
+    max_attempts: int = 4
+    backoff: float = 0.05
+    max_backoff: float = 1.0
+    retry_codes: Tuple[grpc.StatusCode, ...] = (grpc.StatusCode.UNAVAILABLE,)
+    retry_writes: bool = False
+
+
+class HedgedAppItemsStub:
+    """AppItemsService stub wrapper applying a CallPolicy to every call.
+
+    Calls block like the generated stub's and take the same `timeout` and
+    `metadata` arguments; `timeout` is the budget for all attempts together.
+    """
+
+    def __init__(self, stub, policy: Optional[CallPolicy] = None, registry: Optional[MetricsRegistry] = None):
+        self.stub = stub
+        self.policy = policy or CallPolicy()
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.latencies: Dict[str, LogHistogram] = {name: LogHistogram(LATENCY_BUCKETS) for name in READ_METHODS}
+        for name in READ_METHODS + WRITE_METHODS:
+            setattr(self, name, functools.partial(self._invoke, name))
+
+    def hedge_delay(self, method: str) -> float:
+        """How long to wait for the first call of `method` before hedging it"""
+        policy = self.policy
+        hist = self.latencies[method]
+        if hist.total < policy.hedge_min_samples:
+            return policy.hedge_initial_delay
+        return min(max(hist.percentile(policy.hedge_percentile), policy.hedge_min_delay), policy.hedge_max_delay)
+
+    def _count(self, name: str, method: str, help_text: str, code: Optional[grpc.StatusCode] = None):
+        service, method = split_method(SERVICE_PREFIX + method)
+        labels = {'grpc_service': service, 'grpc_method': method}
+        if code is not None:
+            labels['grpc_code'] = code.name
+        self.registry.increment(name, labels, help_text=help_text)
+
+    def _invoke(self, method: str, request, timeout: Optional[float] = None, metadata=None, **kwargs):
+        policy = self.policy
+        if timeout is None:
+            timeout = policy.timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        is_read = method in READ_METHODS
+        retryable = is_read or policy.retry_writes
+        attempt = 1
+        while True:
+            future = self._attempt(method, request, deadline, metadata, is_read and policy.hedge, kwargs)
+            error = future.exception()
+            if error is None:
+                return future.result()
+            code = future.code()
+            if not retryable or code not in policy.retry_codes or attempt >= policy.max_attempts:
+                raise error
+            delay = random.uniform(0, min(policy.max_backoff, policy.backoff * 2 ** (attempt - 1)))
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise error
+            self._count('grpc_client_retries_total', method, 'Calls retried after a retryable status.', code)
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt(self, method: str, request, deadline: Optional[float], metadata, hedge: bool, kwargs):
+        """One (possibly hedged) attempt; returns the winning future or the last failed one"""
+        rpc = getattr(self.stub, method)
+        done: queue.Queue = queue.Queue()
+        calls = []
+
+        def launch():
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0.0)
+            future = rpc.future(request, timeout=remaining, metadata=metadata, **kwargs)
+            calls.append((future, time.monotonic()))
+            future.add_done_callback(done.put)
+
+        launch()
+        hedges_left = self.policy.max_hedges if hedge else 0
+        delay = self.hedge_delay(method) if hedge else 0.0
+        first_sent = calls[0][1]
+        pending, failed = 1, None
+        while True:
+            wait = None
+            if hedges_left:
+                wait = max(first_sent + delay * len(calls) - time.monotonic(), 0.0)
+            try:
+                future = done.get(timeout=wait)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    hedges_left = 0
+                    continue
+                launch()
+                hedges_left -= 1
+                pending += 1
+                self._count('grpc_client_hedges_total', method, 'Hedged duplicate calls sent.')
+                continue
+            pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                failed = future
+                if pending == 0:
+                    return failed
+                continue
+            for other, _ in calls:
+                if other is not future:
+                    other.cancel()
+            primary = calls[0][0]
+            if primary is not future:
+                self._count('grpc_client_hedge_wins_total', method, 'Calls answered first by a hedge.')
+            # The hedge delay follows the primary's latency, hedged or not.  When a hedge won,
+            # the primary was still running, so its elapsed time is a lower bound (recording the
+            # winner instead would hide exactly the tail hedging is for).  A failed primary is skipped.
+            primary_failed = primary is not future and primary.done() and not primary.cancelled()
+            if method in self.latencies and not primary_failed:
+                self.latencies[method].record(time.monotonic() - first_sent)
+            return future
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Bulk AppItem ingest over the client-streaming CreateAppItems RPC.
+
+Reads a length-delimited protobuf or NDJSON file (as written by
+appitems.export, optionally gzip/zstd compressed) and streams it to the
+server instead of paying one CreateAppItem round trip per item:
+
+    python -m appitems.ingest seed.pb.zst --target localhost:9090 --checkpoint seed.ckpt
+
+The input is cut into calls of `--records-per-call` items.  Each call
+streams its items in request messages of up to `--batch-size` items (and
+`--max-request-bytes`).  gRPC only pulls the next message when flow control
+lets it send.  Up to `--max-streams` calls are in flight while the next
+chunk is read and parsed, so reading, sending and server-side inserts
+overlap.
+
+After every call that completes in order, the number of records done and
+the running counts are written to the checkpoint file.  Running the same
+command again resumes after the last checkpointed record.  Calls that fail
+with a transient status are retried.  Items re-sent by a retry or a resume
+come back as `skipped` (already exists) rather than duplicated, because
+items without an id get one derived from the input file and record number
+before they are sent.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import uuid
+from collections import deque
+from concurrent import futures
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Sequence
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.export import COMPRESSIONS, FORMATS, read_items
+
+RETRY_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED,
+               grpc.StatusCode.RESOURCE_EXHAUSTED, grpc.StatusCode.ABORTED)
+
+# Rejected items reported in the stats (all of them go to `on_result`)
+MAX_REPORTED_ERRORS = 100
+
+# Bytes a repeated message field adds around each item (tag + length varint)
+_ITEM_OVERHEAD = 6
+
+
+def iter_batches(items: Sequence[models_pb2.AppItem], batch_size: int = 100,
+                 max_request_bytes: int = 1 << 20) -> Iterator[appitems_pb2.CreateAppItemsRequest]:
+    """CreateAppItems messages of at most `batch_size` items and about `max_request_bytes` each"""
+    start, size = 0, 0
+    for end, item in enumerate(items):
+        item_size = item.ByteSize() + _ITEM_OVERHEAD
+        if end > start and (end - start >= batch_size or size + item_size > max_request_bytes):
+            yield appitems_pb2.CreateAppItemsRequest(appitems=items[start:end])
+            start, size = end, 0
+        size += item_size
+    if start < len(items):
+        yield appitems_pb2.CreateAppItemsRequest(appitems=items[start:])
+
+
+def source_info(path: str) -> dict:
+    """Identity of an input file, stored in the checkpoint so it is not resumed against another file"""
+    st = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def load_checkpoint(path: str, source: dict) -> Optional[dict]:
+    """Saved progress for `source`, None if there is no checkpoint yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        state = json.load(f)
+    if state.get('source') != source:
+        raise ValueError(f'Checkpoint {path} was written for a different input: {state.get("source")}')
+    return state
+
+
+def save_checkpoint(path: str, state: dict):
+    """Write the checkpoint atomically so a crash never leaves a torn file"""
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Ingester:
+    """Streams an exported file into CreateAppItems calls, checkpointing progress"""
+
+    def __init__(self, stub: appitems_pb2_grpc.AppItemsServiceStub, records_per_call: int = 5000,
+                 batch_size: int = 100, max_request_bytes: int = 1 << 20, max_streams: int = 2,
+                 max_attempts: int = 4, backoff: float = 0.5, max_backoff: float = 10.0,
+                 timeout: Optional[float] = 300.0, metadata=None, assign_ids: bool = True,
+                 on_result: Optional[Callable[[int, appitems_pb2.CreateAppItemResult], None]] = None):
+        self.stub = stub
+        self.records_per_call = records_per_call
+        self.batch_size = batch_size
+        self.max_request_bytes = max_request_bytes
+        self.max_streams = max_streams
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.metadata = metadata
+        self.assign_ids = assign_ids
+        self.on_result = on_result
+
+    def ingest(self, path: str, fmt: Optional[str] = None, compression: Optional[str] = None,
+               checkpoint: Optional[str] = None) -> dict:
+        """Ingest `path` (resuming from `checkpoint` if it exists), returns the stats"""
+        started = time.perf_counter()
+        source = source_info(path)
+        state = load_checkpoint(checkpoint, source) if checkpoint else None
+        if state is None:
+            state = {'source': source, 'records': 0, 'created': 0, 'skipped': 0, 'failed': 0,
+                     'retries': 0, 'complete': False}
+        resumed_from = state['records']
+        errors: List[dict] = []
+        id_prefix = f"{source['path']}:{source['size']}:{source['mtime_ns']}#"
+
+        def complete(start: int, end: int, future: futures.Future):
+            resp, retries = future.result()
+            for result in resp.results:
+                if result.field_errors and len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({'record': start + result.index, 'id': result.id,
+                                   'field_errors': dict(result.field_errors)})
+                if self.on_result is not None:
+                    self.on_result(start + result.index, result)
+            state['records'] = end
+            state['created'] += resp.created
+            state['skipped'] += resp.skipped
+            state['failed'] += resp.failed
+            state['retries'] += retries
+            if checkpoint:
+                save_checkpoint(checkpoint, state)
+
+        items = read_items(path, fmt, compression, skip=resumed_from)
+        offset = resumed_from
+        pending: deque = deque()
+        with futures.ThreadPoolExecutor(max_workers=self.max_streams, thread_name_prefix='ingest') as pool:
+            try:
+                while True:
+                    # Parsing the next chunk overlaps with the calls already streaming
+                    chunk = list(islice(items, self.records_per_call))
+                    if not chunk:
+                        break
+                    if self.assign_ids:
+                        for index, item in enumerate(chunk, offset):
+                            if not item.id:
+                                item.id = uuid.uuid5(uuid.NAMESPACE_URL, f'{id_prefix}{index}').hex
+                    while len(pending) >= self.max_streams or (pending and pending[0][2].done()):
+                        complete(*pending.popleft())
+                    pending.append((offset, offset + len(chunk), pool.submit(self._send, chunk)))
+                    offset += len(chunk)
+                while pending:
+                    complete(*pending.popleft())
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+        state['complete'] = True
+        if checkpoint:
+            save_checkpoint(checkpoint, state)
+
+        seconds = time.perf_counter() - started
+        sent = state['records'] - resumed_from
+        return {
+            'path': path,
+            'records': state['records'],
+            'resumed_from': resumed_from,
+            'created': state['created'],
+            'skipped': state['skipped'],
+            'failed': state['failed'],
+            'retries': state['retries'],
+            'seconds': round(seconds, 3),
+            'records_per_sec': round(sent / seconds, 1) if seconds > 0 else 0.0,
+            'errors': errors,
+        }
+
+    def _send(self, chunk: List[models_pb2.AppItem]):
+        """One CreateAppItems call for `chunk`, retried on transient failures; returns (response, retries)"""
+        for attempt in range(self.max_attempts):
+            try:
+                requests = iter_batches(chunk, self.batch_size, self.max_request_bytes)
+                return self.stub.CreateAppItems(requests, timeout=self.timeout, metadata=self.metadata), attempt
+            except grpc.RpcError as e:
+                if e.code() not in RETRY_CODES or attempt == self.max_attempts - 1:
+                    raise
+                time.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Bulk AppItem ingest over CreateAppItems with checkpoint/resume',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m appitems.ingest seed.pb.zst --target localhost:9090 --checkpoint seed.ckpt
+  python -m appitems.ingest seed.ndjson.gz --target local --records-per-call 10000 --max-streams 4
+        """
+    )
+    parser.add_argument('path', help='Length-delimited .pb or .ndjson file (optionally .gz/.zst)')
+    parser.add_argument('--target', default='localhost:9090', help="host:port to dial, or 'local' for an in-process server")
+    parser.add_argument('--format', choices=FORMATS, help='Record format (default: from extension)')
+    parser.add_argument('--compression', choices=COMPRESSIONS, help='Compression (default: from extension)')
+    parser.add_argument('--checkpoint', help='Progress file; an existing one is resumed')
+    parser.add_argument('--fresh', action='store_true', help='Ignore and replace an existing checkpoint')
+    parser.add_argument('--records-per-call', type=int, default=5000, help='Items per CreateAppItems stream')
+    parser.add_argument('--batch-size', type=int, default=100, help='Items per request message')
+    parser.add_argument('--max-request-bytes', type=int, default=1 << 20, help='Size cap per request message')
+    parser.add_argument('--max-streams', type=int, default=2, help='CreateAppItems calls in flight')
+    parser.add_argument('--owner-id', default='', help='Owner of the created items (x-owner-id metadata)')
+    args = parser.parse_args()
+
+    if args.fresh and args.checkpoint and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    server = None
+    target = args.target
+    if target == 'local':
+        from appitems.server import start_local_server
+        server, target = start_local_server()
+    channel = grpc.insecure_channel(target)
+    try:
+        from appitems.server import OWNER_METADATA_KEY
+        metadata = [(OWNER_METADATA_KEY, args.owner_id)] if args.owner_id else None
+        ingester = Ingester(appitems_pb2_grpc.AppItemsServiceStub(channel), args.records_per_call,
+                            args.batch_size, args.max_request_bytes, args.max_streams, metadata=metadata)
+        stats = ingester.ingest(args.path, args.format, args.compression, args.checkpoint)
+        print(json.dumps(stats, indent=2))
+    finally:
+        channel.close()
+        if server is not None:
+            server.stop(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Client and server interceptors that record per-method RPC metrics.
+
+Each interceptor observes latency, final status code and request/response
+message sizes into a MetricsRegistry (see appitems.metrics):
+
+    registry = MetricsRegistry()
+    channel = grpc.intercept_channel(grpc.insecure_channel(target), MetricsClientInterceptor(registry))
+
+    server = grpc.server(pool, interceptors=[MetricsServerInterceptor(registry)])
+    appitems_pb2_grpc.add_AppItemsServiceServicer_to_server(servicer, server)
+
+    serve_metrics(registry, port=9464)
+
+The grpc.aio equivalents are AioMetricsClientInterceptor and
+AioMetricsServerInterceptor.
+"""
+
+import time
+
+import grpc
+
+from appitems.metrics import MetricsRegistry
+
+
+def message_size(message) -> int:
+    """Serialized size of a protobuf message (0 for None)"""
+    return message.ByteSize() if message is not None else 0
+
+
+class MetricsClientInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Records client-side metrics for unary calls on a sync channel"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode('utf-8')
+        request_bytes = message_size(request)
+        call = continuation(client_call_details, request)
+
+        def on_done(future):
+            code = future.code()
+            response_bytes = message_size(future.result()) if code == grpc.StatusCode.OK else None
+            self.registry.observe('client', method, code.name, time.perf_counter() - start,
+                                  request_bytes, response_bytes)
+
+        call.add_done_callback(on_done)
+        return call
+
+
+class AioMetricsClientInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Records client-side metrics for unary calls on a grpc.aio channel"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode('utf-8')
+        code, response = grpc.StatusCode.UNKNOWN, None
+        try:
+            call = await continuation(client_call_details, request)
+            response = await call
+            code = grpc.StatusCode.OK
+            return response
+        except grpc.aio.AioRpcError as e:
+            code = e.code()
+            raise
+        except BaseException:
+            code = grpc.StatusCode.CANCELLED
+            raise
+        finally:
+            self.registry.observe('client', method, code.name, time.perf_counter() - start,
+                                  message_size(request), message_size(response) if response is not None else None)
+
+
+def _status_of(context, error: BaseException = None) -> grpc.StatusCode:
+    code = context.code()
+    if code is None:
+        return grpc.StatusCode.UNKNOWN if error is not None else grpc.StatusCode.OK
+    return code
+
+
+class MetricsServerInterceptor(grpc.ServerInterceptor):
+    """Records server-side metrics for unary handlers on a thread-pool server"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        method = handler_call_details.method
+        behavior = handler.unary_unary
+
+        def wrapped(request, context):
+            start = time.perf_counter()
+            response, error = None, None
+            try:
+                response = behavior(request, context)
+                return response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                code = _status_of(context, error)
+                self.registry.observe('server', method, code.name, time.perf_counter() - start,
+                                      message_size(request), message_size(response) if error is None else None)
+
+        return grpc.unary_unary_rpc_method_handler(
+            wrapped,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+class AioMetricsServerInterceptor(grpc.aio.ServerInterceptor):
+    """Records server-side metrics for unary handlers on a grpc.aio server"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        method = handler_call_details.method
+        behavior = handler.unary_unary
+
+        async def wrapped(request, context):
+            start = time.perf_counter()
+            response, error = None, None
+            try:
+                response = await behavior(request, context)
+                return response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                code = _status_of(context, error)
+                self.registry.observe('server', method, code.name, time.perf_counter() - start,
+                                      message_size(request), message_size(response) if error is None else None)
+
+        return grpc.unary_unary_rpc_method_handler(
+            wrapped,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
@@ -0,0 +1,364 @@
+"""
+Lazy, field-on-demand views over serialized AppItem responses.
+
+`FromString` decodes every description, tag and image url of every item in a
+page even when the caller only looks at `id` and `updated_at`.  The views
+here keep the wire bytes (as a memoryview, so slicing never copies), index
+the offsets of top-level fields on first access and decode only the fields
+that are actually read:
+
+    stub = LazyAppItemsStub(channel)
+    page = stub.ListAppItems(request)          # ListAppItemsView
+    for item in page.items:                     # AppItemView per item, nothing decoded yet
+        print(item.id, item.updated_at_ns)      # decodes just these two fields
+
+    page.to_message()                           # full appitems_pb2.ListAppItemsResponse
+    item.to_message()                           # full models_pb2.AppItem
+
+Fields without an accessor on a view (eg ones added to the proto since) are
+still readable: the first such access parses the whole message once and
+reads the field from it.
+
+The scan itself is pure Python.  On the pure-Python protobuf backend reading
+id/updated_at from a page through views is ~3x faster than FromString.  On
+the upb backend (the default, and what requirements.txt pins) FromString
+decodes in C and is ~10x faster than the views even for two fields, so
+LazyAppItemsStub only returns views on the pure-Python backend and returns
+the generated messages otherwise.  Code using the stub should stick to the
+fields both share (`item.updated_at.ToNanoseconds()`, not `updated_at_ns`).
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from google.protobuf import timestamp_pb2
+from google.protobuf.internal import api_implementation
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+WIRE_VARINT, WIRE_FIXED64, WIRE_LEN, WIRE_FIXED32 = 0, 1, 2, 5
+
+# (field number -> list of (wire_type, start, end)); for varints start holds the value
+FieldIndex = Dict[int, List[Tuple[int, int, int]]]
+
+# Whether the views beat FromString, ie protobuf runs its pure-Python backend
+VIEWS_FASTER = api_implementation.Type() == 'python'
+
+
+def _read_varint(buf: memoryview, pos: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError('Truncated message')
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError('Malformed varint')
+
+
+def index_fields(buf: memoryview) -> FieldIndex:
+    """Offsets of every top-level field in a serialized message, without decoding payloads"""
+    fields: FieldIndex = {}
+    pos, end = 0, len(buf)
+    while pos < end:
+        # Keys and lengths almost always fit in one byte, so inline that case
+        key = buf[pos]
+        pos += 1
+        if key & 0x80:
+            key, pos = _read_varint(buf, pos - 1)
+        wire_type = key & 7
+        if wire_type == WIRE_LEN:
+            if pos >= end:
+                raise ValueError('Truncated message')
+            size = buf[pos]
+            pos += 1
+            if size & 0x80:
+                size, pos = _read_varint(buf, pos - 1)
+            entry = (wire_type, pos, pos + size)
+            pos += size
+        elif wire_type == WIRE_VARINT:
+            value, pos = _read_varint(buf, pos)
+            entry = (wire_type, value, pos)
+        elif wire_type == WIRE_FIXED64:
+            entry = (wire_type, pos, pos + 8)
+            pos += 8
+        elif wire_type == WIRE_FIXED32:
+            entry = (wire_type, pos, pos + 4)
+            pos += 4
+        else:
+            raise ValueError(f'Unsupported wire type {wire_type} for field {key >> 3}')
+        if pos > end:
+            raise ValueError('Truncated message')
+        number = key >> 3
+        entries = fields.get(number)
+        if entries is None:
+            fields[number] = [entry]
+        else:
+            entries.append(entry)
+    return fields
+
+
+def _as_view(data) -> memoryview:
+    return data if isinstance(data, memoryview) else memoryview(data)
+
+
+class _LazyMessage:
+    """Base for views: holds the buffer and builds the field index on first use"""
+
+    __slots__ = ('_buf', '_fields', '_message')
+
+    def __init__(self, data):
+        self._buf = _as_view(data)
+        self._fields: Optional[FieldIndex] = None
+        self._message = None
+
+    def __getattr__(self, name: str):
+        # Only reached for names without an accessor: fall back to the fully parsed message
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._message is None:
+            self._message = self.to_message()
+        return getattr(self._message, name)
+
+    def to_message(self):
+        raise NotImplementedError
+
+    def _index(self) -> FieldIndex:
+        if self._fields is None:
+            self._fields = index_fields(self._buf)
+        return self._fields
+
+    def _last(self, number: int) -> Optional[Tuple[int, int, int]]:
+        entries = self._index().get(number)
+        return entries[-1] if entries else None
+
+    def _string(self, number: int) -> str:
+        entry = self._last(number)
+        return str(self._buf[entry[1]:entry[2]], 'utf-8') if entry else ''
+
+    def _strings(self, number: int) -> List[str]:
+        buf = self._buf
+        return [str(buf[start:end], 'utf-8') for _, start, end in self._index().get(number, ())]
+
+    def _varint(self, number: int) -> int:
+        entry = self._last(number)
+        return entry[1] if entry else 0
+
+    def _submessage(self, number: int) -> Optional[memoryview]:
+        entry = self._last(number)
+        return self._buf[entry[1]:entry[2]] if entry else None
+
+    def _map_entries(self, number: int) -> Iterator[Tuple[str, Optional[memoryview]]]:
+        """(key, value bytes) of a map<string, ...> field; map entries are key = 1, value = 2"""
+        buf = self._buf
+        for _, start, end in self._index().get(number, ()):
+            entry = buf[start:end]
+            fields = index_fields(entry)
+            key = fields.get(1)
+            value = fields.get(2)
+            key_str = str(entry[key[-1][1]:key[-1][2]], 'utf-8') if key else ''
+            yield key_str, entry[value[-1][1]:value[-1][2]] if value else None
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._buf)
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+
+def _timestamp_ns(buf: Optional[memoryview]) -> int:
+    if buf is None:
+        return 0
+    seconds, nanos = 0, 0
+    for number, entries in index_fields(buf).items():
+        value = entries[-1][1]
+        if number == 1:
+            seconds = value - (1 << 64) if value >= 1 << 63 else value
+        elif number == 2:
+            nanos = value
+    return seconds * 1_000_000_000 + nanos
+
+
+class AppItemView(_LazyMessage):
+    """Read-only view of a serialized AppItem (field numbers from models.proto)"""
+
+    __slots__ = ()
+
+    @property
+    def created_at_ns(self) -> int:
+        return _timestamp_ns(self._submessage(1))
+
+    @property
+    def updated_at_ns(self) -> int:
+        return _timestamp_ns(self._submessage(2))
+
+    @property
+    def created_at(self) -> timestamp_pb2.Timestamp:
+        ts = timestamp_pb2.Timestamp()
+        ts.FromNanoseconds(self.created_at_ns)
+        return ts
+
+    @property
+    def updated_at(self) -> timestamp_pb2.Timestamp:
+        ts = timestamp_pb2.Timestamp()
+        ts.FromNanoseconds(self.updated_at_ns)
+        return ts
+
+    @property
+    def id(self) -> str:
+        return self._string(3)
+
+    @property
+    def name(self) -> str:
+        return self._string(4)
+
+    @property
+    def description(self) -> str:
+        return self._string(5)
+
+    @property
+    def tags(self) -> List[str]:
+        return self._strings(6)
+
+    @property
+    def image_url(self) -> str:
+        return self._string(7)
+
+    @property
+    def difficulty(self) -> str:
+        return self._string(8)
+
+    def to_message(self) -> models_pb2.AppItem:
+        return models_pb2.AppItem.FromString(self._buf)
+
+    def __repr__(self):
+        return f'AppItemView(id={self.id!r}, {len(self._buf)} bytes)'
+
+
+class ListAppItemsView(_LazyMessage):
+    """View of a serialized ListAppItemsResponse"""
+
+    __slots__ = ('_items',)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self._items: Optional[List[AppItemView]] = None
+
+    @property
+    def items(self) -> List[AppItemView]:
+        if self._items is None:
+            buf = self._buf
+            self._items = [AppItemView(buf[start:end]) for _, start, end in self._index().get(1, ())]
+        return self._items
+
+    @property
+    def pagination(self) -> models_pb2.PaginationResponse:
+        data = self._submessage(2)
+        return models_pb2.PaginationResponse.FromString(data if data is not None else b'')
+
+    def __iter__(self) -> Iterator[AppItemView]:
+        return iter(self.items)
+
+    def to_message(self) -> appitems_pb2.ListAppItemsResponse:
+        return appitems_pb2.ListAppItemsResponse.FromString(self._buf)
+
+
+class GetAppItemsView(_LazyMessage):
+    """View of a serialized GetAppItemsResponse (map<string, AppItem> appitems = 1).
+
+    The mapping methods cover `appitems`; `versions` and `not_modified_ids`
+    are properties.
+    """
+
+    __slots__ = ('_entries',)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self._entries: Optional[Dict[str, AppItemView]] = None
+
+    def _map(self) -> Dict[str, AppItemView]:
+        if self._entries is None:
+            self._entries = {key: AppItemView(value if value is not None else b'')
+                             for key, value in self._map_entries(1)}
+        return self._entries
+
+    @property
+    def versions(self) -> Dict[str, str]:
+        return {key: str(value, 'utf-8') if value is not None else '' for key, value in self._map_entries(2)}
+
+    @property
+    def not_modified_ids(self) -> List[str]:
+        return self._strings(3)
+
+    def keys(self):
+        return self._map().keys()
+
+    def items(self):
+        return self._map().items()
+
+    def values(self):
+        return self._map().values()
+
+    def get(self, item_id: str, default=None) -> Optional[AppItemView]:
+        return self._map().get(item_id, default)
+
+    def __getitem__(self, item_id: str) -> AppItemView:
+        return self._map()[item_id]
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._map()
+
+    def __iter__(self):
+        return iter(self._map())
+
+    def to_message(self) -> appitems_pb2.GetAppItemsResponse:
+        return appitems_pb2.GetAppItemsResponse.FromString(self._buf)
+
+
+class GetAppItemView(_LazyMessage):
+    """View of a serialized GetAppItemResponse"""
+
+    __slots__ = ()
+
+    @property
+    def appitem(self) -> AppItemView:
+        data = self._submessage(1)
+        return AppItemView(data if data is not None else b'')
+
+    @property
+    def version(self) -> str:
+        return self._string(2)
+
+    @property
+    def not_modified(self) -> bool:
+        return bool(self._varint(3))
+
+    def to_message(self) -> appitems_pb2.GetAppItemResponse:
+        return appitems_pb2.GetAppItemResponse.FromString(self._buf)
+
+
+class LazyAppItemsStub:
+    """Read RPCs of AppItemsService returning lazy views instead of decoded messages.
+
+    `views` defaults to VIEWS_FASTER: on the upb backend the RPCs return the
+    generated messages, which decode faster there.
+    """
+
+    def __init__(self, channel, views: Optional[bool] = None):
+        self.views = VIEWS_FASTER if views is None else views
+        prefix = '/apptemplate.v1.AppItemsService/'
+        self.ListAppItems = channel.unary_unary(
+            prefix + 'ListAppItems',
+            request_serializer=appitems_pb2.ListAppItemsRequest.SerializeToString,
+            response_deserializer=ListAppItemsView if self.views else appitems_pb2.ListAppItemsResponse.FromString)
+        self.GetAppItems = channel.unary_unary(
+            prefix + 'GetAppItems',
+            request_serializer=appitems_pb2.GetAppItemsRequest.SerializeToString,
+            response_deserializer=GetAppItemsView if self.views else appitems_pb2.GetAppItemsResponse.FromString)
+        self.GetAppItem = channel.unary_unary(
+            prefix + 'GetAppItem',
+            request_serializer=appitems_pb2.GetAppItemRequest.SerializeToString,
+            response_deserializer=GetAppItemView if self.views else appitems_pb2.GetAppItemResponse.FromString)
@@ -0,0 +1,289 @@
+"""
+Adaptive client-side concurrency limits for fanning out to AppItemsService.
+
+A fixed `max_in_flight` is either too low (the server idles) or too high
+(queues build until calls hit DEADLINE_EXCEEDED).  `AdaptiveLimiter` adjusts
+the number of calls allowed in flight from what it observes:
+
+    gradient  once per round trip compares the average latency with the
+              best seen (the no-queueing baseline); the limit grows while
+              they agree and shrinks as latency rises above `tolerance`
+              times the baseline (queueing at the server)
+    aimd      grows by one per limit's worth of successful calls and
+              ignores latency, so it only shrinks on overload errors
+
+Either way, calls that fail with DEADLINE_EXCEEDED, RESOURCE_EXHAUSTED or
+UNAVAILABLE shrink the limit by `backoff_ratio`, at most once per round
+trip: failures of calls that were already in flight when the limit was last
+cut belong to the same overload and do not cut it again.  Callers beyond the limit wait in a queue
+(optionally bounded), which is how backpressure reaches the producer:
+
+    limiter = AdaptiveLimiter(name=target, registry=registry)
+    channel = grpc.intercept_channel(grpc.insecure_channel(target), LimiterClientInterceptor(limiter))
+    stub = AppItemsServiceStub(channel)
+    stub.CreateAppItem.future(request)      # blocks while the limit is reached
+
+Use one limiter per target.  `limiter.limit`, `limiter.in_flight` and
+`limiter.queue_depth` are exposed as gauges when a MetricsRegistry is given.
+"""
+
+import collections
+import math
+import threading
+import time
+from typing import Optional
+
+import grpc
+
+from appitems.metrics import MetricsRegistry
+
+ALGORITHMS = ('gradient', 'aimd')
+DROP_CODES = (grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.RESOURCE_EXHAUSTED, grpc.StatusCode.UNAVAILABLE)
+
+
+class LimiterRejected(grpc.RpcError, grpc.Call, grpc.Future):
+    """Raised instead of starting a call when the limiter's queue is full or the wait timed out.
+
+    Like grpc's own errors it is also a finished, failed call, so the
+    interceptor hands it back as the outcome of `.future()` calls instead of
+    letting grpc wrap it in a generic INTERNAL failure.
+    """
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self._code = code
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def is_active(self) -> bool:
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def add_callback(self, callback) -> bool:
+        return False
+
+    def cancel(self) -> bool:
+        return False
+
+    def cancelled(self) -> bool:
+        return False
+
+    def running(self) -> bool:
+        return False
+
+    def done(self) -> bool:
+        return True
+
+    def result(self, timeout=None):
+        raise self
+
+    def exception(self, timeout=None):
+        return self
+
+    def traceback(self, timeout=None):
+        return self.__traceback__
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to observed latency and overload signals"""
+
+    def __init__(self, name: str = '', algorithm: str = 'gradient', initial_limit: int = 16,
+                 min_limit: int = 1, max_limit: int = 1000, max_queue: Optional[int] = None,
+                 backoff_ratio: float = 0.9, tolerance: float = 1.5, smoothing: float = 0.2,
+                 registry: Optional[MetricsRegistry] = None):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f'Unknown algorithm: {algorithm} (expected one of {ALGORITHMS})')
+        self.name = name
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.cond = threading.Condition()
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.short_rtt = 0.0
+        self.long_rtt = 0.0
+        self.samples = 0
+        self.window_start = 0.0
+        self.window_sum = 0.0
+        self.window_count = 0
+        self.window_in_flight = 0
+        self.drops = 0
+        self.decreases = 0
+        self.decreased_at = float('-inf')
+        self.rejected = 0
+        self.registry = registry
+        if registry is not None:
+            labels = {'target': name}
+            registry.register_gauge('grpc_client_concurrency_limit', lambda: int(self.limit), labels,
+                                    'Current adaptive concurrency limit.')
+            registry.register_gauge('grpc_client_in_flight', lambda: self.in_flight, labels,
+                                    'Calls currently in flight.')
+            registry.register_gauge('grpc_client_queue_depth', lambda: self.queue_depth, labels,
+                                    'Callers waiting for a concurrency slot.')
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Take a slot, waiting up to `timeout` seconds (forever if None) when none is free"""
+        with self.cond:
+            if self.queue_depth == 0 and self._has_slot():
+                self.in_flight += 1
+                return
+            if self.max_queue is not None and self.queue_depth >= self.max_queue:
+                self._reject()
+                raise LimiterRejected(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                                      f'Concurrency limiter queue for {self.name or "target"} is full')
+            self.queue_depth += 1
+            try:
+                ready = self.cond.wait_for(self._has_slot, timeout)
+            finally:
+                self.queue_depth -= 1
+            if not ready:
+                self._reject()
+                raise LimiterRejected(grpc.StatusCode.DEADLINE_EXCEEDED,
+                                      'Deadline expired waiting for a concurrency slot')
+            self.in_flight += 1
+
+    def _reject(self):
+        self.rejected += 1
+        if self.registry is not None:
+            self.registry.increment('grpc_client_limiter_rejected_total', {'target': self.name},
+                                    help_text='Calls rejected by the concurrency limiter.')
+
+    def release(self, rtt: Optional[float] = None, dropped: bool = False):
+        """Give a slot back; `rtt` is the call's latency (None to skip adapting)"""
+        with self.cond:
+            in_flight = self.in_flight
+            self.in_flight -= 1
+            if dropped:
+                self.drops += 1
+                now = time.monotonic()
+                # Without the call's latency, treat it as having started one round trip ago
+                started = now - (rtt if rtt is not None else self.short_rtt)
+                if started >= self.decreased_at:
+                    self.decreases += 1
+                    self.decreased_at = now
+                    self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+            elif rtt is not None:
+                self._adapt(rtt, in_flight)
+            self.cond.notify_all()
+
+    def _adapt(self, rtt: float, in_flight: int):
+        self.samples += 1
+        if self.algorithm == 'aimd':
+            # Only grow when the limit is actually being used, not while the caller is idle
+            if in_flight * 2 >= self.limit:
+                self.limit = min(self.limit + 1.0 / self.limit, self.max_limit)
+            self.short_rtt += (rtt - self.short_rtt) * 0.1
+            return
+        now = time.monotonic()
+        if self.window_count == 0:
+            self.window_start = now
+        self.window_count += 1
+        self.window_sum += rtt
+        self.window_in_flight = max(self.window_in_flight, in_flight)
+        # Adapt once per round trip (and at least a few samples), not per call
+        if self.window_count < 4 or now - self.window_start < self.short_rtt:
+            return
+        average = self.window_sum / self.window_count
+        elapsed = now - self.window_start
+        app_limited = self.window_in_flight * 2 < self.limit
+        self.window_count, self.window_sum, self.window_in_flight = 0, 0.0, 0
+        self.short_rtt = average
+        # Baseline is the best round trip seen, drifting up ~1%/s so it can follow a slower network
+        self.long_rtt = average if not self.long_rtt else min(self.long_rtt * (1 + 0.01 * elapsed), average)
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / average))
+        limit = self.limit
+        target = limit * gradient + math.sqrt(limit)
+        if app_limited:
+            target = min(target, limit)
+        limit = limit * (1 - self.smoothing) + target * self.smoothing
+        self.limit = min(max(limit, self.min_limit), self.max_limit)
+
+    def snapshot(self) -> dict:
+        with self.cond:
+            return {
+                'target': self.name,
+                'algorithm': self.algorithm,
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'queue_depth': self.queue_depth,
+                'short_rtt': self.short_rtt,
+                'long_rtt': self.long_rtt,
+                'drops': self.drops,
+                'decreases': self.decreases,
+                'rejected': self.rejected,
+            }
+
+
+class _CallDetails(collections.namedtuple(
+        '_CallDetails', ('method', 'timeout', 'metadata', 'credentials', 'wait_for_ready', 'compression')),
+        grpc.ClientCallDetails):
+    pass
+
+
+class LimiterClientInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Gates unary calls on a sync channel through an AdaptiveLimiter.
+
+    The time spent queued for a slot is taken out of the call's timeout, and
+    a caller that cannot get a slot before its deadline gets LimiterRejected
+    (DEADLINE_EXCEEDED; RESOURCE_EXHAUSTED when the queue is full) without
+    the call being sent, so queueing never counts as server overload.
+    """
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self.limiter = limiter
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        timeout = client_call_details.timeout
+        queued = time.monotonic()
+        try:
+            self.limiter.acquire(timeout)
+        except LimiterRejected as e:
+            return e
+        start = time.monotonic()
+        if timeout is not None and start > queued:
+            remaining = timeout - (start - queued)
+            if remaining <= 0:
+                # Sent now it could only fail with DEADLINE_EXCEEDED, which would count as a drop
+                self.limiter.release()
+                self.limiter._reject()
+                return LimiterRejected(grpc.StatusCode.DEADLINE_EXCEEDED,
+                                       'Deadline expired waiting for a concurrency slot')
+            client_call_details = _CallDetails(
+                client_call_details.method, remaining, client_call_details.metadata,
+                client_call_details.credentials, getattr(client_call_details, 'wait_for_ready', None),
+                getattr(client_call_details, 'compression', None))
+        try:
+            call = continuation(client_call_details, request)
+        except BaseException:
+            self.limiter.release()
+            raise
+
+        def on_done(future):
+            self.limiter.release(time.monotonic() - start, future.code() in DROP_CODES)
+
+        call.add_done_callback(on_done)
+        return call
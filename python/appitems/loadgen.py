@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Load generator and latency benchmark for AppItemsService.
+
+Drives a weighted mix of the six RPCs either open-loop (fixed arrival rate,
+latency measured from the intended send time so a stalled server can't hide
+its queueing delay) or closed-loop (fixed number of callers each waiting for
+its previous response).  Prints throughput and latency percentiles as JSON.
+
+Usage:
+    python -m appitems.loadgen --target local --mode closed --concurrency 16 --duration 10
+    python -m appitems.loadgen --target localhost:9090 --mode open --rate 2000 \\
+        --mix GetAppItem=60,ListAppItems=20,UpdateAppItem=20 --tags 10 --description-size 1024
+
+`--target local` starts the in-process server from appitems.server so no
+external service is needed.
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.fixtures import make_appitem
+from appitems.interceptors import MetricsClientInterceptor, MetricsServerInterceptor
+from appitems.metrics import MetricsRegistry
+from appitems.server import OWNER_METADATA_KEY, start_local_server
+
+METHODS = ('CreateAppItem', 'GetAppItems', 'ListAppItems', 'GetAppItem', 'DeleteAppItem', 'UpdateAppItem')
+
+DEFAULT_MIX = {
+    'GetAppItem': 40,
+    'GetAppItems': 15,
+    'ListAppItems': 15,
+    'UpdateAppItem': 15,
+    'CreateAppItem': 10,
+    'DeleteAppItem': 5,
+}
+
+PERCENTILES = (('p50', 50.0), ('p90', 90.0), ('p99', 99.0), ('p999', 99.9))
+
+
+@dataclass
+class LoadConfig:
+    target: str = 'local'
+    mode: str = 'closed'  # 'open' (fixed rate) or 'closed' (fixed concurrency)
+    rate: float = 500.0  # requests/sec in open-loop mode
+    concurrency: int = 8  # callers in closed-loop mode
+    duration: float = 10.0  # seconds of measured load
+    warmup: float = 1.0  # seconds of unmeasured load before `duration`
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    num_tags: int = 5
+    tag_size: int = 8
+    description_size: int = 256
+    seed_items: int = 1000
+    num_owners: int = 10
+    batch_size: int = 20  # ids per GetAppItems call
+    page_size: int = 20  # page size for ListAppItems
+    timeout: float = 5.0  # per-call deadline in seconds
+    server_workers: int = 16  # thread pool size for --target local
+    seed: int = 0
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse 'GetAppItem=60,ListAppItems=40' into a weight map"""
+    mix = {}
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in METHODS:
+            raise ValueError(f"Unknown method in mix: {name} (expected one of {', '.join(METHODS)})")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError(f'Mix must have at least one positive weight: {spec!r}')
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds for a list of durations in seconds"""
+    values = sorted(latencies)
+    summary = {name: round(percentile(values, pct) * 1000, 3) for name, pct in PERCENTILES}
+    summary['mean'] = round(sum(values) / len(values) * 1000, 3) if values else 0.0
+    summary['max'] = round(values[-1] * 1000, 3) if values else 0.0
+    return summary
+
+
+class IdPool:
+    """Thread-safe set of known item ids with O(1) random pick and removal"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, item_id: str):
+        with self.lock:
+            if item_id and item_id not in self.index:
+                self.index[item_id] = len(self.ids)
+                self.ids.append(item_id)
+
+    def sample(self, rng: random.Random, count: int = 1) -> List[str]:
+        with self.lock:
+            if not self.ids:
+                return [f'missing-{rng.getrandbits(32):08x}' for _ in range(count)]
+            return [self.ids[rng.randrange(len(self.ids))] for _ in range(count)]
+
+    def take(self, rng: random.Random) -> str:
+        """Remove and return a random id (or a non-existent one if empty)"""
+        with self.lock:
+            if not self.ids:
+                return f'missing-{rng.getrandbits(32):08x}'
+            pos = rng.randrange(len(self.ids))
+            item_id = self.ids[pos]
+            last = self.ids.pop()
+            if last != item_id:
+                self.ids[pos] = last
+                self.index[last] = pos
+            del self.index[item_id]
+            return item_id
+
+
+class Recorder:
+    """Collects per-method latencies and status codes once warmup is over"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.measuring = False
+        self.started: Optional[float] = None
+
+    def start(self):
+        """Begin recording (end of warmup)"""
+        self.started = time.perf_counter()
+        self.measuring = True
+
+    def elapsed(self) -> float:
+        """Wall time since recording began"""
+        return time.perf_counter() - self.started if self.started is not None else 0.0
+
+    def record(self, method: str, latency: float, status: grpc.StatusCode):
+        if not self.measuring:
+            return
+        with self.lock:
+            self.latencies[method].append(latency)
+            self.statuses[method][status.name] += 1
+
+
+class RequestFactory:
+    """Builds (method, request, metadata, on_success) tuples following the configured mix"""
+
+    def __init__(self, config: LoadConfig, pool: IdPool):
+        self.config = config
+        self.pool = pool
+        self.methods = list(config.mix.keys())
+        self.weights = list(config.mix.values())
+        self.owners = [f'owner-{i}' for i in range(max(config.num_owners, 1))]
+
+    def new_item(self, rng: random.Random, item_id: str = '') -> models_pb2.AppItem:
+        cfg = self.config
+        return make_appitem(rng, num_tags=cfg.num_tags, tag_size=cfg.tag_size,
+                            description_size=cfg.description_size, item_id=item_id)
+
+    def next(self, rng: random.Random) -> Tuple[str, object, tuple, Optional[Callable]]:
+        method = rng.choices(self.methods, self.weights)[0]
+        metadata = ()
+        on_success = None
+        if method == 'CreateAppItem':
+            request = appitems_pb2.CreateAppItemRequest(appitem=self.new_item(rng))
+            metadata = ((OWNER_METADATA_KEY, rng.choice(self.owners)),)
+            on_success = lambda resp: self.pool.add(resp.appitem.id)
+        elif method == 'GetAppItems':
+            request = appitems_pb2.GetAppItemsRequest(ids=self.pool.sample(rng, self.config.batch_size))
+        elif method == 'ListAppItems':
+            request = appitems_pb2.ListAppItemsRequest(owner_id=rng.choice(self.owners + ['']))
+            request.pagination.page_size = self.config.page_size
+        elif method == 'GetAppItem':
+            request = appitems_pb2.GetAppItemRequest(id=self.pool.sample(rng)[0])
+        elif method == 'DeleteAppItem':
+            request = appitems_pb2.DeleteAppItemRequest(id=self.pool.take(rng))
+        else:
+            request = appitems_pb2.UpdateAppItemRequest(appitem=self.new_item(rng, self.pool.sample(rng)[0]))
+        return method, request, metadata, on_success
+
+
+def seed_items(stub: appitems_pb2_grpc.AppItemsServiceStub, factory: RequestFactory, pool: IdPool,
+               config: LoadConfig):
+    """Create `seed_items` items so reads have something to hit"""
+    rng = random.Random(config.seed ^ 0x5EED)
+    for _ in range(config.seed_items):
+        metadata = ((OWNER_METADATA_KEY, rng.choice(factory.owners)),)
+        resp = stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=factory.new_item(rng)),
+                                  timeout=config.timeout, metadata=metadata)
+        pool.add(resp.appitem.id)
+
+
+def run_closed_loop(stub, factory: RequestFactory, recorder: Recorder, config: LoadConfig, stop_at: float):
+    """`concurrency` threads each issuing the next call as soon as the previous returns"""
+
+    def worker(worker_id: int):
+        rng = random.Random(config.seed * 1000003 + worker_id)
+        while time.perf_counter() < stop_at:
+            method, request, metadata, on_success = factory.next(rng)
+            start = time.perf_counter()
+            try:
+                resp = getattr(stub, method)(request, timeout=config.timeout, metadata=metadata)
+                status = grpc.StatusCode.OK
+            except grpc.RpcError as e:
+                resp, status = None, e.code()
+            recorder.record(method, time.perf_counter() - start, status)
+            if resp is not None and on_success:
+                on_success(resp)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(config.concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def run_open_loop(stub, factory: RequestFactory, recorder: Recorder, config: LoadConfig, stop_at: float):
+    """Issue calls at fixed intervals regardless of how many are still in flight"""
+    rng = random.Random(config.seed)
+    interval = 1.0 / config.rate
+    outstanding = threading.Semaphore(0)
+    issued = 0
+    next_send = time.perf_counter()
+
+    def on_done(future, method, intended, on_success):
+        try:
+            resp = future.result()
+            status = grpc.StatusCode.OK
+        except grpc.RpcError as e:
+            resp, status = None, e.code()
+        recorder.record(method, time.perf_counter() - intended, status)
+        if resp is not None and on_success:
+            on_success(resp)
+        outstanding.release()
+
+    while next_send < stop_at:
+        delay = next_send - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        method, request, metadata, on_success = factory.next(rng)
+        future = getattr(stub, method).future(request, timeout=config.timeout, metadata=metadata)
+        future.add_done_callback(lambda f, m=method, t=next_send, cb=on_success: on_done(f, m, t, cb))
+        issued += 1
+        next_send += interval
+
+    for _ in range(issued):
+        outstanding.acquire(timeout=config.timeout + 1)
+
+
+def build_report(recorder: Recorder, config: LoadConfig, elapsed: float) -> dict:
+    all_latencies: List[float] = []
+    all_statuses: Counter = Counter()
+    methods = {}
+    for method in METHODS:
+        latencies = recorder.latencies.get(method)
+        if not latencies:
+            continue
+        statuses = recorder.statuses[method]
+        all_latencies.extend(latencies)
+        all_statuses.update(statuses)
+        methods[method] = {
+            'requests': len(latencies),
+            'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            'latency_ms': latency_summary(latencies),
+            'status': dict(statuses),
+        }
+    total = len(all_latencies)
+    return {
+        'target': config.target,
+        'mode': config.mode,
+        'rate': config.rate if config.mode == 'open' else None,
+        'concurrency': config.concurrency if config.mode == 'closed' else None,
+        'duration_s': round(elapsed, 3),
+        'requests': total,
+        'errors': total - all_statuses.get('OK', 0),
+        'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+        'latency_ms': latency_summary(all_latencies),
+        'status': dict(all_statuses),
+        'methods': methods,
+    }
+
+
+def run_load(config: LoadConfig, channel: Optional[grpc.Channel] = None,
+             registry: Optional[MetricsRegistry] = None) -> dict:
+    """Run a load test and return the report dict.
+
+    If `registry` is given, client (and for --target local, server) RPC
+    metrics are recorded into it as well.
+    """
+    if config.mode not in ('open', 'closed'):
+        raise ValueError(f'Unknown mode: {config.mode}')
+    server = None
+    if channel is None:
+        target = config.target
+        if target == 'local':
+            interceptors = [MetricsServerInterceptor(registry)] if registry is not None else []
+            server, target = start_local_server(max_workers=config.server_workers, interceptors=interceptors)
+        channel = grpc.insecure_channel(target)
+    if registry is not None:
+        channel = grpc.intercept_channel(channel, MetricsClientInterceptor(registry))
+    try:
+        stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+        pool = IdPool()
+        factory = RequestFactory(config, pool)
+        recorder = Recorder()
+        seed_items(stub, factory, pool, config)
+
+        runner = run_open_loop if config.mode == 'open' else run_closed_loop
+        stop_at = time.perf_counter() + config.warmup + config.duration
+
+        timer = threading.Timer(config.warmup, recorder.start)
+        if config.warmup <= 0:
+            recorder.start()
+        else:
+            timer.start()
+        runner(stub, factory, recorder, config, stop_at)
+        timer.cancel()
+        # Measured, not configured: includes draining the calls still in flight at stop_at
+        return build_report(recorder, config, recorder.elapsed())
+    finally:
+        channel.close()
+        if server is not None:
+            server.stop(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='AppItemsService load generator',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Methods: {', '.join(METHODS)}
+
+Examples:
+  # Fixed concurrency against an in-process server
+  python -m appitems.loadgen --target local --mode closed --concurrency 32
+
+  # Fixed rate against a running server, read heavy
+  python -m appitems.loadgen --target localhost:9090 --mode open --rate 1000 \\
+    --mix GetAppItem=70,ListAppItems=30
+        """
+    )
+    defaults = LoadConfig()
+    parser.add_argument('--target', default=defaults.target, help="host:port to dial, or 'local' for an in-process server")
+    parser.add_argument('--mode', choices=('open', 'closed'), default=defaults.mode, help='open = fixed rate, closed = fixed concurrency')
+    parser.add_argument('--rate', type=float, default=defaults.rate, help='Requests/sec in open-loop mode')
+    parser.add_argument('--concurrency', type=int, default=defaults.concurrency, help='Concurrent callers in closed-loop mode')
+    parser.add_argument('--duration', type=float, default=defaults.duration, help='Seconds of measured load')
+    parser.add_argument('--warmup', type=float, default=defaults.warmup, help='Seconds of unmeasured load first')
+    parser.add_argument('--mix', type=parse_mix, default=defaults.mix, help='Weighted RPC mix, eg GetAppItem=60,ListAppItems=40')
+    parser.add_argument('--tags', type=int, default=defaults.num_tags, help='Tags per generated AppItem')
+    parser.add_argument('--tag-size', type=int, default=defaults.tag_size, help='Characters per tag')
+    parser.add_argument('--description-size', type=int, default=defaults.description_size, help='Characters per description')
+    parser.add_argument('--seed-items', type=int, default=defaults.seed_items, help='Items created before the run')
+    parser.add_argument('--batch-size', type=int, default=defaults.batch_size, help='IDs per GetAppItems call')
+    parser.add_argument('--page-size', type=int, default=defaults.page_size, help='Page size for ListAppItems')
+    parser.add_argument('--timeout', type=float, default=defaults.timeout, help='Per-call deadline in seconds')
+    parser.add_argument('--server-workers', type=int, default=defaults.server_workers, help='Thread pool size for --target local')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='Random seed')
+    parser.add_argument('--out', help='Also write the JSON report to this file')
+    parser.add_argument('--metrics-out', help='Write per-method RPC metrics here (.json, otherwise Prometheus text)')
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        target=args.target, mode=args.mode, rate=args.rate, concurrency=args.concurrency,
+        duration=args.duration, warmup=args.warmup, mix=args.mix, num_tags=args.tags,
+        tag_size=args.tag_size, description_size=args.description_size, seed_items=args.seed_items,
+        batch_size=args.batch_size, page_size=args.page_size, timeout=args.timeout,
+        server_workers=args.server_workers, seed=args.seed,
+    )
+    registry = MetricsRegistry() if args.metrics_out else None
+    report = run_load(config, registry=registry)
+    if registry is not None:
+        registry.dump(args.metrics_out)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+"""
+Low-overhead RPC metrics: log-bucketed histograms and status counters.
+
+A MetricsRegistry keeps, per (side, service, method):
+    - a latency histogram (seconds)
+    - request/response size histograms (bytes)
+    - a counter per gRPC status code
+
+plus free-form labelled counters (`increment`) for client behaviour such as
+hedges and retries, and gauges read from a callback at scrape time
+(`register_gauge`).
+
+Metrics can be scraped as Prometheus text from a local HTTP endpoint
+(`serve_metrics`) or written to a file (`MetricsRegistry.dump`).  The
+interceptors in appitems.interceptors feed a registry.
+"""
+
+import bisect
+import json
+import math
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Latency buckets grow by sqrt(2) from 10us to ~170s, sizes by 2x from 16B to 64MB
+LATENCY_BUCKETS = tuple(1e-5 * 2 ** (i / 2) for i in range(49))
+SIZE_BUCKETS = tuple(float(16 * 2 ** i) for i in range(23))
+
+
+class LogHistogram:
+    """Fixed log-spaced bucket histogram.
+
+    Recording is a bisect plus two additions under a lock.  Percentiles are
+    estimated by interpolating within the matching bucket, so relative error
+    is bounded by the bucket growth factor.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, value: float):
+        idx = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[idx] += 1
+            self.total += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, pct: float) -> float:
+        """Estimated value at percentile `pct` (0-100)"""
+        with self.lock:
+            counts = list(self.counts)
+            total = self.total
+            max_value = self.max
+        if total == 0:
+            return 0.0
+        target = pct / 100.0 * total
+        seen = 0
+        for idx, count in enumerate(counts):
+            if count and seen + count >= target:
+                lower = self.bounds[idx - 1] if idx > 0 else 0.0
+                upper = self.bounds[idx] if idx < len(self.bounds) else max_value
+                return min(lower + (upper - lower) * (target - seen) / count, max_value)
+            seen += count
+        return max_value
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'count': self.total,
+            'sum': self.sum,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+        }
+
+
+class MethodMetrics:
+    """All metrics for one RPC method on one side (client or server)"""
+
+    def __init__(self):
+        self.latency = LogHistogram(LATENCY_BUCKETS)
+        self.request_bytes = LogHistogram(SIZE_BUCKETS)
+        self.response_bytes = LogHistogram(SIZE_BUCKETS)
+        self.statuses: Counter = Counter()
+        self.lock = threading.Lock()
+
+    def observe(self, status: str, seconds: float, request_bytes: Optional[int], response_bytes: Optional[int]):
+        self.latency.record(seconds)
+        if request_bytes is not None:
+            self.request_bytes.record(request_bytes)
+        if response_bytes is not None:
+            self.response_bytes.record(response_bytes)
+        with self.lock:
+            self.statuses[status] += 1
+
+
+def split_method(full_method: str) -> Tuple[str, str]:
+    """'/apptemplate.v1.AppItemsService/GetAppItem' -> ('apptemplate.v1.AppItemsService', 'GetAppItem')"""
+    service, _, method = full_method.lstrip('/').rpartition('/')
+    return service, method
+
+
+class MetricsRegistry:
+    """Collection of per-method metrics keyed by (side, service, method)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.methods: Dict[Tuple[str, str, str], MethodMetrics] = {}
+        self.counters: Counter = Counter()
+        self.gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Callable[[], float]] = {}
+        self.help: Dict[str, str] = {}
+
+    def method(self, side: str, full_method: str) -> MethodMetrics:
+        service, method = split_method(full_method)
+        key = (side, service, method)
+        metrics = self.methods.get(key)
+        if metrics is None:
+            with self.lock:
+                metrics = self.methods.setdefault(key, MethodMetrics())
+        return metrics
+
+    def observe(self, side: str, full_method: str, status: str, seconds: float,
+                request_bytes: Optional[int] = None, response_bytes: Optional[int] = None):
+        self.method(side, full_method).observe(status, seconds, request_bytes, response_bytes)
+
+    def increment(self, name: str, labels: Optional[Dict[str, str]] = None, value: float = 1,
+                  help_text: str = ''):
+        """Add `value` to the counter `name` with the given labels"""
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self.lock:
+            self.counters[key] += value
+            if help_text:
+                self.help.setdefault(name, help_text)
+
+    def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
+        """Current value of a counter; without labels, the sum over all label sets"""
+        with self.lock:
+            if labels is None:
+                return sum(v for (n, _), v in self.counters.items() if n == name)
+            return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def register_gauge(self, name: str, read: Callable[[], float], labels: Optional[Dict[str, str]] = None,
+                       help_text: str = ''):
+        """Expose `read()` as gauge `name`; it is called whenever metrics are rendered"""
+        with self.lock:
+            self.gauges[(name, tuple(sorted((labels or {}).items())))] = read
+            if help_text:
+                self.help.setdefault(name, help_text)
+
+    def _read_gauges(self) -> List[Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], float]]:
+        with self.lock:
+            gauges = sorted(self.gauges.items())
+        return [(key, read()) for key, read in gauges]
+
+    def snapshot(self) -> dict:
+        """Plain dict view of every method's metrics (for JSON dumps)"""
+        with self.lock:
+            items = sorted(self.methods.items())
+            counters = sorted(self.counters.items())
+        out = {}
+        for (side, service, method), metrics in items:
+            with metrics.lock:
+                statuses = dict(metrics.statuses)
+            out.setdefault(side, {})[f'{service}/{method}'] = {
+                'latency_seconds': metrics.latency.snapshot(),
+                'request_bytes': metrics.request_bytes.snapshot(),
+                'response_bytes': metrics.response_bytes.snapshot(),
+                'status': statuses,
+            }
+        for (name, labels), value in counters:
+            out.setdefault('counters', {})[name + _format_labels(labels)] = value
+        for (name, labels), value in self._read_gauges():
+            out.setdefault('gauges', {})[name + _format_labels(labels)] = value
+        return out
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        with self.lock:
+            items = sorted(self.methods.items())
+            counters = sorted(self.counters.items())
+            help_texts = dict(self.help)
+        families = (
+            ('handled_total', 'counter', 'Total RPCs completed, by status code.'),
+            ('handling_seconds', 'histogram', 'RPC latency in seconds.'),
+            ('msg_received_bytes', 'histogram', 'Serialized size of request messages.'),
+            ('msg_sent_bytes', 'histogram', 'Serialized size of response messages.'),
+        )
+        lines: List[str] = []
+        for side in sorted({key[0] for key, _ in items}):
+            side_items = [(key, m) for key, m in items if key[0] == side]
+            for suffix, kind, help_text in families:
+                name = f'grpc_{side}_{suffix}'
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for (_, service, method), metrics in side_items:
+                    labels = f'grpc_service="{service}",grpc_method="{method}"'
+                    if suffix == 'handled_total':
+                        with metrics.lock:
+                            statuses = sorted(metrics.statuses.items())
+                        for code, count in statuses:
+                            lines.append(f'{name}{{{labels},grpc_code="{code}"}} {count}')
+                        continue
+                    hist = {
+                        'handling_seconds': metrics.latency,
+                        # Client side sends requests, server side receives them
+                        'msg_received_bytes': metrics.response_bytes if side == 'client' else metrics.request_bytes,
+                        'msg_sent_bytes': metrics.request_bytes if side == 'client' else metrics.response_bytes,
+                    }[suffix]
+                    lines.extend(_histogram_lines(name, labels, hist))
+        for kind, values in (('counter', counters), ('gauge', self._read_gauges())):
+            last_name = None
+            for (name, labels), value in values:
+                if name != last_name:
+                    if name in help_texts:
+                        lines.append(f'# HELP {name} {help_texts[name]}')
+                    lines.append(f'# TYPE {name} {kind}')
+                    last_name = name
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str):
+        """Write metrics to `path` - JSON if it ends in .json, Prometheus text otherwise"""
+        if path.endswith('.json'):
+            content = json.dumps(self.snapshot(), indent=2) + '\n'
+        else:
+            content = self.render_prometheus()
+        with open(path, 'w') as f:
+            f.write(content)
+
+
+def _histogram_lines(name: str, labels: str, hist: LogHistogram) -> List[str]:
+    with hist.lock:
+        counts = list(hist.counts)
+        total = hist.total
+        total_sum = hist.sum
+    lines = []
+    cumulative = 0
+    for bound, count in zip(hist.bounds, counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {total}')
+    lines.append(f'{name}_sum{{{labels}}} {total_sum}')
+    lines.append(f'{name}_count{{{labels}}} {total}')
+    return lines
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels) + '}'
+
+
+def _format_bound(bound: float) -> str:
+    if bound == math.floor(bound) and bound >= 1:
+        return str(int(bound))
+    return f'{bound:.6g}'
+
+
+def serve_metrics(registry: MetricsRegistry, port: int = 9464, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Serve `registry` as Prometheus text on http://host:port/metrics from a daemon thread.
+
+    Call `.shutdown()` on the returned server to stop it.  Port 0 picks a
+    free port (see `.server_address`).
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, name='metrics-http', daemon=True).start()
+    return httpd
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Multi-process AppItemsService server: N forked workers on one port.
+
+A single Python gRPC server is held to about one core by the GIL.  The
+launcher forks `workers` processes that each run their own grpc.server and
+servicer and listen on the same address with SO_REUSEPORT, so the kernel
+spreads incoming connections across them:
+
+    python -m appitems.multiproc --address 0.0.0.0:9090 --workers 4 --snapshot catalog.pb
+
+`--snapshot` takes a file written by appitems.export.  The launcher loads
+it into one AppItemStore and freezes it out of the cyclic GC before forking,
+so the workers start sharing its pages copy-on-write and collections in the
+workers do not write to (and so copy) them.  Reference count updates still
+dirty the pages of every object a worker reads, so the shared memory
+shrinks as the workers serve.
+
+Once forked, each worker's store is its own, so a write would only change
+the copy of the worker that handled it.  With more than one worker the pool
+therefore serves read-only (write RPCs fail with FAILED_PRECONDITION) and
+needs a snapshot to serve anything; the data changes by exporting a new
+snapshot and restarting.  A single worker serves reads and writes.
+
+Signals to the launcher:
+    SIGTERM / SIGINT  drain: workers stop accepting calls, finish in-flight ones, exit
+    SIGHUP            rolling restart, one worker at a time
+
+Workers that die are restarted, after a growing delay when they keep dying
+soon after starting; a worker that crashes `max_crashes` times in a row
+stops the pool with CrashLoop.  Every `--report-interval` seconds the
+launcher prints per-worker requests/sec, errors and calls in flight as JSON.
+
+Connections (not calls) are balanced, and grpc channels with the same
+target share one connection.  Clients need several channels - created
+with the `grpc.use_local_subchannel_pool` option - to reach every worker.
+Load balancing via SO_REUSEPORT needs Linux.
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent import futures
+from typing import Callable, List, Optional, Tuple
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2_grpc
+
+from appitems.store import AppItemStore
+
+# RPCs refused by workers of a read-only pool
+WRITE_METHODS = ('CreateAppItem', 'CreateAppItems', 'UpdateAppItem', 'DeleteAppItem')
+
+# Per-worker slots in the shared stats array
+STAT_FIELDS = ('pid', 'requests', 'errors', 'in_flight', 'started_at')
+_PID, _REQUESTS, _ERRORS, _IN_FLIGHT, _STARTED_AT = range(len(STAT_FIELDS))
+
+# A worker exiting sooner than this after its start counts as a crash; the
+# delay before restarting it doubles per crash in a row, up to the maximum
+STABLE_UPTIME = 10.0
+DEFAULT_RESTART_BACKOFF = 0.5
+MAX_RESTART_BACKOFF = 30.0
+DEFAULT_MAX_CRASHES = 5
+
+
+class CrashLoop(RuntimeError):
+    """A worker kept dying right after starting"""
+
+
+def load_snapshot(path: str, store: Optional[AppItemStore] = None) -> AppItemStore:
+    """Load an appitems.export file into a store"""
+    from appitems.export import read_items
+
+    store = store if store is not None else AppItemStore()
+    for item in read_items(path):
+        store.insert(item, '')
+    return store
+
+
+def reserve_port(address: str) -> Tuple[socket.socket, str]:
+    """Bind (without listening) a SO_REUSEPORT socket so port 0 resolves once for every worker"""
+    host, _, port = address.rpartition(':')
+    host = host.strip('[]') or '0.0.0.0'
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, int(port)))
+    bound = sock.getsockname()[1]
+    return sock, f"{address.rpartition(':')[0]}:{bound}"
+
+
+class _LoadInterceptor(grpc.ServerInterceptor):
+    """Counts calls of one worker into its slot of the shared stats array"""
+
+    def __init__(self, stats, index: int):
+        self.stats = stats
+        self.base = index * len(STAT_FIELDS)
+        self.lock = threading.Lock()
+
+    def _add(self, field: int, value: int):
+        with self.lock:
+            self.stats[self.base + field] += value
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        inner = handler.unary_unary
+
+        def counted(request, context):
+            self._add(_IN_FLIGHT, 1)
+            try:
+                return inner(request, context)
+            except BaseException:
+                self._add(_ERRORS, 1)
+                raise
+            finally:
+                with self.lock:
+                    self.stats[self.base + _IN_FLIGHT] -= 1
+                    self.stats[self.base + _REQUESTS] += 1
+
+        return grpc.unary_unary_rpc_method_handler(
+            counted, request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer)
+
+
+class _ReadOnlyInterceptor(grpc.ServerInterceptor):
+    """Rejects write RPCs, which would only change the calling worker's copy of the store"""
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler_call_details.method.rpartition('/')[2] not in WRITE_METHODS:
+            return handler
+
+        def reject(request, context):
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                          'Read-only: this server runs several worker processes, each with its own copy of the items')
+
+        if handler.request_streaming:
+            return grpc.stream_unary_rpc_method_handler(
+                reject, request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer)
+        return grpc.unary_unary_rpc_method_handler(
+            reject, request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer)
+
+
+def _run_worker(index: int, address: str, store: Optional[AppItemStore], stats, max_threads: int,
+                grace: float, read_only: bool):
+    from appitems.server import AppItemsHandler, InMemoryAppItemsService
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+    base = index * len(STAT_FIELDS)
+    stats[base + _PID] = os.getpid()
+    stats[base + _IN_FLIGHT] = 0
+    stats[base + _STARTED_AT] = time.time()
+
+    interceptors = [_LoadInterceptor(stats, index)]
+    if read_only:
+        interceptors.append(_ReadOnlyInterceptor())
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_threads), interceptors=interceptors,
+                         options=[('grpc.so_reuseport', 1)])
+    appitems_pb2_grpc.add_AppItemsServiceServicer_to_server(
+        InMemoryAppItemsService(AppItemsHandler(store if store is not None else AppItemStore())), server)
+    server.add_insecure_port(address)
+    server.start()
+    stopping.wait()
+    # Stop accepting new calls and give in-flight ones `grace` seconds to finish
+    server.stop(grace).wait()
+
+
+class WorkerPool:
+    """Forks and supervises the worker processes.
+
+    Workers are always forked: the preloaded store is shared with them
+    copy-on-write through fork, which spawn or forkserver would replace by a
+    pickled copy per worker.  A pool of more than one worker is read-only and
+    needs a `store`.
+    """
+
+    def __init__(self, address: str = '127.0.0.1:9090', workers: int = 0, store: Optional[AppItemStore] = None,
+                 max_threads: int = 16, grace: float = 10.0, restart_backoff: float = DEFAULT_RESTART_BACKOFF,
+                 max_crashes: int = DEFAULT_MAX_CRASHES):
+        self.address = address
+        self.num_workers = workers or os.cpu_count() or 1
+        self.read_only = self.num_workers > 1
+        if self.read_only and store is None:
+            raise ValueError(f'{self.num_workers} workers would each start with their own empty store: '
+                             'pass a snapshot store (served read-only) or use a single worker')
+        self.store = store
+        self.max_threads = max_threads
+        self.grace = grace
+        self.context = multiprocessing.get_context('fork')
+        self.stats = self.context.RawArray('d', self.num_workers * len(STAT_FIELDS))
+        self.processes: List[Optional[multiprocessing.process.BaseProcess]] = [None] * self.num_workers
+        self.restarts = 0
+        self.restart_backoff = restart_backoff
+        self.max_crashes = max_crashes
+        # Per worker: when it was started, crashes in a row, and when a dead one may be restarted
+        self.started: List[float] = [0.0] * self.num_workers
+        self.crashes: List[int] = [0] * self.num_workers
+        self.respawn_at: List[Optional[float]] = [None] * self.num_workers
+        self.target = ''
+        self._socket: Optional[socket.socket] = None
+        self._last_report = (time.monotonic(), [0.0] * self.num_workers)
+
+    def start(self) -> str:
+        """Start all workers, returns the host:port they listen on"""
+        self._socket, self.target = reserve_port(self.address)
+        if self.store is not None:
+            # Keep GC passes in the workers from writing to (and so copying) the preloaded objects
+            gc.collect()
+            gc.freeze()
+        for index in range(self.num_workers):
+            self._spawn(index)
+        return self.target
+
+    def _spawn(self, index: int):
+        process = self.context.Process(
+            target=_run_worker, name=f'appitems-worker-{index}',
+            args=(index, self.target, self.store, self.stats, self.max_threads, self.grace, self.read_only),
+            daemon=False)
+        process.start()
+        self.processes[index] = process
+        self.started[index] = time.monotonic()
+        self.respawn_at[index] = None
+
+    def _drain(self, index: int, timeout: Optional[float] = None):
+        process = self.processes[index]
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()     # SIGTERM -> graceful stop in the worker
+        process.join(timeout if timeout is not None else self.grace + 5)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        self.processes[index] = None
+
+    def restart(self):
+        """Rolling restart: drain and replace one worker at a time, the rest keep serving"""
+        for index in range(self.num_workers):
+            self._drain(index)
+            self._spawn(index)
+            self.restarts += 1
+
+    def reap(self) -> int:
+        """Restart workers that exited on their own, returns how many were restarted.
+
+        A worker that dies within STABLE_UPTIME of starting is restarted after
+        a delay doubling per crash in a row; CrashLoop is raised once it has
+        crashed `max_crashes` times in a row.
+        """
+        now = time.monotonic()
+        for index, process in enumerate(self.processes):
+            if process is not None and not process.is_alive():
+                process.join()
+                self.processes[index] = None
+                if now - self.started[index] < STABLE_UPTIME:
+                    self.crashes[index] += 1
+                else:
+                    self.crashes[index] = 0
+                if self.crashes[index] >= self.max_crashes:
+                    raise CrashLoop(f'Worker {index} exited with code {process.exitcode} '
+                                    f'{self.crashes[index]} times in a row within {STABLE_UPTIME:g}s of starting')
+                delay = self.restart_backoff * 2 ** (self.crashes[index] - 1) if self.crashes[index] else 0.0
+                self.respawn_at[index] = now + min(delay, MAX_RESTART_BACKOFF)
+        restarted = 0
+        for index, respawn_at in enumerate(self.respawn_at):
+            if respawn_at is not None and now >= respawn_at:
+                self._spawn(index)
+                self.restarts += 1
+                restarted += 1
+        return restarted
+
+    def stop(self):
+        """Drain every worker concurrently and release the port"""
+        self.respawn_at = [None] * self.num_workers
+        for process in self.processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for index in range(self.num_workers):
+            self._drain(index)
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def load_report(self) -> dict:
+        """Per-worker load since the previous report"""
+        now = time.monotonic()
+        last_time, last_requests = self._last_report
+        elapsed = max(now - last_time, 1e-9)
+        width = len(STAT_FIELDS)
+        workers, requests = [], []
+        for index in range(self.num_workers):
+            slot = self.stats[index * width:(index + 1) * width]
+            requests.append(slot[_REQUESTS])
+            process = self.processes[index]
+            workers.append({
+                'worker': index,
+                'pid': int(slot[_PID]),
+                'alive': bool(process is not None and process.is_alive()),
+                'requests': int(slot[_REQUESTS]),
+                'errors': int(slot[_ERRORS]),
+                'in_flight': int(slot[_IN_FLIGHT]),
+                'requests_per_sec': round((slot[_REQUESTS] - last_requests[index]) / elapsed, 1),
+            })
+        self._last_report = (now, requests)
+        return {
+            'target': self.target,
+            'restarts': self.restarts,
+            'requests_per_sec': round(sum(w['requests_per_sec'] for w in workers), 1),
+            'workers': workers,
+        }
+
+    def supervise(self, report_interval: float = 0.0, report: Callable[[dict], None] = None):
+        """Run until SIGTERM/SIGINT (drain) handling SIGHUP (rolling restart) and dead workers"""
+        report = report or (lambda r: print(json.dumps(r), flush=True))
+        requests = {'stop': False, 'restart': False}
+
+        def request(kind):
+            return lambda *_: requests.__setitem__(kind, True)
+
+        signal.signal(signal.SIGTERM, request('stop'))
+        signal.signal(signal.SIGINT, request('stop'))
+        signal.signal(signal.SIGHUP, request('restart'))
+        next_report = time.monotonic() + report_interval
+        try:
+            while not requests['stop']:
+                time.sleep(0.2)
+                if requests['restart']:
+                    requests['restart'] = False
+                    self.restart()
+                self.reap()
+                if report_interval and time.monotonic() >= next_report:
+                    report(self.load_report())
+                    next_report += report_interval
+        finally:
+            self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Multi-process AppItemsService server (SO_REUSEPORT workers)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m appitems.multiproc --address 0.0.0.0:9090 --workers 4 --snapshot catalog.pb
+  python -m appitems.multiproc --workers 8 --snapshot catalog.pb --report-interval 5
+  python -m appitems.multiproc --workers 1     # single worker, reads and writes
+  kill -HUP <launcher pid>    # rolling restart
+        """
+    )
+    parser.add_argument('--address', default='127.0.0.1:9090', help='host:port every worker listens on')
+    parser.add_argument('--workers', type=int, default=0, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--threads', type=int, default=16, help='Thread pool size per worker')
+    parser.add_argument('--snapshot', help='appitems.export file preloaded and shared by all workers (required with several)')
+    parser.add_argument('--grace', type=float, default=10.0, help='Seconds in-flight calls get to finish on drain')
+    parser.add_argument('--report-interval', type=float, default=0.0, help='Print per-worker load every N seconds')
+    args = parser.parse_args()
+
+    store = None
+    if args.snapshot:
+        started = time.perf_counter()
+        store = load_snapshot(args.snapshot)
+        print(f'📦 Loaded {len(store)} items from {args.snapshot} in {time.perf_counter() - started:.2f}s')
+    try:
+        pool = WorkerPool(args.address, args.workers, store, args.threads, args.grace)
+    except ValueError as e:
+        parser.error(str(e))
+    target = pool.start()
+    mode = ' (read-only)' if pool.read_only else ''
+    print(f'🚀 AppItemsService listening on {target} with {pool.num_workers} workers{mode} (pid {os.getpid()})',
+          flush=True)
+    try:
+        pool.supervise(args.report_interval)
+    except CrashLoop as e:
+        print(f'❌ {e}, stopped', file=sys.stderr)
+        sys.exit(1)
+    print('👋 Workers drained')
+
+
+if __name__ == '__main__':
+    main()
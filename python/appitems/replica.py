@@ -0,0 +1,156 @@
+"""
+Local AppItem replica kept current by the WatchAppItems change feed.
+
+A Replica holds a dict of the items a watch can see and follows the stream
+in a background thread, applying each event as it arrives instead of
+re-listing:
+
+    replica = Replica(appitems_pb2_grpc.AppItemsServiceStub(channel))
+    replica.start()
+    replica.wait_synced(timeout=10)
+    item = replica.get('some-id')
+    ...
+    replica.stop()
+
+The first connection asks for the current items (send_initial) and the
+replica becomes synced on the SYNCED event that follows them.  When the
+stream breaks, the follower reconnects from the cursor of the last event it
+applied, with jittered exponential backoff, so only the missed changes are
+sent.  If the server no longer has them (OUT_OF_RANGE, eg after a restart
+or a long disconnect) it starts over from a fresh snapshot, which replaces
+the local items in one step once complete.  Resyncs back off the same way,
+so a server that keeps rejecting cursors is not asked for a snapshot in a
+tight loop.
+"""
+
+import random
+import threading
+from typing import Callable, Dict, Optional
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.metrics import MetricsRegistry
+
+# Statuses after which the cursor is useless and the replica must resync: the
+# changes after it are gone (OUT_OF_RANGE), it is malformed (INVALID_ARGUMENT)
+# or the server cannot resume from it in its current state (FAILED_PRECONDITION)
+RESYNC_CODES = (grpc.StatusCode.OUT_OF_RANGE, grpc.StatusCode.INVALID_ARGUMENT,
+                grpc.StatusCode.FAILED_PRECONDITION)
+
+Event = appitems_pb2.AppItemEvent
+
+
+class Replica:
+    """Dict of AppItems following a WatchAppItems stream"""
+
+    def __init__(self, stub, owner_id: str = '', metadata=None, backoff: float = 0.1, max_backoff: float = 5.0,
+                 on_event: Optional[Callable[[appitems_pb2.AppItemEvent], None]] = None,
+                 registry: Optional[MetricsRegistry] = None):
+        self.stub = stub
+        self.owner_id = owner_id
+        self.metadata = metadata
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.on_event = on_event
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.lock = threading.Lock()
+        self.items: Dict[str, models_pb2.AppItem] = {}
+        self.cursor = ''
+        self.synced = False
+        self.connected = False
+        self.reconnects = 0
+        self.resyncs = 0
+        self._staging: Optional[Dict[str, models_pb2.AppItem]] = None
+        self._synced = threading.Event()
+        self._stopping = threading.Event()
+        self._call = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, item_id: str) -> Optional[models_pb2.AppItem]:
+        return self.items.get(item_id)
+
+    def apply(self, event: appitems_pb2.AppItemEvent):
+        """Apply one event from the stream"""
+        with self.lock:
+            # Initial items go to a staging dict so readers keep the previous copy until it is complete
+            items = self._staging if self._staging is not None else self.items
+            if event.type in (Event.TYPE_CREATED, Event.TYPE_UPDATED):
+                items[event.id] = event.appitem
+            elif event.type == Event.TYPE_DELETED:
+                items.pop(event.id, None)
+            elif event.type == Event.TYPE_SYNCED:
+                if self._staging is not None:
+                    self.items, self._staging = self._staging, None
+                self.synced = True
+                self._synced.set()
+            if event.cursor:
+                self.cursor = event.cursor
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def wait_synced(self, timeout: Optional[float] = None) -> bool:
+        """Block until the replica holds a complete copy, returns False on timeout"""
+        return self._synced.wait(timeout)
+
+    def start(self) -> 'Replica':
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._follow, name='appitems-replica', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        self._stopping.set()
+        call = self._call
+        if call is not None:
+            call.cancel()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _request(self) -> appitems_pb2.WatchAppItemsRequest:
+        with self.lock:
+            if self.cursor:
+                return appitems_pb2.WatchAppItemsRequest(cursor=self.cursor, owner_id=self.owner_id)
+            self._staging = {}
+        return appitems_pb2.WatchAppItemsRequest(send_initial=True, owner_id=self.owner_id)
+
+    def _count(self, name: str, help_text: str, code: Optional[grpc.StatusCode] = None):
+        labels = {'grpc_code': code.name} if code is not None else {}
+        self.registry.increment(name, labels, help_text=help_text)
+
+    def _follow(self):
+        failures = 0
+        while not self._stopping.is_set():
+            self._call = call = self.stub.WatchAppItems(self._request(), metadata=self.metadata)
+            if self._stopping.is_set():
+                call.cancel()
+            try:
+                for event in call:
+                    self.connected = True
+                    failures = 0
+                    self.apply(event)
+            except grpc.RpcError as e:
+                if self._stopping.is_set():
+                    break
+                code = e.code()
+                if code in RESYNC_CODES:
+                    with self.lock:
+                        self.cursor = ''
+                    self.resyncs += 1
+                    self._count('grpc_client_watch_resyncs_total', 'Watch restarts from a fresh snapshot', code)
+                else:
+                    self._count('grpc_client_watch_disconnects_total', 'Watch streams that ended with an error', code)
+            finally:
+                self.connected = False
+                self._call = None
+            # Stream ended (server shutdown or error): reconnect from the last cursor, or a snapshot after a resync
+            delay = min(self.max_backoff, self.backoff * 2 ** failures)
+            failures += 1
+            self.reconnects += 1
+            if self._stopping.wait(random.uniform(delay / 2, delay)):
+                break
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Serialization micro-benchmarks for AppItem messages.
+
+For every corpus shape (tag count, description length) and message type:
+
+    AppItem               one item per message
+    ListAppItemsResponse  `--batch` items as a repeated field
+    GetAppItemsResponse   the same items as a map<string, AppItem>
+
+it measures SerializeToString and FromString throughput, serialized bytes
+per item and the Python allocations (tracemalloc) left behind per parsed
+message.  Each protobuf backend runs in its own interpreter:
+
+    python -m appitems.serbench --backend upb --backend python --out serbench.json
+    python -m appitems.serbench --compare serbench.json   # relative change per case
+
+Saving a run before a proto change and comparing after makes the cost of
+the change visible.  tracemalloc only sees Python-level allocations; memory
+upb/cpp keep in their own arenas shows up in bytes per item only.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from google.protobuf import __version__ as protobuf_version
+from google.protobuf.internal import api_implementation
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.fixtures import make_appitem
+
+CORPORA: Dict[str, dict] = {
+    'minimal': dict(num_tags=0, tag_size=0, description_size=0),
+    'typical': dict(num_tags=5, tag_size=8, description_size=256),
+    'many_tags': dict(num_tags=100, tag_size=8, description_size=256),
+    'long_description': dict(num_tags=5, tag_size=8, description_size=16384),
+}
+MESSAGE_TYPES = ('AppItem', 'ListAppItemsResponse', 'GetAppItemsResponse')
+
+
+def make_items(count: int, seed: int = 0, **shape) -> List[models_pb2.AppItem]:
+    """Items as a server returns them: ids and both timestamps set"""
+    rng = random.Random(seed)
+    now = 1_700_000_000_000_000_000
+    items = []
+    for i in range(count):
+        item = make_appitem(rng, item_id=f'item-{i:06d}', **shape)
+        item.created_at.FromNanoseconds(now - rng.randrange(10 ** 15))
+        item.updated_at.FromNanoseconds(now - rng.randrange(10 ** 12))
+        items.append(item)
+    return items
+
+
+def build_messages(message_type: str, items: List[models_pb2.AppItem]) -> list:
+    if message_type == 'AppItem':
+        return list(items)
+    if message_type == 'ListAppItemsResponse':
+        resp = appitems_pb2.ListAppItemsResponse(items=items)
+        resp.pagination.total_results = len(items)
+        return [resp]
+    if message_type == 'GetAppItemsResponse':
+        resp = appitems_pb2.GetAppItemsResponse()
+        for item in items:
+            resp.appitems[item.id].CopyFrom(item)
+        return [resp]
+    raise ValueError(f'Unknown message type: {message_type}')
+
+
+def time_op(fn: Callable[[], None], min_seconds: float = 0.2, repeats: int = 3) -> float:
+    """Best seconds per call of `fn`, looping until each repeat lasts `min_seconds`"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_seconds / elapsed) + 1))
+    best = elapsed / loops
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def measure_allocations(fn: Callable[[], object], count: int = 50) -> Dict[str, float]:
+    """Python memory (bytes) and blocks still allocated per call of `fn` (results are kept alive)"""
+    results = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(count):
+            results.append(fn())
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    size = sum(s.size_diff for s in stats)
+    blocks = sum(s.count_diff for s in stats)
+    # The list holding the results is bookkeeping, not a cost of the message
+    size -= sys.getsizeof(results)
+    return {'bytes': size / count, 'blocks': blocks / count}
+
+
+def bench_case(message_type: str, items: List[models_pb2.AppItem], min_seconds: float) -> dict:
+    messages = build_messages(message_type, items)
+    cls = type(messages[0])
+    payloads = [m.SerializeToString() for m in messages]
+    total_bytes = sum(len(p) for p in payloads)
+
+    def serialize():
+        for message in messages:
+            message.SerializeToString()
+
+    def parse():
+        for payload in payloads:
+            cls.FromString(payload)
+
+    serialize_seconds = time_op(serialize, min_seconds)
+    parse_seconds = time_op(parse, min_seconds)
+    count = len(items)
+    alloc = measure_allocations(lambda: [cls.FromString(p) for p in payloads], max(1, 1000 // count))
+    return {
+        'message': message_type,
+        'items': count,
+        'bytes': total_bytes,
+        'bytes_per_item': round(total_bytes / count, 1),
+        'serialize': _throughput(serialize_seconds, count, total_bytes),
+        'parse': _throughput(parse_seconds, count, total_bytes),
+        'parse_alloc': {
+            'bytes_per_item': round(alloc['bytes'] / count, 1),
+            'blocks_per_item': round(alloc['blocks'] / count, 2),
+        },
+    }
+
+
+def _throughput(seconds: float, items: int, total_bytes: int) -> Dict[str, float]:
+    return {
+        'items_per_sec': round(items / seconds, 1),
+        'mb_per_sec': round(total_bytes / seconds / 1e6, 2),
+        'us_per_item': round(seconds / items * 1e6, 3),
+    }
+
+
+def run_benchmarks(batch: int = 100, corpora: Optional[List[str]] = None,
+                   message_types: Optional[List[str]] = None, min_seconds: float = 0.2) -> dict:
+    """All cases on the protobuf backend of this interpreter"""
+    results = []
+    for corpus in corpora or CORPORA:
+        items = make_items(batch, **CORPORA[corpus])
+        for message_type in message_types or MESSAGE_TYPES:
+            case = bench_case(message_type, items, min_seconds)
+            case['corpus'] = corpus
+            results.append(case)
+    return {
+        'backend': api_implementation.Type(),
+        'protobuf': protobuf_version,
+        'python': sys.version.split()[0],
+        'batch': batch,
+        'results': results,
+    }
+
+
+def _case_key(backend: str, case: dict) -> str:
+    return f"{backend}/{case['corpus']}/{case['message']}"
+
+
+def compare(baseline: dict, current: dict) -> Dict[str, dict]:
+    """Relative change (current / baseline - 1) per case present in both reports"""
+    old = {_case_key(run['backend'], case): case for run in baseline['runs'] for case in run['results']}
+    changes = {}
+    for run in current['runs']:
+        for case in run['results']:
+            key = _case_key(run['backend'], case)
+            before = old.get(key)
+            if before is None:
+                continue
+            changes[key] = {
+                'bytes_per_item': _ratio(case['bytes_per_item'], before['bytes_per_item']),
+                'serialize_items_per_sec': _ratio(case['serialize']['items_per_sec'], before['serialize']['items_per_sec']),
+                'parse_items_per_sec': _ratio(case['parse']['items_per_sec'], before['parse']['items_per_sec']),
+                'parse_alloc_bytes_per_item': _ratio(case['parse_alloc']['bytes_per_item'],
+                                                     before['parse_alloc']['bytes_per_item']),
+            }
+    return changes
+
+
+def _ratio(new: float, old: float) -> Optional[float]:
+    return round(new / old - 1, 4) if old else None
+
+
+def _run_backend(backend: str, args: argparse.Namespace) -> dict:
+    env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=backend)
+    cmd = [sys.executable, '-m', 'appitems.serbench', '--single', '--batch', str(args.batch),
+           '--min-seconds', str(args.min_seconds)]
+    for corpus in args.corpus or ():
+        cmd += ['--corpus', corpus]
+    for message_type in args.message or ():
+        cmd += ['--message', message_type]
+    out = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='AppItem serialization micro-benchmarks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m appitems.serbench
+  python -m appitems.serbench --backend upb --backend python --out serbench.json
+  python -m appitems.serbench --corpus many_tags --message GetAppItemsResponse --compare serbench.json
+        """
+    )
+    parser.add_argument('--backend', action='append', choices=('upb', 'cpp', 'python'),
+                        help='Protobuf implementation to run (repeatable, default: the active one)')
+    parser.add_argument('--corpus', action='append', choices=sorted(CORPORA), help='Only these corpus shapes')
+    parser.add_argument('--message', action='append', choices=MESSAGE_TYPES, help='Only these message types')
+    parser.add_argument('--batch', type=int, default=100, help='Items per corpus (and per response message)')
+    parser.add_argument('--min-seconds', type=float, default=0.2, help='Minimum duration of each timing repeat')
+    parser.add_argument('--out', help='Save the report as JSON')
+    parser.add_argument('--compare', help='Earlier report to compare against')
+    parser.add_argument('--single', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_benchmarks(args.batch, args.corpus, args.message, args.min_seconds)))
+        return
+
+    if args.backend:
+        runs = [_run_backend(backend, args) for backend in args.backend]
+    else:
+        runs = [run_benchmarks(args.batch, args.corpus, args.message, args.min_seconds)]
+    report = {'runs': runs}
+    if args.compare:
+        with open(args.compare) as f:
+            report['changes'] = compare(json.load(f), report)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
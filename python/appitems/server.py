@@ -0,0 +1,476 @@
+"""
+Reference in-process AppItemsService implementation.
+
+Implements all the RPCs over an in-memory AppItemStore so tests, scripts
+and load runs can exercise the real gRPC stack without the Go server.  The
+request handling lives in AppItemsHandler and is shared by a thread-pool
+servicer and a grpc.aio servicer:
+
+    server, target = start_local_server()
+    channel = grpc.insecure_channel(target)
+    ...
+    server.stop(None)
+
+    # or, inside an event loop
+    server, target = await start_local_aio_server()
+"""
+
+import argparse
+import asyncio
+import re
+import threading
+import uuid
+from concurrent import futures
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+import grpc
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.store import (IMMUTABLE_FIELDS, MUTABLE_FIELDS, AppItemStore, Change, CursorExpired, InvalidCursor,
+                            item_version)
+
+# gRPC metadata key carrying the owner of items being created
+OWNER_METADATA_KEY = 'x-owner-id'
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Changes read from the log per batch, and how often an idle watch checks its call is still active
+WATCH_BATCH_SIZE = 500
+WATCH_POLL_SECONDS = 1.0
+
+# Open watches a thread-pool servicer accepts by default.  Each holds a pool
+# thread for as long as it is open, so this stays well below the pool size.
+DEFAULT_MAX_WATCHES = 4
+
+_EVENT_TYPES = {
+    'created': appitems_pb2.AppItemEvent.TYPE_CREATED,
+    'updated': appitems_pb2.AppItemEvent.TYPE_UPDATED,
+    'deleted': appitems_pb2.AppItemEvent.TYPE_DELETED,
+}
+
+MAX_NAME_LENGTH = 256
+MAX_TAGS = 64
+_ID_PATTERN = re.compile(r'^[A-Za-z0-9_.:-]{1,128}$')
+
+
+class ServiceError(Exception):
+    """Error with a gRPC status, raised by the handler and turned into an abort by servicers"""
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+def owner_from_context(context) -> str:
+    """Owner id sent by the caller in the request metadata (if any)"""
+    for key, value in context.invocation_metadata() or ():
+        if key == OWNER_METADATA_KEY:
+            return value
+    return ''
+
+
+def validate_appitem(item: models_pb2.AppItem) -> Dict[str, str]:
+    """Field errors for an AppItem being created (empty if valid)"""
+    errors = {}
+    if item.id and not _ID_PATTERN.match(item.id):
+        errors['id'] = 'id may only contain letters, digits, _ . : - and be at most 128 characters'
+    if not item.name.strip():
+        errors['name'] = 'name is required'
+    elif len(item.name) > MAX_NAME_LENGTH:
+        errors['name'] = f'name must be at most {MAX_NAME_LENGTH} characters'
+    if len(item.tags) > MAX_TAGS:
+        errors['tags'] = f'at most {MAX_TAGS} tags are allowed'
+    elif any(not tag.strip() for tag in item.tags):
+        errors['tags'] = 'tags must not be empty'
+    if item.image_url and not item.image_url.startswith(('http://', 'https://')):
+        errors['image_url'] = 'image_url must be an http(s) URL'
+    return errors
+
+
+def normalize_mask_paths(paths: Sequence[str]) -> Tuple[str, ...]:
+    """Validate update_mask paths, accepting both 'tags' and 'appitem.tags'"""
+    normalized = []
+    for path in paths:
+        if path.startswith('appitem.'):
+            path = path[len('appitem.'):]
+        if path in IMMUTABLE_FIELDS:
+            raise ServiceError(grpc.StatusCode.INVALID_ARGUMENT, f'Field {path} cannot be updated')
+        if path not in MUTABLE_FIELDS:
+            raise ServiceError(grpc.StatusCode.INVALID_ARGUMENT, f'Unknown field in update_mask: {path}')
+        normalized.append(path)
+    return tuple(normalized)
+
+
+class AppItemsHandler:
+    """Transport independent implementation of the AppItemsService RPCs"""
+
+    def __init__(self, store: Optional[AppItemStore] = None):
+        self.store = store if store is not None else AppItemStore()
+
+    def create(self, request: appitems_pb2.CreateAppItemRequest, owner_id: str = '') -> appitems_pb2.CreateAppItemResponse:
+        errors = validate_appitem(request.appitem)
+        if errors:
+            return appitems_pb2.CreateAppItemResponse(field_errors=errors)
+        item = self._insert(request.appitem, owner_id)
+        if item is None:
+            raise ServiceError(grpc.StatusCode.ALREADY_EXISTS, f'AppItem {request.appitem.id} already exists')
+        return appitems_pb2.CreateAppItemResponse(appitem=item)
+
+    def _insert(self, appitem: models_pb2.AppItem, owner_id: str) -> Optional[models_pb2.AppItem]:
+        """Store a copy of a valid item with its id and timestamps filled, None if the id is taken"""
+        item = models_pb2.AppItem()
+        item.CopyFrom(appitem)
+        if not item.id:
+            item.id = uuid.uuid4().hex
+        item.created_at.GetCurrentTime()
+        item.updated_at.CopyFrom(item.created_at)
+        return item if self.store.insert(item, owner_id) else None
+
+    def create_batch(self, request: appitems_pb2.CreateAppItemsRequest, owner_id: str,
+                     resp: appitems_pb2.CreateAppItemsResponse):
+        """Create the items of one CreateAppItems message, adding their results to `resp`"""
+        for appitem in request.appitems:
+            result = resp.results.add(index=len(resp.results), id=appitem.id)
+            errors = validate_appitem(appitem)
+            if errors:
+                result.field_errors.update(errors)
+                resp.failed += 1
+                continue
+            item = self._insert(appitem, owner_id)
+            if item is None:
+                result.already_exists = True
+                resp.skipped += 1
+            else:
+                result.id = item.id
+                resp.created += 1
+
+    def create_many(self, requests: Iterable[appitems_pb2.CreateAppItemsRequest],
+                    owner_id: str = '') -> appitems_pb2.CreateAppItemsResponse:
+        resp = appitems_pb2.CreateAppItemsResponse()
+        for request in requests:
+            self.create_batch(request, owner_id, resp)
+        return resp
+
+    def get_many(self, request: appitems_pb2.GetAppItemsRequest) -> appitems_pb2.GetAppItemsResponse:
+        resp = appitems_pb2.GetAppItemsResponse()
+        for item_id, item in self.store.get_many(request.ids).items():
+            version = item_version(item)
+            resp.versions[item_id] = version
+            if request.versions.get(item_id) == version:
+                resp.not_modified_ids.append(item_id)
+            else:
+                resp.appitems[item_id].CopyFrom(item)
+        return resp
+
+    def list(self, request: appitems_pb2.ListAppItemsRequest) -> appitems_pb2.ListAppItemsResponse:
+        pagination = request.pagination
+        if pagination.page_size < 0 or pagination.page_offset < 0:
+            raise ServiceError(grpc.StatusCode.INVALID_ARGUMENT, 'page_size and page_offset must not be negative')
+        limit = min(pagination.page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        try:
+            page, total, next_key = self.store.list(owner_id=request.owner_id, page_key=pagination.page_key,
+                                                    offset=pagination.page_offset, limit=limit)
+        except InvalidCursor as e:
+            raise ServiceError(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        resp = appitems_pb2.ListAppItemsResponse(items=page)
+        resp.pagination.total_results = total
+        resp.pagination.has_more = bool(next_key)
+        if next_key:
+            resp.pagination.next_page_key = next_key
+            if not pagination.page_key:
+                resp.pagination.next_page_offset = pagination.page_offset + len(page)
+        return resp
+
+    def get(self, request: appitems_pb2.GetAppItemRequest) -> appitems_pb2.GetAppItemResponse:
+        item = self.store.get(request.id)
+        if item is None:
+            raise ServiceError(grpc.StatusCode.NOT_FOUND, f'AppItem {request.id} not found')
+        version = item_version(item)
+        if request.version == version:
+            return appitems_pb2.GetAppItemResponse(version=version, not_modified=True)
+        return appitems_pb2.GetAppItemResponse(appitem=item, version=version)
+
+    def delete(self, request: appitems_pb2.DeleteAppItemRequest) -> appitems_pb2.DeleteAppItemResponse:
+        if self.store.delete(request.id) is None:
+            raise ServiceError(grpc.StatusCode.NOT_FOUND, f'AppItem {request.id} not found')
+        return appitems_pb2.DeleteAppItemResponse()
+
+    def update(self, request: appitems_pb2.UpdateAppItemRequest) -> appitems_pb2.UpdateAppItemResponse:
+        """Apply the fields named in update_mask (all mutable fields if the mask is empty)"""
+        item_id = request.appitem.id
+        if not item_id:
+            raise ServiceError(grpc.StatusCode.INVALID_ARGUMENT, 'appitem.id is required')
+        paths = normalize_mask_paths(request.update_mask.paths) if request.update_mask.paths else MUTABLE_FIELDS
+        with self.store.lock:
+            existing = self.store.get(item_id)
+            if existing is None:
+                raise ServiceError(grpc.StatusCode.NOT_FOUND, f'AppItem {item_id} not found')
+            item = models_pb2.AppItem()
+            item.CopyFrom(existing)
+            for path in paths:
+                if path == 'tags':
+                    item.tags[:] = request.appitem.tags
+                else:
+                    setattr(item, path, getattr(request.appitem, path))
+            item.updated_at.GetCurrentTime()
+            # The version is derived from updated_at, so it must move even within one clock tick
+            previous_ns = existing.updated_at.ToNanoseconds()
+            if item.updated_at.ToNanoseconds() <= previous_ns:
+                item.updated_at.FromNanoseconds(previous_ns + 1)
+            self.store.replace(item)
+        return appitems_pb2.UpdateAppItemResponse(appitem=item)
+
+    def watch(self, request: appitems_pb2.WatchAppItemsRequest, is_active: Callable[[], bool] = lambda: True,
+              block: bool = True) -> Iterator[Optional[appitems_pb2.AppItemEvent]]:
+        """Change events for WatchAppItems, until `is_active` returns False.
+
+        With send_initial every current item is sent first as a CREATED event
+        (without a cursor).  Otherwise the stream resumes after `cursor`, or
+        starts at the current end of the log.  Once the initial items or the
+        backlog have been sent a SYNCED event carries the cursor to resume
+        from; each later event carries its own.
+
+        Once caught up the generator waits for the next change.  With
+        block=False it yields None instead, and the caller waits for a change
+        (see ChangeLog.subscribe) before advancing it again.
+        """
+        changes = self.store.changes
+        if request.send_initial:
+            items, seq = self.store.snapshot(request.owner_id)
+            for item, owner_id in items:
+                yield appitems_pb2.AppItemEvent(type=appitems_pb2.AppItemEvent.TYPE_CREATED, id=item.id,
+                                                appitem=item, updated_at=item.updated_at, owner_id=owner_id)
+        elif request.cursor:
+            try:
+                seq = changes.position(request.cursor)
+            except InvalidCursor as e:
+                raise ServiceError(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            except CursorExpired as e:
+                raise ServiceError(grpc.StatusCode.OUT_OF_RANGE, str(e))
+        else:
+            seq = changes.seq
+
+        synced = False
+        while is_active():
+            try:
+                batch = changes.since(seq, WATCH_BATCH_SIZE)
+            except CursorExpired as e:
+                # The watcher fell further behind than the log keeps
+                raise ServiceError(grpc.StatusCode.OUT_OF_RANGE, str(e))
+            if not batch:
+                if not synced:
+                    synced = True
+                    yield appitems_pb2.AppItemEvent(type=appitems_pb2.AppItemEvent.TYPE_SYNCED,
+                                                    cursor=changes.cursor(seq))
+                if block:
+                    changes.wait(seq, WATCH_POLL_SECONDS)
+                else:
+                    yield None
+                continue
+            for change in batch:
+                seq = change.seq
+                if not request.owner_id or change.owner_id == request.owner_id:
+                    yield self._event(change, changes.cursor(seq))
+
+    @staticmethod
+    def _event(change: Change, cursor: str) -> appitems_pb2.AppItemEvent:
+        # DELETED events carry the last version of the item, as documented on AppItemEvent.appitem
+        event = appitems_pb2.AppItemEvent(type=_EVENT_TYPES[change.kind], id=change.item_id, cursor=cursor,
+                                          owner_id=change.owner_id)
+        event.appitem.CopyFrom(change.item)
+        event.updated_at.FromNanoseconds(change.at_ns)
+        return event
+
+
+class InMemoryAppItemsService(appitems_pb2_grpc.AppItemsServiceServicer):
+    """Thread-pool servicer over an AppItemsHandler.
+
+    At most `max_watches` WatchAppItems streams are open at once; more are
+    rejected with RESOURCE_EXHAUSTED so watchers cannot take every pool
+    thread.  Serve many watchers with the aio servicer instead.
+    """
+
+    def __init__(self, handler: Optional[AppItemsHandler] = None, max_watches: int = DEFAULT_MAX_WATCHES):
+        self.handler = handler or AppItemsHandler()
+        self.max_watches = max_watches
+        self._watches = 0
+        self._watches_lock = threading.Lock()
+
+    def _call(self, fn, request, context, *args):
+        try:
+            return fn(request, *args)
+        except ServiceError as e:
+            context.abort(e.code, e.details)
+
+    def CreateAppItem(self, request, context):
+        return self._call(self.handler.create, request, context, owner_from_context(context))
+
+    def CreateAppItems(self, request_iterator, context):
+        return self._call(self.handler.create_many, request_iterator, context, owner_from_context(context))
+
+    def GetAppItems(self, request, context):
+        return self._call(self.handler.get_many, request, context)
+
+    def ListAppItems(self, request, context):
+        return self._call(self.handler.list, request, context)
+
+    def GetAppItem(self, request, context):
+        return self._call(self.handler.get, request, context)
+
+    def DeleteAppItem(self, request, context):
+        return self._call(self.handler.delete, request, context)
+
+    def UpdateAppItem(self, request, context):
+        return self._call(self.handler.update, request, context)
+
+    def WatchAppItems(self, request, context):
+        # Each open watch holds one thread of the server's pool
+        with self._watches_lock:
+            if self._watches >= self.max_watches:
+                context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                              f'Too many open watches (at most {self.max_watches})')
+            self._watches += 1
+        try:
+            yield from self.handler.watch(request, context.is_active)
+        except ServiceError as e:
+            context.abort(e.code, e.details)
+        finally:
+            with self._watches_lock:
+                self._watches -= 1
+
+
+class AioInMemoryAppItemsService(appitems_pb2_grpc.AppItemsServiceServicer):
+    """grpc.aio servicer over an AppItemsHandler.
+
+    Handler calls never block on I/O so they run inline on the event loop.
+    Watches wait for changes on the loop too, so they hold no threads and
+    their number is not capped.
+    """
+
+    def __init__(self, handler: Optional[AppItemsHandler] = None):
+        self.handler = handler or AppItemsHandler()
+
+    async def _call(self, fn, request, context, *args):
+        try:
+            return fn(request, *args)
+        except ServiceError as e:
+            await context.abort(e.code, e.details)
+
+    async def CreateAppItem(self, request, context):
+        return await self._call(self.handler.create, request, context, owner_from_context(context))
+
+    async def CreateAppItems(self, request_iterator, context):
+        owner_id = owner_from_context(context)
+        resp = appitems_pb2.CreateAppItemsResponse()
+        async for request in request_iterator:
+            self.handler.create_batch(request, owner_id, resp)
+        return resp
+
+    async def GetAppItems(self, request, context):
+        return await self._call(self.handler.get_many, request, context)
+
+    async def ListAppItems(self, request, context):
+        return await self._call(self.handler.list, request, context)
+
+    async def GetAppItem(self, request, context):
+        return await self._call(self.handler.get, request, context)
+
+    async def DeleteAppItem(self, request, context):
+        return await self._call(self.handler.delete, request, context)
+
+    async def UpdateAppItem(self, request, context):
+        return await self._call(self.handler.update, request, context)
+
+    async def WatchAppItems(self, request, context):
+        # The handler's generator runs inline and yields None once caught up;
+        # the watch then awaits an event the change log sets from the writer's thread
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        def notify():
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                # The loop closed before the watch could unsubscribe
+                pass
+
+        changes = self.handler.store.changes
+        changes.subscribe(notify)
+        events = self.handler.watch(request, block=False)
+        try:
+            while True:
+                # Cleared before reading the log, so a change landing after the read still wakes the wait
+                changed.clear()
+                try:
+                    event = next(events)
+                except StopIteration:
+                    return
+                except ServiceError as e:
+                    await context.abort(e.code, e.details)
+                if event is None:
+                    # A cancelled call cancels this await, so there is no need to poll
+                    await changed.wait()
+                else:
+                    yield event
+        finally:
+            changes.unsubscribe(notify)
+            events.close()
+
+
+def _local_target(address: str, port: int) -> str:
+    return f"{address.rsplit(':', 1)[0]}:{port}"
+
+
+def start_local_server(servicer: Optional[appitems_pb2_grpc.AppItemsServiceServicer] = None,
+                       address: str = '127.0.0.1:0', max_workers: int = 16,
+                       interceptors: Sequence[grpc.ServerInterceptor] = ()) -> Tuple[grpc.Server, str]:
+    """Start a thread-pool gRPC server in this process.
+
+    Returns the started server and the `host:port` target to dial.  Passing
+    port 0 (the default) picks a free port.  Without a servicer the default
+    one accepts at most a quarter of `max_workers` open watches.
+    """
+    if servicer is None:
+        servicer = InMemoryAppItemsService(max_watches=max(1, max_workers // 4))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers), interceptors=interceptors)
+    appitems_pb2_grpc.add_AppItemsServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port(address)
+    server.start()
+    return server, _local_target(address, port)
+
+
+async def start_local_aio_server(servicer: Optional[appitems_pb2_grpc.AppItemsServiceServicer] = None,
+                                 address: str = '127.0.0.1:0',
+                                 interceptors: Sequence[grpc.aio.ServerInterceptor] = ()) -> Tuple[grpc.aio.Server, str]:
+    """grpc.aio counterpart of start_local_server, must be awaited inside a running event loop"""
+    server = grpc.aio.server(interceptors=interceptors)
+    appitems_pb2_grpc.add_AppItemsServiceServicer_to_server(servicer or AioInMemoryAppItemsService(), server)
+    port = server.add_insecure_port(address)
+    await server.start()
+    return server, _local_target(address, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reference in-memory AppItemsService server')
+    parser.add_argument('--address', default='127.0.0.1:9090', help='host:port to listen on')
+    parser.add_argument('--aio', action='store_true', help='Use the grpc.aio server instead of a thread pool')
+    parser.add_argument('--workers', type=int, default=16, help='Thread pool size (ignored with --aio)')
+    args = parser.parse_args()
+
+    if args.aio:
+        async def serve():
+            server, target = await start_local_aio_server(address=args.address)
+            print(f'🚀 AppItemsService (aio) listening on {target}')
+            await server.wait_for_termination()
+        asyncio.run(serve())
+    else:
+        server, target = start_local_server(address=args.address, max_workers=args.workers)
+        print(f'🚀 AppItemsService listening on {target}')
+        server.wait_for_termination()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the generated protobuf/gRPC modules.
+
+Each scenario runs in a fresh interpreter several times.  The report gives
+the median time spent in the import statements, the median wall time of the
+whole process and the peak RSS, with the protobuf backend that was active:
+
+    python -m appitems.startup
+    python -m appitems.startup --runs 20 --backend upb --backend python --out startup.json
+
+Compare `eager_grpc` (what `from apptemplate.v1 import appitems_pb2_grpc`
+costs a short-lived CLI) with the `facade_*` scenarios that go through the
+lazy appitems.pb facade.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PYTHON_DIR = str(Path(__file__).resolve().parents[1])
+
+SCENARIOS: Dict[str, str] = {
+    'baseline': 'pass',
+    'facade': 'from appitems import pb',
+    'facade_message': 'from appitems import pb; pb.AppItem(name="x").SerializeToString()',
+    'facade_stub': 'from appitems import pb; pb.AppItemsServiceStub',
+    'models_pb2': 'from apptemplate.v1 import models_pb2',
+    'appitems_pb2': 'from apptemplate.v1 import appitems_pb2',
+    'eager_grpc': 'from apptemplate.v1 import appitems_pb2_grpc',
+}
+
+# Runs in the child: path setup is excluded from the timing, the scenario is not
+_CHILD = '''
+import json, resource, sys, time
+sys.path.insert(0, {python_dir!r})
+import appitems
+start = time.perf_counter()
+exec({statement!r})
+import_seconds = time.perf_counter() - start
+from google.protobuf.internal import api_implementation
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "import_seconds": import_seconds,
+    "max_rss_bytes": rss if sys.platform == "darwin" else rss * 1024,
+    "backend": api_implementation.Type(),
+    "grpc_loaded": "grpc" in sys.modules,
+}}))
+'''
+
+
+def run_once(statement: str, backend: Optional[str] = None) -> dict:
+    env = dict(os.environ)
+    if backend:
+        env['PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'] = backend
+    code = _CHILD.format(python_dir=PYTHON_DIR, statement=statement)
+    started = time.perf_counter()
+    out = subprocess.run([sys.executable, '-c', code], env=env, check=True, capture_output=True, text=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result['process_seconds'] = time.perf_counter() - started
+    return result
+
+
+def run_scenario(statement: str, runs: int = 10, backend: Optional[str] = None) -> dict:
+    results = [run_once(statement, backend) for _ in range(runs)]
+    return {
+        'backend': results[0]['backend'],
+        'grpc_loaded': results[0]['grpc_loaded'],
+        'import_ms': round(statistics.median(r['import_seconds'] for r in results) * 1000, 2),
+        'process_ms': round(statistics.median(r['process_seconds'] for r in results) * 1000, 2),
+        'max_rss_mb': round(max(r['max_rss_bytes'] for r in results) / (1 << 20), 1),
+    }
+
+
+def run_startup_benchmark(runs: int = 10, backends: Optional[List[str]] = None,
+                          scenarios: Optional[List[str]] = None) -> dict:
+    report = {'python': sys.version.split()[0], 'runs': runs, 'results': {}}
+    for backend in backends or [None]:
+        key = backend or 'default'
+        report['results'][key] = {name: run_scenario(SCENARIOS[name], runs, backend)
+                                  for name in scenarios or SCENARIOS}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold import time and RSS of the generated modules')
+    parser.add_argument('--runs', type=int, default=10, help='Fresh interpreters per scenario')
+    parser.add_argument('--backend', action='append', choices=('upb', 'cpp', 'python'),
+                        help='Protobuf implementation to force (repeatable, default: whatever is active)')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='Only run these scenarios')
+    parser.add_argument('--out', help='Also write the report to this JSON file')
+    args = parser.parse_args()
+
+    report = run_startup_benchmark(args.runs, args.backend, args.scenario)
+    text = json.dumps(report, indent=2)
+    # Write the file first: printing to a closed pipe (`| head`) raises
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
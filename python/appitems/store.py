@@ -0,0 +1,470 @@
+"""
+Indexed in-memory AppItem storage used by the reference servicers.
+
+Items are listed most recently updated first, ties broken by id.  Pages can
+be addressed either by offset or by an opaque page key (a cursor encoding
+the (updated_at, id) of the last item returned), matching the two modes in
+the Pagination message.
+
+Every listing is served from an ordered index rather than by scanning and
+sorting the collection:
+
+    - one ordered index over all items
+    - one ordered index per owner, per tag and per difficulty value
+
+Each ordered index is a SortedKeyList, so locating the first item of a page
+(by cursor or by offset) is O(log n) and reading it is O(page_size).
+`total_results` is the length of the index, which is maintained on every
+write.  Combining several filters walks the smallest matching index and
+checks the others per item; their total comes from a count kept per
+combination of filter values, so it is O(1) as well.
+
+Writes are also appended to a bounded ChangeLog, which WatchAppItems streams
+from.  A change cursor names a position in that log so a watcher can resume
+after a disconnect as long as the changes it missed are still retained.
+"""
+
+import base64
+import bisect
+import itertools
+import random
+import struct
+import threading
+import time
+from collections import Counter, defaultdict, deque, namedtuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from apptemplate.v1 import models_pb2
+
+_CURSOR = struct.Struct('>q')
+_CHANGE_CURSOR = struct.Struct('>IQ')
+
+DEFAULT_CHANGE_LOG_SIZE = 10000
+
+# Fields a caller may name in UpdateAppItemRequest.update_mask, and the ones
+# only the store itself sets
+MUTABLE_FIELDS = ('name', 'description', 'tags', 'image_url', 'difficulty')
+IMMUTABLE_FIELDS = ('id', 'created_at', 'updated_at')
+
+SortKey = Tuple[int, str]
+
+
+class InvalidCursor(ValueError):
+    """Raised when a page key or change cursor cannot be decoded"""
+
+
+class CursorExpired(LookupError):
+    """Raised when a change cursor is older than the retained log (or from another log)"""
+
+
+# kind is 'created', 'updated' or 'deleted'; at_ns is the item's updated_at
+# (the time of the delete for deletions)
+Change = namedtuple('Change', 'seq kind item_id owner_id item at_ns')
+
+
+def sort_key(item: models_pb2.AppItem) -> SortKey:
+    """Ordering key: newest updated_at first, then id ascending"""
+    return -item.updated_at.ToNanoseconds(), item.id
+
+
+def item_version(item: models_pb2.AppItem) -> str:
+    """Opaque version of an item for conditional reads (its updated_at, which every write advances)"""
+    return format(item.updated_at.ToNanoseconds(), 'x')
+
+
+def encode_cursor(key: SortKey) -> str:
+    raw = _CURSOR.pack(key[0]) + key[1].encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(page_key: str) -> SortKey:
+    try:
+        raw = base64.urlsafe_b64decode(page_key + '=' * (-len(page_key) % 4))
+        (nanos,) = _CURSOR.unpack_from(raw)
+        return nanos, raw[_CURSOR.size:].decode('utf-8')
+    except (ValueError, struct.error) as e:
+        raise InvalidCursor(f'Invalid page key: {page_key!r}') from e
+
+
+class SortedKeyList:
+    """Sorted list of unique keys stored as a list of bounded sublists.
+
+    Insert and remove cost O(log n + load); seeking to a key or to a
+    position costs O(log n).  Positional lookups use a Fenwick tree over the
+    sublist lengths, which writes update in place; it is only rebuilt
+    (O(n / load)) after a sublist splits or empties.
+    """
+
+    def __init__(self, load: int = 512):
+        self.load = load
+        self.lists: List[List[SortKey]] = []
+        self.maxes: List[SortKey] = []
+        self.size = 0
+        self._tree: Optional[List[int]] = None
+
+    def __len__(self):
+        return self.size
+
+    def add(self, key: SortKey):
+        self.size += 1
+        if not self.lists:
+            self._tree = None
+            self.lists.append([key])
+            self.maxes.append(key)
+            return
+        pos = bisect.bisect_left(self.maxes, key)
+        if pos == len(self.maxes):
+            pos -= 1
+            self.lists[pos].append(key)
+            self.maxes[pos] = key
+        else:
+            bisect.insort(self.lists[pos], key)
+        if len(self.lists[pos]) > 2 * self.load:
+            self._tree = None
+            sub = self.lists[pos]
+            self.lists[pos:pos + 1] = [sub[:self.load], sub[self.load:]]
+            self.maxes[pos:pos + 1] = [sub[self.load - 1], sub[-1]]
+        else:
+            self._tree_add(pos, 1)
+
+    def remove(self, key: SortKey) -> bool:
+        pos = bisect.bisect_left(self.maxes, key)
+        if pos == len(self.maxes):
+            return False
+        sub = self.lists[pos]
+        idx = bisect.bisect_left(sub, key)
+        if idx == len(sub) or sub[idx] != key:
+            return False
+        self.size -= 1
+        del sub[idx]
+        if not sub:
+            self._tree = None
+            del self.lists[pos]
+            del self.maxes[pos]
+        else:
+            self.maxes[pos] = sub[-1]
+            self._tree_add(pos, -1)
+        return True
+
+    def _build_tree(self) -> List[int]:
+        tree = [0] + [len(sub) for sub in self.lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        return tree
+
+    def _tree_add(self, pos: int, delta: int):
+        tree = self._tree
+        if tree is None:
+            return
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _locate_index(self, index: int) -> Tuple[int, int]:
+        """(sublist, position in it) of the key at `index`, which must be < size"""
+        tree = self._tree if self._tree is not None else self._build_tree()
+        pos, step = 0, 1 << (len(tree) - 1).bit_length()
+        while step:
+            # Descend to the last sublist whose preceding keys number at most `index`
+            if pos + step < len(tree) and tree[pos + step] <= index:
+                pos += step
+                index -= tree[pos]
+            step >>= 1
+        return pos, index
+
+    def iter_from_index(self, index: int) -> Iterator[SortKey]:
+        if index >= self.size:
+            return iter(())
+        return self._iter_from(*self._locate_index(max(index, 0)))
+
+    def iter_after(self, key: SortKey) -> Iterator[SortKey]:
+        """Keys strictly greater than `key`"""
+        pos = bisect.bisect_right(self.maxes, key)
+        if pos == len(self.maxes):
+            return iter(())
+        return self._iter_from(pos, bisect.bisect_right(self.lists[pos], key))
+
+    def _iter_from(self, pos: int, idx: int) -> Iterator[SortKey]:
+        lists = self.lists
+        while pos < len(lists):
+            sub = lists[pos]
+            for i in range(idx, len(sub)):
+                yield sub[i]
+            pos, idx = pos + 1, 0
+
+    def __iter__(self):
+        return self._iter_from(0, 0)
+
+
+class ChangeLog:
+    """Bounded, sequenced log of store writes.
+
+    Every write gets the next sequence number.  Only the last `capacity`
+    changes are kept; a cursor pointing before them raises CursorExpired and
+    the watcher has to start again from a snapshot.  Each log has a random
+    epoch, so cursors from an earlier server process are rejected the same
+    way instead of silently skipping changes.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CHANGE_LOG_SIZE):
+        self.entries: deque = deque(maxlen=capacity)
+        self.epoch = random.getrandbits(32)
+        self.seq = 0
+        self.cond = threading.Condition(threading.Lock())
+        # Called (with the lock held) after every append, for waiters that cannot block on `cond`
+        self.listeners: List[Callable[[], None]] = []
+
+    def append(self, kind: str, item: models_pb2.AppItem, owner_id: str = '', at_ns: int = 0) -> int:
+        with self.cond:
+            self.seq += 1
+            self.entries.append(Change(self.seq, kind, item.id, owner_id, item,
+                                       at_ns or item.updated_at.ToNanoseconds()))
+            self.cond.notify_all()
+            for listener in self.listeners:
+                listener()
+            return self.seq
+
+    def subscribe(self, listener: Callable[[], None]):
+        """Call `listener` after every append; it must not block or write to the log"""
+        with self.cond:
+            self.listeners = self.listeners + [listener]
+
+    def unsubscribe(self, listener: Callable[[], None]):
+        with self.cond:
+            self.listeners = [fn for fn in self.listeners if fn is not listener]
+
+    def cursor(self, seq: int) -> str:
+        """Opaque cursor for the position just after change `seq`"""
+        raw = _CHANGE_CURSOR.pack(self.epoch, seq)
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def position(self, cursor: str) -> int:
+        """Sequence number a cursor points after"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            epoch, seq = _CHANGE_CURSOR.unpack(raw)
+        except (ValueError, struct.error) as e:
+            raise InvalidCursor(f'Invalid change cursor: {cursor!r}') from e
+        with self.cond:
+            oldest = self.entries[0].seq if self.entries else self.seq + 1
+            if epoch != self.epoch or seq > self.seq or seq < oldest - 1:
+                raise CursorExpired(f'Change cursor {cursor!r} is no longer available')
+        return seq
+
+    def since(self, seq: int, limit: int = 1000) -> List[Change]:
+        """Up to `limit` changes after `seq`, oldest first"""
+        with self.cond:
+            if seq >= self.seq:
+                return []
+            start = seq + 1 - self.entries[0].seq
+            if start < 0:
+                raise CursorExpired(f'Changes after {seq} are no longer available')
+            return list(itertools.islice(self.entries, start, start + limit))
+
+    def wait(self, seq: int, timeout: Optional[float] = None) -> bool:
+        """Block until there are changes after `seq`, returns False on timeout"""
+        with self.cond:
+            return self.cond.wait_for(lambda: self.seq > seq, timeout)
+
+
+class AppItemStore:
+    """Indexed, dict-backed AppItem store.
+
+    Stored messages are owned by the store and must be treated as read-only
+    by callers; writes always go through insert/replace/delete so the
+    indexes stay in step.
+    """
+
+    def __init__(self, change_log_size: int = DEFAULT_CHANGE_LOG_SIZE):
+        self.lock = threading.RLock()
+        self.items: Dict[str, models_pb2.AppItem] = {}
+        self.owners: Dict[str, str] = {}
+        self.keys: Dict[str, SortKey] = {}
+        self.ordered = SortedKeyList()
+        self.by_owner: Dict[str, SortedKeyList] = defaultdict(SortedKeyList)
+        self.by_tag: Dict[str, SortedKeyList] = defaultdict(SortedKeyList)
+        self.by_difficulty: Dict[str, SortedKeyList] = defaultdict(SortedKeyList)
+        # Items per (owner_id, tag, difficulty) combination of two or more filters
+        self.filter_counts: Counter = Counter()
+        self.changes = ChangeLog(change_log_size)
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, item_id: str) -> Optional[models_pb2.AppItem]:
+        return self.items.get(item_id)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, models_pb2.AppItem]:
+        with self.lock:
+            return {item_id: self.items[item_id] for item_id in ids if item_id in self.items}
+
+    def owner_of(self, item_id: str) -> str:
+        return self.owners.get(item_id, '')
+
+    def snapshot(self, owner_id: str = '') -> Tuple[List[Tuple[models_pb2.AppItem, str]], int]:
+        """All (item, owner_id) pairs (of one owner if given) and the change sequence number they are current as of"""
+        with self.lock:
+            keys = self.by_owner.get(owner_id, ()) if owner_id else self.ordered
+            items = [(self.items[key[1]], self.owners.get(key[1], '')) for key in keys]
+            return items, self.changes.seq
+
+    def count(self, owner_id: str = '', tag: str = '', difficulty: str = '') -> int:
+        """Number of matching items, O(1) for any combination of filters"""
+        with self.lock:
+            if sum(1 for value in (owner_id, tag, difficulty) if value) > 1:
+                return self.filter_counts.get((owner_id, tag, difficulty), 0)
+            index = self._index_for(owner_id, tag, difficulty)
+            return len(index) if index is not None else 0
+
+    def _secondary(self, item: models_pb2.AppItem, owner_id: str) -> List[SortedKeyList]:
+        indexes = []
+        if owner_id:
+            indexes.append(self.by_owner[owner_id])
+        for tag in set(item.tags):
+            indexes.append(self.by_tag[tag])
+        if item.difficulty:
+            indexes.append(self.by_difficulty[item.difficulty])
+        return indexes
+
+    @staticmethod
+    def _filter_combinations(item: models_pb2.AppItem, owner_id: str) -> Iterator[Tuple[str, str, str]]:
+        """The (owner_id, tag, difficulty) filters of two or more values that `item` matches"""
+        difficulty = item.difficulty
+        if owner_id and difficulty:
+            yield owner_id, '', difficulty
+        for tag in set(item.tags):
+            if not tag:
+                continue
+            if owner_id:
+                yield owner_id, tag, ''
+            if difficulty:
+                yield '', tag, difficulty
+            if owner_id and difficulty:
+                yield owner_id, tag, difficulty
+
+    def _index(self, item: models_pb2.AppItem, owner_id: str):
+        key = sort_key(item)
+        self.keys[item.id] = key
+        self.ordered.add(key)
+        for index in self._secondary(item, owner_id):
+            index.add(key)
+        self.filter_counts.update(self._filter_combinations(item, owner_id))
+
+    def _unindex(self, item: models_pb2.AppItem, owner_id: str):
+        key = self.keys.pop(item.id)
+        self.ordered.remove(key)
+        counts = self.filter_counts
+        for combination in self._filter_combinations(item, owner_id):
+            counts[combination] -= 1
+            if not counts[combination]:
+                del counts[combination]
+        for value, table in ((owner_id, self.by_owner), (item.difficulty, self.by_difficulty)):
+            if value:
+                self._remove_from(table, value, key)
+        for tag in set(item.tags):
+            self._remove_from(self.by_tag, tag, key)
+
+    @staticmethod
+    def _remove_from(table: Dict[str, SortedKeyList], value: str, key: SortKey):
+        index = table.get(value)
+        if index is not None:
+            index.remove(key)
+            if not index:
+                del table[value]
+
+    def insert(self, item: models_pb2.AppItem, owner_id: str = '') -> bool:
+        """Add a new item, returns False if the id is already taken"""
+        with self.lock:
+            if item.id in self.items:
+                return False
+            self.items[item.id] = item
+            self.owners[item.id] = owner_id
+            self._index(item, owner_id)
+            self.changes.append('created', item, owner_id)
+            return True
+
+    def replace(self, item: models_pb2.AppItem) -> Optional[models_pb2.AppItem]:
+        """Replace an existing item, returns the previous version (None if missing)"""
+        with self.lock:
+            previous = self.items.get(item.id)
+            if previous is not None:
+                owner_id = self.owners.get(item.id, '')
+                self._unindex(previous, owner_id)
+                self.items[item.id] = item
+                self._index(item, owner_id)
+                self.changes.append('updated', item, owner_id)
+            return previous
+
+    def delete(self, item_id: str) -> Optional[models_pb2.AppItem]:
+        with self.lock:
+            item = self.items.pop(item_id, None)
+            if item is not None:
+                owner_id = self.owners.pop(item_id, '')
+                self._unindex(item, owner_id)
+                self.changes.append('deleted', item, owner_id, time.time_ns())
+            return item
+
+    def _index_for(self, owner_id: str, tag: str, difficulty: str) -> Optional[SortedKeyList]:
+        """Smallest index covering the filters (None if any filter matches nothing)"""
+        candidates = []
+        for value, table in ((owner_id, self.by_owner), (tag, self.by_tag), (difficulty, self.by_difficulty)):
+            if value:
+                index = table.get(value)
+                if index is None:
+                    return None
+                candidates.append(index)
+        if not candidates:
+            return self.ordered
+        return min(candidates, key=len)
+
+    def list(self, owner_id: str = '', page_key: str = '', offset: int = 0, limit: int = 50,
+             tag: str = '', difficulty: str = '') -> Tuple[List[models_pb2.AppItem], int, str]:
+        """Return (page, total_matching, next_page_key).
+
+        `page_key` takes precedence over `offset`.  `next_page_key` is empty
+        on the last page.
+        """
+        after = decode_cursor(page_key) if page_key else None
+        with self.lock:
+            index = self._index_for(owner_id, tag, difficulty)
+            if index is None:
+                return [], 0, ''
+            filters = sum(1 for value in (owner_id, tag, difficulty) if value)
+            if filters <= 1:
+                keys = index.iter_after(after) if after else index.iter_from_index(offset)
+                total = len(index)
+            else:
+                keys = (key for key in (index.iter_after(after) if after else index)
+                        if self._matches(key[1], owner_id, tag, difficulty))
+                total = self.count(owner_id, tag, difficulty)
+                if not after:
+                    keys = _skip(keys, offset)
+
+            # Read one extra key to learn whether another page follows
+            page_keys = []
+            for key in keys:
+                page_keys.append(key)
+                if len(page_keys) > limit:
+                    break
+            has_more = len(page_keys) > limit
+            page_keys = page_keys[:limit]
+            page = [self.items[key[1]] for key in page_keys]
+        next_key = encode_cursor(page_keys[-1]) if has_more else ''
+        return page, total, next_key
+
+    def _matches(self, item_id: str, owner_id: str, tag: str, difficulty: str) -> bool:
+        item = self.items[item_id]
+        return ((not owner_id or self.owners.get(item_id) == owner_id)
+                and (not tag or tag in item.tags)
+                and (not difficulty or item.difficulty == difficulty))
+
+
+def _skip(it: Iterator, count: int) -> Iterator:
+    for _ in range(max(count, 0)):
+        if next(it, None) is None:
+            break
+    return it
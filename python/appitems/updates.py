@@ -0,0 +1,209 @@
+"""
+Field-mask diffs and batched partial updates for AppItems.
+
+`diff_update` compares a baseline AppItem with a modified copy and builds
+the smallest UpdateAppItemRequest that applies the change: an update_mask
+naming only the changed fields and a sparse payload carrying just those
+fields (plus the id).
+
+`UpdateBatcher` takes a stream of such edits, merges edits to the same id
+(union of masks, newest value per field) and flushes them as UpdateAppItem
+calls with a bounded number in flight:
+
+    with UpdateBatcher(stub, max_in_flight=16) as batcher:
+        for before, after in edits:
+            batcher.add(before, after)
+    print(batcher.results.errors)       # latest error per id with fields still unapplied
+    retry = batcher.results.failed      # those fields, as one request per id
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import grpc
+from google.protobuf import field_mask_pb2
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.store import MUTABLE_FIELDS
+
+
+def changed_fields(baseline: models_pb2.AppItem, modified: models_pb2.AppItem) -> List[str]:
+    """Mutable fields whose value differs between the two items"""
+    return [name for name in MUTABLE_FIELDS if getattr(baseline, name) != getattr(modified, name)]
+
+
+def _copy_fields(source: models_pb2.AppItem, target: models_pb2.AppItem, paths: Sequence[str]):
+    for path in paths:
+        if path == 'tags':
+            target.tags[:] = source.tags
+        else:
+            setattr(target, path, getattr(source, path))
+
+
+def _mask_paths(request: appitems_pb2.UpdateAppItemRequest) -> List[str]:
+    """Fields an update writes (an empty mask means every mutable field)"""
+    return list(request.update_mask.paths) or list(MUTABLE_FIELDS)
+
+
+def merge_update(target: appitems_pb2.UpdateAppItemRequest, request: appitems_pb2.UpdateAppItemRequest):
+    """Fold `request` into `target` for the same id: union of masks, values from `request`"""
+    paths = _mask_paths(request)
+    _copy_fields(request.appitem, target.appitem, paths)
+    known = set(target.update_mask.paths)
+    target.update_mask.paths.extend(p for p in paths if p not in known)
+
+
+def diff_update(baseline: models_pb2.AppItem, modified: models_pb2.AppItem) -> Optional[appitems_pb2.UpdateAppItemRequest]:
+    """Minimal UpdateAppItemRequest turning `baseline` into `modified` (None if nothing changed)"""
+    if baseline.id != modified.id:
+        raise ValueError(f'Cannot diff different items: {baseline.id} vs {modified.id}')
+    paths = changed_fields(baseline, modified)
+    if not paths:
+        return None
+    request = appitems_pb2.UpdateAppItemRequest(update_mask=field_mask_pb2.FieldMask(paths=paths))
+    request.appitem.id = modified.id
+    _copy_fields(modified, request.appitem, paths)
+    return request
+
+
+class FlushResults:
+    """Outcome of the updates sent so far.
+
+    An id stays in `errors` (with its latest error) and `failed` (with a
+    request for the fields still unapplied) until later successful calls
+    have written every field of its failed edits.  A success covering only
+    other fields leaves both in place.
+    """
+
+    def __init__(self):
+        self.updated: Dict[str, models_pb2.AppItem] = {}
+        self.errors: Dict[str, grpc.RpcError] = {}
+        self.failed: Dict[str, appitems_pb2.UpdateAppItemRequest] = {}
+        self.calls = 0
+
+    def record(self, request: appitems_pb2.UpdateAppItemRequest, resp: Optional[appitems_pb2.UpdateAppItemResponse],
+               error: Optional[grpc.RpcError]):
+        item_id = request.appitem.id
+        if error is not None:
+            self.errors[item_id] = error
+            failed = self.failed.get(item_id)
+            if failed is None:
+                failed = self.failed[item_id] = appitems_pb2.UpdateAppItemRequest()
+                failed.appitem.id = item_id
+            merge_update(failed, request)
+            return
+        self.updated[item_id] = resp.appitem
+        failed = self.failed.get(item_id)
+        if failed is None:
+            return
+        written = set(_mask_paths(request))
+        remaining = [p for p in failed.update_mask.paths if p not in written]
+        if remaining:
+            del failed.update_mask.paths[:]
+            failed.update_mask.paths.extend(remaining)
+        else:
+            del self.failed[item_id]
+            self.errors.pop(item_id, None)
+
+
+class UpdateBatcher:
+    """Merges partial updates per id and sends them with bounded concurrency.
+
+    Edits accumulate until `max_pending` distinct ids are waiting (or flush()
+    is called, or the batcher is used as a context manager and exits).
+    A later edit to a pending id is merged into it instead of becoming a
+    second call, and at most one call per id is in flight so updates to the
+    same item are applied in order.
+    """
+
+    def __init__(self, stub: appitems_pb2_grpc.AppItemsServiceStub, max_in_flight: int = 16,
+                 max_pending: int = 1000, timeout: Optional[float] = 30.0,
+                 metadata: Optional[Sequence[Tuple[str, str]]] = None):
+        self.stub = stub
+        self.max_in_flight = max_in_flight
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.metadata = metadata
+        self.pending: Dict[str, appitems_pb2.UpdateAppItemRequest] = {}
+        self.results = FlushResults()
+        self.cond = threading.Condition()
+        self.in_flight = set()
+
+    def add(self, baseline: models_pb2.AppItem, modified: models_pb2.AppItem) -> bool:
+        """Queue the diff between two versions, returns False if nothing changed"""
+        request = diff_update(baseline, modified)
+        if request is None:
+            return False
+        self.add_request(request)
+        return True
+
+    def add_request(self, request: appitems_pb2.UpdateAppItemRequest):
+        """Queue an already masked update, merging it with a pending one for the same id"""
+        item_id = request.appitem.id
+        if not item_id:
+            raise ValueError('UpdateAppItemRequest.appitem.id is required')
+        merged = self.pending.get(item_id)
+        if merged is None:
+            merged = appitems_pb2.UpdateAppItemRequest()
+            merged.appitem.id = item_id
+            self.pending[item_id] = merged
+        merge_update(merged, request)
+        if len(self.pending) >= self.max_pending:
+            self.flush(wait=False)
+
+    def extend(self, edits: Iterable[Tuple[models_pb2.AppItem, models_pb2.AppItem]]):
+        for baseline, modified in edits:
+            self.add(baseline, modified)
+
+    def _send(self, request: appitems_pb2.UpdateAppItemRequest):
+        item_id = request.appitem.id
+
+        def on_done(future):
+            try:
+                resp, error = future.result(), None
+            except grpc.RpcError as e:
+                resp, error = None, e
+            with self.cond:
+                self.results.record(request, resp, error)
+                self.in_flight.discard(item_id)
+                self.cond.notify_all()
+
+        with self.cond:
+            self.cond.wait_for(lambda: len(self.in_flight) < self.max_in_flight)
+            self.in_flight.add(item_id)
+            self.results.calls += 1
+        future = self.stub.UpdateAppItem.future(request, timeout=self.timeout, metadata=self.metadata)
+        future.add_done_callback(on_done)
+
+    def _ready_ids(self) -> List[str]:
+        with self.cond:
+            return [item_id for item_id in self.pending if item_id not in self.in_flight]
+
+    def flush(self, wait: bool = True) -> FlushResults:
+        """Send every pending update; with `wait` block until all calls finished.
+
+        Updates for ids that still have a call in flight stay pending until
+        that call completes (immediately when waiting, on the next flush
+        otherwise).
+        """
+        while self.pending:
+            ready = self._ready_ids()
+            if not ready:
+                if not wait:
+                    break
+                with self.cond:
+                    self.cond.wait_for(lambda: any(i not in self.in_flight for i in self.pending))
+                continue
+            for item_id in ready:
+                self._send(self.pending.pop(item_id))
+        if wait:
+            with self.cond:
+                self.cond.wait_for(lambda: not self.in_flight)
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
@@ -0,0 +1,45 @@
+"""
+Shared fixtures for the appitems tests.
+
+Run from python/:
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import grpc
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import appitems  # noqa: E402  (adds gen/python to sys.path)
+
+from apptemplate.v1 import appitems_pb2_grpc  # noqa: E402
+
+from appitems.server import InMemoryAppItemsService, start_local_server  # noqa: E402
+
+
+@pytest.fixture
+def service():
+    return InMemoryAppItemsService()
+
+
+@pytest.fixture
+def target(service):
+    server, target = start_local_server(service, max_workers=8)
+    yield target
+    server.stop(None)
+
+
+@pytest.fixture
+def channel(target):
+    channel = grpc.insecure_channel(target)
+    yield channel
+    channel.close()
+
+
+@pytest.fixture
+def stub(channel):
+    return appitems_pb2_grpc.AppItemsServiceStub(channel)
@@ -0,0 +1,96 @@
+from concurrent import futures
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.batchget import BatchGetError, get_app_items, id_request_bytes, iter_app_items
+
+
+class Failure(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class FakeGetAppItems:
+    """GetAppItems over a dict; `fail(ids, attempt)` may return a status code to fail the call with"""
+
+    def __init__(self, items, fail=None):
+        self.items = items
+        self.fail = fail
+        self.requests = []
+
+    def future(self, request, timeout=None, metadata=None, compression=None):
+        ids = list(request.ids)
+        self.requests.append((ids, compression))
+        future = futures.Future()
+        code = self.fail(ids, sum(1 for r, _ in self.requests if r == ids)) if self.fail else None
+        if code is not None:
+            future.set_exception(Failure(code))
+        else:
+            resp = appitems_pb2.GetAppItemsResponse()
+            for item_id in ids:
+                if item_id in self.items:
+                    resp.appitems[item_id].CopyFrom(self.items[item_id])
+            future.set_result(resp)
+        return future
+
+
+def fake_stub(count=100, fail=None):
+    items = {f'id-{i:03d}': models_pb2.AppItem(id=f'id-{i:03d}', name='x' * 50) for i in range(count)}
+    stub = type('Stub', (), {})()
+    stub.GetAppItems = FakeGetAppItems(items, fail)
+    return stub
+
+
+def test_id_request_bytes_matches_serialized_size():
+    for item_id in ('', 'a', 'x' * 200):
+        assert id_request_bytes(item_id) == appitems_pb2.GetAppItemsRequest(ids=[item_id]).ByteSize()
+
+
+def test_batches_respect_budgets_and_dedupe():
+    stub = fake_stub()
+    ids = [f'id-{i:03d}' for i in range(100)] * 2 + ['missing']
+    items = get_app_items(stub, ids, max_ids=16, compress_over=None)
+    assert len(items) == 100
+    sent = [item_id for request, _ in stub.GetAppItems.requests for item_id in request]
+    assert sorted(sent) == sorted(set(ids))
+    assert max(len(request) for request, _ in stub.GetAppItems.requests) <= 16
+
+
+def test_large_requests_are_compressed():
+    stub = fake_stub(10)
+    get_app_items(stub, [f'id-{i:03d}' for i in range(10)], compress_over=1)
+    assert all(compression == grpc.Compression.Gzip for _, compression in stub.GetAppItems.requests)
+
+
+def test_resource_exhausted_splits_and_transient_errors_retry():
+    def fail(ids, attempt):
+        if len(ids) > 5:
+            return grpc.StatusCode.RESOURCE_EXHAUSTED
+        if attempt == 1 and 'id-000' in ids:
+            return grpc.StatusCode.UNAVAILABLE
+        return None
+
+    stub = fake_stub(20, fail)
+    items = dict(iter_app_items(stub, [f'id-{i:03d}' for i in range(20)], max_ids=20, backoff=0.001))
+    assert len(items) == 20
+    requests = [ids for ids, _ in stub.GetAppItems.requests]
+    assert len(requests[0]) == 20
+    # The oversized batch was halved until it fit, and the UNAVAILABLE one was sent again
+    assert sum(1 for ids in requests if 'id-000' in ids and len(ids) <= 5) == 2
+
+
+def test_permanent_failures_raise_with_partial_results():
+    def fail(ids, attempt):
+        return grpc.StatusCode.PERMISSION_DENIED if 'id-000' in ids else None
+
+    stub = fake_stub(10, fail)
+    with pytest.raises(BatchGetError) as e:
+        get_app_items(stub, [f'id-{i:03d}' for i in range(10)], max_ids=2)
+    assert set(e.value.failed) == {'id-000', 'id-001'}
+    assert len(e.value.partial) == 8
@@ -0,0 +1,128 @@
+import grpc
+import pytest
+from google.protobuf import field_mask_pb2
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.cache import AppItemCache
+from appitems.metrics import MetricsRegistry
+
+
+def create(stub, **fields):
+    return stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(**fields))).appitem
+
+
+def rename(stub, item_id, name):
+    stub.UpdateAppItem(appitems_pb2.UpdateAppItemRequest(appitem=models_pb2.AppItem(id=item_id, name=name),
+                                                         update_mask=field_mask_pb2.FieldMask(paths=['name'])))
+
+
+class CountingStub:
+    """Forwards to a real stub, recording the requests"""
+
+    def __init__(self, stub):
+        self.stub = stub
+        self.requests = []
+
+    def GetAppItem(self, request, **kwargs):
+        self.requests.append(request)
+        return self.stub.GetAppItem(request, **kwargs)
+
+    def GetAppItems(self, request, **kwargs):
+        self.requests.append(request)
+        return self.stub.GetAppItems(request, **kwargs)
+
+
+def test_get_is_not_modified_for_the_current_version(stub):
+    item = create(stub, name='Chess')
+    first = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id))
+    assert first.version and not first.not_modified and first.appitem == item
+
+    again = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id, version=first.version))
+    assert again.not_modified and not again.HasField('appitem') and again.version == first.version
+
+    rename(stub, item.id, 'Go')
+    changed = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id, version=first.version))
+    assert not changed.not_modified and changed.appitem.name == 'Go' and changed.version != first.version
+
+
+def test_get_many_splits_not_modified_ids(stub):
+    a, b, c = (create(stub, name=name) for name in 'abc')
+    versions = stub.GetAppItems(appitems_pb2.GetAppItemsRequest(ids=[a.id, b.id, c.id])).versions
+    rename(stub, b.id, 'B')
+
+    request = appitems_pb2.GetAppItemsRequest(ids=[a.id, b.id, c.id, 'missing'])
+    request.versions.update({a.id: versions[a.id], b.id: versions[b.id]})
+    resp = stub.GetAppItems(request)
+    assert list(resp.not_modified_ids) == [a.id]
+    assert set(resp.appitems) == {b.id, c.id} and resp.appitems[b.id].name == 'B'
+    assert set(resp.versions) == {a.id, b.id, c.id} and resp.versions[b.id] != versions[b.id]
+
+
+def test_cache_serves_fresh_entries_without_a_call(stub):
+    item = create(stub, name='Chess')
+    counting = CountingStub(stub)
+    cache = AppItemCache(counting, ttl=60)
+    assert cache.get(item.id) == item
+    assert cache.get(item.id) == item
+    assert len(counting.requests) == 1
+    assert cache.stats == {'hit': 1, 'not_modified': 0, 'fetched': 1, 'missing': 0}
+
+
+def test_cache_revalidates_stale_entries(stub):
+    item = create(stub, name='Chess')
+    counting = CountingStub(stub)
+    registry = MetricsRegistry()
+    cache = AppItemCache(counting, ttl=0, registry=registry)
+    cache.get(item.id)
+    assert cache.get(item.id) == item
+    assert counting.requests[0].version == '' and counting.requests[1].version
+    assert cache.stats['not_modified'] == 1
+
+    rename(stub, item.id, 'Go')
+    assert cache.get(item.id).name == 'Go'
+    assert cache.stats == {'hit': 0, 'not_modified': 1, 'fetched': 2, 'missing': 0}
+    assert registry.counter('appitems_cache_reads_total', {'result': 'fetched'}) == 2
+
+
+def test_cache_drops_deleted_items(stub):
+    item = create(stub, name='Gone')
+    cache = AppItemCache(stub, ttl=0)
+    cache.get(item.id)
+    stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id=item.id))
+    with pytest.raises(grpc.RpcError) as e:
+        cache.get(item.id)
+    assert e.value.code() == grpc.StatusCode.NOT_FOUND
+    assert item.id not in cache and cache.stats['missing'] == 1
+
+
+def test_cache_get_many_revalidates_in_one_call(stub):
+    a, b, c = (create(stub, name=name) for name in 'abc')
+    counting = CountingStub(stub)
+    cache = AppItemCache(counting, ttl=0)
+    cache.get_many([a.id, b.id])
+    rename(stub, b.id, 'B')
+    stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id=a.id))
+
+    items = cache.get_many([a.id, b.id, c.id, c.id])
+    assert set(items) == {b.id, c.id} and items[b.id].name == 'B' and items[c.id] == c
+    assert len(counting.requests) == 2
+    request = counting.requests[1]
+    assert list(request.ids) == [a.id, b.id, c.id] and set(request.versions) == {a.id, b.id}
+    assert a.id not in cache
+    assert cache.stats == {'hit': 0, 'not_modified': 0, 'fetched': 4, 'missing': 1}
+
+    cache.get_many([b.id, c.id])
+    assert cache.stats['not_modified'] == 2
+
+
+def test_cache_evicts_least_recently_used(stub):
+    ids = [create(stub, name=name).id for name in 'abc']
+    cache = AppItemCache(stub, max_items=2, ttl=60)
+    cache.get(ids[0])
+    cache.get(ids[1])
+    cache.get(ids[0])
+    cache.get(ids[2])
+    assert list(cache.entries) == [ids[0], ids[2]]
+    cache.invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from apptemplate.v1 import appitems_pb2  # noqa: E402
+
+from appitems.columnar import AppItemColumns, StringColumn, to_columns  # noqa: E402
+from appitems.fixtures import iter_corpus  # noqa: E402
+from appitems.lazy import GetAppItemsView, ListAppItemsView  # noqa: E402
+
+
+def corpus(count: int):
+    items = list(iter_corpus(count, num_tags=3))
+    for i, item in enumerate(items):
+        item.created_at.FromNanoseconds(1_700_000_000_000_000_000 + i)
+        item.updated_at.FromNanoseconds(1_700_000_000_000_000_000 + 2 * i)
+    return items
+
+
+def assert_matches(columns: AppItemColumns, items):
+    assert len(columns) == len(items)
+    assert columns.id.tolist() == [item.id for item in items]
+    assert columns.name.tolist() == [item.name for item in items]
+    assert columns.created_at.tolist() == [item.created_at.ToNanoseconds() for item in items]
+    assert columns.updated_at.tolist() == [item.updated_at.ToNanoseconds() for item in items]
+    for row, item in enumerate(items):
+        assert columns.tags_of(row) == list(item.tags)
+        assert columns.difficulty_of(row) == item.difficulty
+
+
+def test_string_column_handles_unicode():
+    column = StringColumn.concat([StringColumn.from_strings(['a', 'ünï']), StringColumn.from_strings(['', 'ç'])])
+    assert column.tolist() == ['a', 'ünï', '', 'ç']
+    assert column[1] == 'ünï'
+
+
+def test_chunks_concatenate_in_order():
+    items = corpus(50)
+    # A chunk size that does not divide the row count exercises the partial last chunk
+    assert_matches(to_columns(items, chunk_size=16), items)
+
+
+def test_accepts_responses_and_empty_input():
+    items = corpus(6)
+    responses = [appitems_pb2.ListAppItemsResponse(items=items[:4]), appitems_pb2.ListAppItemsResponse(items=items[4:])]
+    assert_matches(to_columns(responses), items)
+    assert len(to_columns([])) == 0
+
+
+def test_lazy_views_fill_the_same_columns():
+    items = corpus(30)
+    pages = [ListAppItemsView(appitems_pb2.ListAppItemsResponse(items=items[i:i + 7]).SerializeToString())
+             for i in range(0, 30, 7)]
+    assert_matches(to_columns(pages, chunk_size=8), items)
+    many = appitems_pb2.GetAppItemsResponse(appitems={item.id: item for item in items[:3]})
+    view = GetAppItemsView(many.SerializeToString())
+    assert_matches(to_columns([view]), [many.appitems[item_id] for item_id in view])
+
+
+def test_save_and_memory_map(tmp_path):
+    items = corpus(20)
+    to_columns(items).save(str(tmp_path))
+    loaded = AppItemColumns.load(str(tmp_path))
+    assert isinstance(loaded.created_at, np.memmap)
+    assert_matches(loaded, items)
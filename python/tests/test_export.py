@@ -0,0 +1,145 @@
+import os
+import random
+from concurrent import futures
+
+import grpc
+import pytest
+from google.protobuf import field_mask_pb2
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.export import ItemWriter, MixedOwners, export_catalog, import_catalog, iter_snapshot, read_items
+from appitems.fixtures import make_appitem
+from appitems.server import OWNER_METADATA_KEY
+
+
+def seed(stub, count: int, owner_id: str = ''):
+    rng = random.Random(0)
+    metadata = [(OWNER_METADATA_KEY, owner_id)] if owner_id else None
+    for _ in range(count):
+        stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=make_appitem(rng)), metadata=metadata)
+
+
+@pytest.mark.parametrize('name', ['catalog.pb', 'catalog.ndjson.gz'])
+def test_export_import_round_trip(stub, service, tmp_path, name):
+    seed(stub, 25)
+    path = str(tmp_path / name)
+    stats = export_catalog(stub, path, page_size=7)
+    assert stats['records'] == 25
+    exported = list(read_items(path))
+    assert {item.id for item in exported} == set(service.handler.store.items)
+
+    # Everything is already there, so a replay only skips
+    assert import_catalog(stub, path, max_in_flight=4)['skipped'] == 25
+    for item in exported:
+        service.handler.store.delete(item.id)
+    stats = import_catalog(stub, path, max_in_flight=4)
+    assert (stats['created'], stats['skipped'], stats['failed']) == (25, 0, 0)
+
+
+def test_items_updated_during_export_are_not_missed(stub, service, tmp_path):
+    seed(stub, 20)
+    path = str(tmp_path / 'catalog.pb')
+    items = iter_snapshot(stub)
+    first = next(items)
+    # Items are listed newest first, so updating the oldest would move it ahead of a ListAppItems page key
+    for item_id in list(service.handler.store.items):
+        stub.UpdateAppItem(appitems_pb2.UpdateAppItemRequest(
+            appitem=models_pb2.AppItem(id=item_id, name='renamed'),
+            update_mask=field_mask_pb2.FieldMask(paths=['name'])))
+    rest = list(items)
+    assert len({item.id for item in [first] + rest}) == 20
+    assert all(item.name != 'renamed' for item in rest)
+
+    stats = export_catalog(stub, path, page_size=3)
+    assert (stats['records'], stats['consistent']) == (20, True)
+
+
+def test_export_refuses_items_of_other_owners(stub, service, tmp_path):
+    seed(stub, 5)
+    seed(stub, 3, owner_id='alice')
+    path = str(tmp_path / 'catalog.pb')
+    with pytest.raises(MixedOwners, match='alice'):
+        export_catalog(stub, path)
+    assert not os.path.exists(path)
+
+    # One owner at a time round-trips, keeping the owner
+    alice = export_catalog(stub, path, owner_id='alice')
+    assert (alice['records'], alice['owner_id']) == (3, 'alice')
+    exported = [item.id for item in read_items(path)]
+    for item_id in exported:
+        service.handler.store.delete(item_id)
+    assert import_catalog(stub, path, owner_id='alice')['created'] == 3
+    assert {service.handler.store.owner_of(item_id) for item_id in exported} == {'alice'}
+
+
+class NoWatch:
+    """Stub of a server without WatchAppItems"""
+
+    def __init__(self, stub):
+        self.ListAppItems = stub.ListAppItems
+
+    def WatchAppItems(self, request, timeout=None):
+        return NoWatchCall()
+
+
+class NoWatchCall:
+    def __iter__(self):
+        raise NoWatchError()
+
+    def cancel(self):
+        pass
+
+
+class NoWatchError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+
+def test_export_falls_back_to_pages_without_watch(stub, tmp_path):
+    seed(stub, 8)
+    stats = export_catalog(NoWatch(stub), str(tmp_path / 'catalog.pb'), page_size=3)
+    assert (stats['records'], stats['consistent']) == (8, False)
+
+
+def test_read_items_skip_and_truncation(tmp_path):
+    path = str(tmp_path / 'items.pb')
+    rng = random.Random(1)
+    with ItemWriter(path) as writer:
+        for i in range(5):
+            writer.write(make_appitem(rng, item_id=f'id-{i}'))
+    assert [item.id for item in read_items(path, skip=3)] == ['id-3', 'id-4']
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:-3])
+    with pytest.raises(ValueError):
+        list(read_items(path))
+
+
+class BrokenCreate:
+    """CreateAppItem whose calls fail with something other than an RpcError"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def future(self, request, timeout=None, metadata=None):
+        self.calls += 1
+        future = futures.Future()
+        future.set_exception(RuntimeError('connection reset'))
+        return future
+
+
+def test_import_releases_slots_on_unexpected_errors(tmp_path):
+    path = str(tmp_path / 'items.pb')
+    rng = random.Random(2)
+    with ItemWriter(path) as writer:
+        for _ in range(10):
+            writer.write(make_appitem(rng))
+
+    stub = type('Stub', (), {})()
+    stub.CreateAppItem = BrokenCreate()
+    stats = import_catalog(stub, path, max_in_flight=2)
+    assert stub.CreateAppItem.calls == 10
+    assert stats['failed'] == 10
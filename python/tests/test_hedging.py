@@ -0,0 +1,117 @@
+import threading
+import time
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.hedging import CallPolicy, HedgedAppItemsStub
+from appitems.metrics import MetricsRegistry
+from appitems.server import InMemoryAppItemsService, start_local_server
+
+
+class StallingService(InMemoryAppItemsService):
+    """Stalls the GetAppItem calls listed in `stall` until the client cancels them"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.stall = set()
+        self.cancelled = threading.Event()
+        self.lock = threading.Lock()
+
+    def GetAppItem(self, request, context):
+        with self.lock:
+            call = self.calls
+            self.calls += 1
+        if call in self.stall:
+            context.add_callback(self.cancelled.set)
+            deadline = time.monotonic() + 5
+            while context.is_active() and time.monotonic() < deadline:
+                time.sleep(0.005)
+            context.abort(grpc.StatusCode.CANCELLED, 'stalled')
+        return super().GetAppItem(request, context)
+
+
+@pytest.fixture
+def stalling():
+    service = StallingService()
+    server, target = start_local_server(service)
+    channel = grpc.insecure_channel(target)
+    stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+    item = stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='Hedge'))).appitem
+    yield service, stub, item
+    channel.close()
+    server.stop(None)
+
+
+def test_hedge_wins_and_primary_is_cancelled(stalling):
+    service, raw, item = stalling
+    service.stall = {0}
+    registry = MetricsRegistry()
+    stub = HedgedAppItemsStub(raw, CallPolicy(hedge_initial_delay=0.05), registry)
+    started = time.monotonic()
+    resp = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id), timeout=3)
+    assert resp.appitem.id == item.id
+    assert time.monotonic() - started < 2
+    assert service.cancelled.wait(2), 'the losing primary call was not cancelled'
+    assert registry.counter('grpc_client_hedges_total') == 1
+    assert registry.counter('grpc_client_hedge_wins_total') == 1
+    # The slow primary still counts, at least as long as it ran before the hedge answered
+    hist = stub.latencies['GetAppItem']
+    assert hist.total == 1 and hist.max >= 0.05
+
+
+def test_unhedged_calls_still_feed_the_histogram(stalling):
+    _, raw, item = stalling
+    stub = HedgedAppItemsStub(raw, CallPolicy(hedge=False, hedge_min_samples=5))
+    for _ in range(5):
+        stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id))
+    hist = stub.latencies['GetAppItem']
+    assert hist.total == 5
+    policy = stub.policy
+    expected = min(max(hist.percentile(95), policy.hedge_min_delay), policy.hedge_max_delay)
+    assert stub.hedge_delay('GetAppItem') == expected
+
+
+def test_fast_primary_sends_no_hedge(stalling):
+    _, raw, item = stalling
+    registry = MetricsRegistry()
+    stub = HedgedAppItemsStub(raw, CallPolicy(hedge_initial_delay=1.0), registry)
+    stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id))
+    assert registry.counter('grpc_client_hedges_total') == 0
+    assert stub.latencies['GetAppItem'].total == 1
+
+
+class FlakyGet:
+    """GetAppItem whose first `failures` calls go to a closed port and fail with UNAVAILABLE"""
+
+    def __init__(self, stub, failures):
+        self.stub = stub
+        self.failures = failures
+        self.dead = appitems_pb2_grpc.AppItemsServiceStub(grpc.insecure_channel('127.0.0.1:1'))
+
+    def future(self, request, timeout=None, metadata=None):
+        if self.failures:
+            self.failures -= 1
+            return self.dead.GetAppItem.future(request, timeout=timeout)
+        return self.stub.GetAppItem.future(request, timeout=timeout, metadata=metadata)
+
+
+def test_unavailable_is_retried_within_the_deadline(stalling):
+    _, raw, item = stalling
+    wrapper = type('Stub', (), {})()
+    wrapper.GetAppItem = FlakyGet(raw, failures=2)
+    registry = MetricsRegistry()
+    stub = HedgedAppItemsStub(wrapper, CallPolicy(hedge=False, backoff=0.01), registry)
+    assert stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item.id), timeout=5).appitem.id == item.id
+    assert registry.counter('grpc_client_retries_total') == 2
+
+
+def test_writes_are_not_retried(stalling):
+    _, raw, item = stalling
+    stub = HedgedAppItemsStub(raw)
+    with pytest.raises(grpc.RpcError) as e:
+        stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id='missing'))
+    assert e.value.code() == grpc.StatusCode.NOT_FOUND
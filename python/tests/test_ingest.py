@@ -0,0 +1,115 @@
+import json
+import random
+
+import grpc
+import pytest
+
+from apptemplate.v1 import models_pb2
+
+from appitems.export import ItemWriter
+from appitems.fixtures import make_appitem
+from appitems.ingest import Ingester, iter_batches, load_checkpoint, source_info
+
+
+def write_items(path, count, invalid=()):
+    rng = random.Random(0)
+    with ItemWriter(str(path)) as writer:
+        for i in range(count):
+            item = make_appitem(rng, num_tags=2, description_size=16)
+            if i in invalid:
+                item.name = ''
+            writer.write(item)
+    return str(path)
+
+
+class Failed(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class FlakyStub:
+    """Forwards CreateAppItems to a real stub, failing the calls numbered in `failures` with their code"""
+
+    def __init__(self, stub, failures):
+        self.stub = stub
+        self.failures = failures
+        self.calls = 0
+
+    def CreateAppItems(self, requests, **kwargs):
+        self.calls += 1
+        code = self.failures.get(self.calls)
+        if code is not None:
+            list(requests)
+            raise Failed(code)
+        return self.stub.CreateAppItems(requests, **kwargs)
+
+
+def test_iter_batches_caps_items_and_bytes():
+    items = [models_pb2.AppItem(id=str(i), description='x' * 100) for i in range(10)]
+    assert [len(r.appitems) for r in iter_batches(items, batch_size=4)] == [4, 4, 2]
+    by_bytes = list(iter_batches(items, batch_size=100, max_request_bytes=250))
+    assert [len(r.appitems) for r in by_bytes] == [2] * 5
+    # An item larger than the cap still goes out, on its own
+    assert [len(r.appitems) for r in iter_batches(items[:2], max_request_bytes=10)] == [1, 1]
+
+
+def test_ingest_creates_items_with_stable_ids(stub, service, tmp_path):
+    path = write_items(tmp_path / 'seed.pb', 23, invalid={5})
+    results = []
+    ingester = Ingester(stub, records_per_call=10, batch_size=4, max_streams=2,
+                        on_result=lambda record, result: results.append(record))
+    stats = ingester.ingest(path)
+    assert (stats['records'], stats['created'], stats['skipped'], stats['failed']) == (23, 22, 0, 1)
+    assert [error['record'] for error in stats['errors']] == [5] and 'name' in stats['errors'][0]['field_errors']
+    assert sorted(results) == list(range(23))
+    assert len(service.handler.store) == 22
+
+    # Ids are derived from the file and record number, so a replay only skips
+    again = Ingester(stub, records_per_call=10).ingest(path)
+    assert (again['created'], again['skipped'], again['failed']) == (0, 22, 1)
+
+
+def test_ingest_resumes_from_checkpoint(stub, service, tmp_path):
+    path = write_items(tmp_path / 'seed.ndjson.gz', 25)
+    checkpoint = str(tmp_path / 'seed.ckpt')
+    flaky = FlakyStub(stub, {3: grpc.StatusCode.INTERNAL})
+    with pytest.raises(grpc.RpcError):
+        Ingester(flaky, records_per_call=10, max_streams=1).ingest(path, checkpoint=checkpoint)
+    state = load_checkpoint(checkpoint, source_info(path))
+    assert (state['records'], state['created'], state['complete']) == (20, 20, False)
+    assert len(service.handler.store) == 20
+
+    stats = Ingester(stub, records_per_call=10).ingest(path, checkpoint=checkpoint)
+    assert (stats['resumed_from'], stats['records'], stats['created'], stats['skipped']) == (20, 25, 25, 0)
+    assert len(service.handler.store) == 25
+    with open(checkpoint) as f:
+        assert json.load(f)['complete']
+
+    # A finished checkpoint resumes at the end and sends nothing
+    counting = FlakyStub(stub, {})
+    assert Ingester(counting).ingest(path, checkpoint=checkpoint)['resumed_from'] == 25
+    assert counting.calls == 0
+
+
+def test_ingest_retries_transient_failures(stub, service, tmp_path):
+    path = write_items(tmp_path / 'seed.pb', 12)
+    flaky = FlakyStub(stub, {1: grpc.StatusCode.UNAVAILABLE})
+    stats = Ingester(flaky, records_per_call=12, backoff=0).ingest(path)
+    assert (stats['created'], stats['retries'], flaky.calls) == (12, 1, 2)
+
+    failing = FlakyStub(stub, {n: grpc.StatusCode.UNAVAILABLE for n in range(1, 10)})
+    with pytest.raises(grpc.RpcError):
+        Ingester(failing, max_attempts=3, backoff=0).ingest(path)
+    assert failing.calls == 3
+
+
+def test_checkpoint_for_another_file_is_rejected(stub, tmp_path):
+    first = write_items(tmp_path / 'first.pb', 3)
+    second = write_items(tmp_path / 'second.pb', 4)
+    checkpoint = str(tmp_path / 'seed.ckpt')
+    Ingester(stub).ingest(first, checkpoint=checkpoint)
+    with pytest.raises(ValueError, match='different input'):
+        Ingester(stub).ingest(second, checkpoint=checkpoint)
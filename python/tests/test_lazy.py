@@ -0,0 +1,93 @@
+import random
+
+import pytest
+from google.protobuf.internal import api_implementation
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.fixtures import make_appitem
+from appitems.lazy import (VIEWS_FASTER, AppItemView, GetAppItemsView, GetAppItemView, LazyAppItemsStub,
+                           ListAppItemsView, index_fields)
+
+
+def sample_item(i: int = 0) -> models_pb2.AppItem:
+    item = make_appitem(random.Random(i), item_id=f'id-{i}')
+    item.created_at.FromNanoseconds(1_700_000_000_123_456_789 + i)
+    item.updated_at.FromNanoseconds(1_700_000_001_000_000_000 + i)
+    return item
+
+
+def test_item_view_matches_message():
+    item = sample_item()
+    view = AppItemView(item.SerializeToString())
+    for name in ('id', 'name', 'description', 'image_url', 'difficulty', 'created_at', 'updated_at'):
+        assert getattr(view, name) == getattr(item, name)
+    assert view.tags == list(item.tags)
+    assert view.updated_at_ns == item.updated_at.ToNanoseconds()
+    assert view.to_message() == item
+
+
+def test_negative_timestamps_and_truncation():
+    item = models_pb2.AppItem(id='old')
+    item.created_at.FromNanoseconds(-1_500_000_000)
+    assert AppItemView(item.SerializeToString()).created_at_ns == -1_500_000_000
+    data = sample_item().SerializeToString()
+    with pytest.raises(ValueError):
+        index_fields(memoryview(data[:-1]))
+    # Cut inside a multi-byte varint, and right after a length-delimited key
+    for truncated in (b'\x08\x80', data[:1]):
+        with pytest.raises(ValueError, match='Truncated'):
+            index_fields(memoryview(truncated))
+
+
+def test_list_view():
+    resp = appitems_pb2.ListAppItemsResponse(items=[sample_item(i) for i in range(3)])
+    resp.pagination.has_more = True
+    view = ListAppItemsView(resp.SerializeToString())
+    assert [item.id for item in view] == ['id-0', 'id-1', 'id-2']
+    assert view.pagination.has_more
+    assert view.to_message() == resp
+
+
+def test_get_many_view_versions():
+    resp = appitems_pb2.GetAppItemsResponse(appitems={'id-1': sample_item(1)}, versions={'id-1': 'a', 'id-2': 'b'},
+                                            not_modified_ids=['id-2'])
+    view = GetAppItemsView(resp.SerializeToString())
+    assert list(view) == ['id-1'] and view['id-1'].name == resp.appitems['id-1'].name
+    assert 'id-2' not in view
+    assert view.versions == {'id-1': 'a', 'id-2': 'b'}
+    assert view.not_modified_ids == ['id-2']
+
+
+def test_get_view_versions():
+    view = GetAppItemView(appitems_pb2.GetAppItemResponse(version='17', not_modified=True).SerializeToString())
+    assert (view.version, view.not_modified) == ('17', True)
+    assert view.appitem.id == ''
+
+
+def test_fields_without_accessors_fall_back_to_full_parse():
+    resp = appitems_pb2.ListAppItemsResponse(items=[sample_item()])
+    view = ListAppItemsView(resp.SerializeToString())
+    assert view.ByteSize() == resp.ByteSize()
+    with pytest.raises(AttributeError):
+        view.no_such_field
+
+
+def test_lazy_stub_uses_views_only_where_they_are_faster(channel):
+    assert LazyAppItemsStub(channel).views == VIEWS_FASTER
+    assert VIEWS_FASTER == (api_implementation.Type() == 'python')
+
+
+@pytest.mark.parametrize('views', [True, False])
+def test_lazy_stub_against_server(stub, channel, views):
+    created = stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='Lazy'))).appitem
+    lazy = LazyAppItemsStub(channel, views=views)
+    got = lazy.GetAppItem(appitems_pb2.GetAppItemRequest(id=created.id))
+    assert got.appitem.name == 'Lazy' and got.version and not got.not_modified
+    again = lazy.GetAppItem(appitems_pb2.GetAppItemRequest(id=created.id, version=got.version))
+    assert again.not_modified
+    many = lazy.GetAppItems(appitems_pb2.GetAppItemsRequest(ids=[created.id], versions={created.id: got.version}))
+    assert many.not_modified_ids == [created.id] and many.versions == {created.id: got.version}
+    assert [item.id for item in lazy.ListAppItems(appitems_pb2.ListAppItemsRequest()).items] == [created.id]
+    page = lazy.ListAppItems(appitems_pb2.ListAppItemsRequest())
+    assert isinstance(page, ListAppItemsView if views else appitems_pb2.ListAppItemsResponse)
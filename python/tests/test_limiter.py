@@ -0,0 +1,151 @@
+import threading
+import time
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.limiter import AdaptiveLimiter, LimiterClientInterceptor, LimiterRejected
+from appitems.metrics import MetricsRegistry
+
+
+def round_trip(limiter: AdaptiveLimiter, rtt: float):
+    """Fill the limit, then complete every call with latency `rtt`"""
+    slots = int(limiter.limit)
+    for _ in range(slots):
+        limiter.acquire()
+    for _ in range(slots):
+        limiter.release(rtt)
+    time.sleep(rtt * 2)
+
+
+def test_burst_of_drops_cuts_the_limit_once():
+    limiter = AdaptiveLimiter(initial_limit=100, backoff_ratio=0.5)
+    for _ in range(20):
+        limiter.acquire()
+    # Twenty calls in flight together all time out: one overload, one cut
+    for _ in range(20):
+        limiter.release(rtt=0.5, dropped=True)
+    assert (limiter.drops, limiter.decreases, int(limiter.limit)) == (20, 1, 50)
+
+    # A call started after the cut that fails again is a new overload
+    time.sleep(0.01)
+    limiter.acquire()
+    limiter.release(rtt=0.001, dropped=True)
+    assert (limiter.decreases, int(limiter.limit)) == (2, 25)
+
+
+def test_drops_respect_min_limit():
+    limiter = AdaptiveLimiter(initial_limit=4, min_limit=2, backoff_ratio=0.1)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(rtt=0.0, dropped=True)
+    assert limiter.limit == 2
+
+
+def test_gradient_grows_at_baseline_and_shrinks_when_queueing():
+    limiter = AdaptiveLimiter(initial_limit=10, smoothing=0.5)
+    for _ in range(10):
+        round_trip(limiter, 0.001)
+    grown = limiter.limit
+    assert grown > 10
+    for _ in range(10):
+        round_trip(limiter, 0.01)
+    assert limiter.limit < grown
+    assert limiter.long_rtt < 0.005
+
+
+def test_gradient_does_not_grow_while_app_limited():
+    limiter = AdaptiveLimiter(initial_limit=50)
+    for _ in range(40):
+        limiter.acquire()
+        limiter.release(0.001)
+    assert limiter.limit <= 50
+
+
+def test_aimd_grows_additively_while_the_limit_is_used():
+    limiter = AdaptiveLimiter(algorithm='aimd', initial_limit=4)
+    # Each call completing while at least half the limit is in use adds 1/limit
+    for _ in range(10):
+        round_trip(limiter, 0.001)
+    assert 7 < limiter.limit < 14
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(algorithm='nope')
+
+
+def test_queue_bound_and_wait_timeout():
+    registry = MetricsRegistry()
+    limiter = AdaptiveLimiter(name='t', initial_limit=1, max_queue=1, registry=registry)
+    limiter.acquire()
+    with pytest.raises(LimiterRejected) as e:
+        limiter.acquire(timeout=0.01)
+    assert e.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+
+    waiter = threading.Thread(target=limiter.acquire)
+    waiter.start()
+    while limiter.queue_depth == 0:
+        time.sleep(0.001)
+    with pytest.raises(LimiterRejected) as e:
+        limiter.acquire()
+    assert e.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    limiter.release()
+    waiter.join(1)
+    assert limiter.in_flight == 1
+    assert registry.counter('grpc_client_limiter_rejected_total') == 2
+    assert 'grpc_client_queue_depth{target="t"} 0' in registry.render_prometheus()
+
+
+def test_interceptor_gates_calls(target):
+    limiter = AdaptiveLimiter(initial_limit=2)
+    channel = grpc.intercept_channel(grpc.insecure_channel(target), LimiterClientInterceptor(limiter))
+    stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+    calls = [stub.CreateAppItem.future(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name=f'{i}')))
+             for i in range(10)]
+    assert all(call.result().appitem.id for call in calls)
+    deadline = time.monotonic() + 1
+    while limiter.in_flight and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert limiter.in_flight == 0 and limiter.samples == 10
+    channel.close()
+
+
+def test_rejected_future_calls_keep_their_code(target):
+    limiter = AdaptiveLimiter(initial_limit=1, max_queue=0)
+    channel = grpc.intercept_channel(grpc.insecure_channel(target), LimiterClientInterceptor(limiter))
+    stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+    request = appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='shed'))
+    limiter.acquire()
+    future = stub.CreateAppItem.future(request)
+    assert future.done() and future.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert isinstance(future.exception(), LimiterRejected)
+    with pytest.raises(LimiterRejected) as e:
+        stub.CreateAppItem(request)
+    assert e.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    limiter.release()
+    channel.close()
+
+
+class SlowLimiter(AdaptiveLimiter):
+    """Grants slots only after `delay`, as a long queue would"""
+
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+
+    def acquire(self, timeout=None):
+        time.sleep(self.delay)
+        super().acquire(timeout)
+
+
+def test_deadline_spent_queueing_is_not_a_drop(target):
+    limiter = SlowLimiter(0.05, initial_limit=8)
+    channel = grpc.intercept_channel(grpc.insecure_channel(target), LimiterClientInterceptor(limiter))
+    stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+    future = stub.CreateAppItem.future(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='late')),
+                                       timeout=0.02)
+    assert future.code() == grpc.StatusCode.DEADLINE_EXCEEDED and isinstance(future.exception(), LimiterRejected)
+    # The call was never sent: the slot is back, and neither a sample nor a drop was recorded
+    assert (limiter.in_flight, limiter.samples, limiter.drops, limiter.limit) == (0, 0, 0, 8)
+    assert limiter.rejected == 1
+    channel.close()
@@ -0,0 +1,38 @@
+import grpc
+import pytest
+
+from appitems.loadgen import LoadConfig, Recorder, parse_mix, percentile, run_load
+
+
+def test_parse_mix():
+    assert parse_mix('GetAppItem=60, ListAppItems=40,') == {'GetAppItem': 60.0, 'ListAppItems': 40.0}
+    with pytest.raises(ValueError):
+        parse_mix('NoSuchMethod=1')
+
+
+def test_percentile():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 99) == 0.0
+
+
+def test_recorder_ignores_warmup():
+    recorder = Recorder()
+    recorder.record('GetAppItem', 0.1, grpc.StatusCode.OK)
+    assert recorder.elapsed() == 0.0
+    recorder.start()
+    recorder.record('GetAppItem', 0.2, grpc.StatusCode.OK)
+    assert recorder.latencies['GetAppItem'] == [0.2]
+
+
+@pytest.mark.parametrize('mode', ['closed', 'open'])
+def test_report_uses_measured_time(target, mode):
+    config = LoadConfig(target=target, mode=mode, rate=200, concurrency=2, duration=0.5, warmup=0.1,
+                        seed_items=20)
+    report = run_load(config)
+    assert report['requests'] > 0
+    # The rate is derived from the measured window, not the configured duration
+    assert report['duration_s'] == pytest.approx(0.5, abs=0.2)
+    assert report['throughput_rps'] == pytest.approx(report['requests'] / report['duration_s'], rel=0.01)
+    assert sum(m['requests'] for m in report['methods'].values()) == report['requests']
@@ -0,0 +1,72 @@
+import random
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc
+
+from appitems.fixtures import make_appitem
+from appitems.interceptors import MetricsClientInterceptor, MetricsServerInterceptor
+from appitems.metrics import LogHistogram, MetricsRegistry, split_method
+from appitems.server import start_local_server
+
+GET = '/apptemplate.v1.AppItemsService/GetAppItem'
+CREATE = '/apptemplate.v1.AppItemsService/CreateAppItem'
+
+
+def test_histogram_percentiles_within_bucket_error():
+    hist = LogHistogram()
+    for i in range(1, 1001):
+        hist.record(i / 1000.0)
+    assert hist.total == 1000
+    assert hist.max == 1.0
+    # Buckets grow by sqrt(2), so estimates are within that factor
+    assert 0.5 / 1.42 <= hist.percentile(50) <= 0.5 * 1.42
+    assert hist.percentile(100) == 1.0
+    assert LogHistogram().percentile(99) == 0.0
+
+
+def test_split_method():
+    assert split_method(GET) == ('apptemplate.v1.AppItemsService', 'GetAppItem')
+
+
+def test_counters_and_gauges():
+    registry = MetricsRegistry()
+    registry.increment('things_total', {'kind': 'a'}, help_text='Things')
+    registry.increment('things_total', {'kind': 'b'}, value=2)
+    registry.register_gauge('depth', lambda: 7)
+    assert registry.counter('things_total', {'kind': 'a'}) == 1
+    assert registry.counter('things_total') == 3
+    text = registry.render_prometheus()
+    assert '# HELP things_total Things' in text
+    assert 'things_total{kind="b"} 2' in text
+    assert 'depth 7' in text
+
+
+@pytest.fixture
+def metered():
+    registry = MetricsRegistry()
+    server, target = start_local_server(interceptors=[MetricsServerInterceptor(registry)])
+    channel = grpc.intercept_channel(grpc.insecure_channel(target), MetricsClientInterceptor(registry))
+    yield registry, appitems_pb2_grpc.AppItemsServiceStub(channel)
+    channel.close()
+    server.stop(None)
+
+
+def test_interceptors_record_both_sides(metered):
+    registry, stub = metered
+    created = stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=make_appitem(random.Random(0))))
+    stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=created.appitem.id))
+    with pytest.raises(grpc.RpcError):
+        stub.GetAppItem(appitems_pb2.GetAppItemRequest(id='missing'))
+
+    for side in ('client', 'server'):
+        metrics = registry.method(side, GET)
+        assert metrics.statuses == {'OK': 1, 'NOT_FOUND': 1}
+        assert metrics.latency.total == 2
+        assert metrics.request_bytes.total == 2
+        # Failed calls have no response to measure
+        assert metrics.response_bytes.total == 1
+        assert registry.method(side, CREATE).statuses == {'OK': 1}
+    snapshot = registry.snapshot()
+    assert snapshot['server']['apptemplate.v1.AppItemsService/GetAppItem']['status']['NOT_FOUND'] == 1
@@ -0,0 +1,112 @@
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.export import ItemWriter
+from appitems.fixtures import iter_corpus
+from appitems import multiproc
+from appitems.multiproc import CrashLoop, WorkerPool, _ReadOnlyInterceptor, load_snapshot
+from appitems.server import start_local_server
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = str(tmp_path / 'catalog.pb')
+    with ItemWriter(path) as writer:
+        for item in iter_corpus(50):
+            writer.write(item)
+    return path
+
+
+def test_load_snapshot(snapshot):
+    store = load_snapshot(snapshot)
+    assert len(store) == 50 and store.get('item-000007').id == 'item-000007'
+
+
+def test_several_workers_need_a_snapshot():
+    with pytest.raises(ValueError):
+        WorkerPool('127.0.0.1:0', workers=2)
+    assert not WorkerPool('127.0.0.1:0', workers=1).read_only
+
+
+def test_read_only_interceptor_rejects_writes():
+    server, target = start_local_server(interceptors=[_ReadOnlyInterceptor()])
+    try:
+        with grpc.insecure_channel(target) as channel:
+            stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+            for call in (lambda: stub.CreateAppItem(appitems_pb2.CreateAppItemRequest()),
+                         lambda: stub.CreateAppItems(iter([appitems_pb2.CreateAppItemsRequest()])),
+                         lambda: stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id='x'))):
+                with pytest.raises(grpc.RpcError) as e:
+                    call()
+                assert e.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+            assert not stub.ListAppItems(appitems_pb2.ListAppItemsRequest()).items
+    finally:
+        server.stop(None)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+def test_workers_crashing_on_start_back_off_then_stop_the_pool(monkeypatch):
+    monkeypatch.setattr(multiproc, '_run_worker', lambda *args: os._exit(3))
+    pool = WorkerPool('127.0.0.1:0', workers=1, restart_backoff=0.05, max_crashes=4)
+    pool.start()
+    spawned = [time.monotonic()]
+    try:
+        with pytest.raises(CrashLoop, match='4 times in a row'):
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                if pool.reap():
+                    spawned.append(time.monotonic())
+                time.sleep(0.01)
+    finally:
+        pool.stop()
+    # Restarted three times, each after a longer delay (0.05s, 0.1s, 0.2s)
+    assert pool.restarts == 3 and pool.crashes == [4]
+    gaps = [later - earlier for earlier, later in zip(spawned, spawned[1:])]
+    assert gaps[0] >= 0.05 and gaps[1] >= 0.1 and gaps[2] >= 0.2
+
+
+def launch(*args):
+    return subprocess.Popen([sys.executable, '-m', 'appitems.multiproc', '--address', '127.0.0.1:0', *args],
+                            cwd=PYTHON_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def test_cli_refuses_several_workers_without_snapshot():
+    process = launch('--workers', '2')
+    _, stderr = process.communicate(timeout=30)
+    assert process.returncode == 2 and 'own empty store' in stderr
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork') or not sys.platform.startswith('linux'), reason='needs fork + SO_REUSEPORT')
+def test_workers_serve_the_snapshot_read_only(snapshot):
+    process = launch('--workers', '2', '--snapshot', snapshot, '--grace', '1')
+    try:
+        target = None
+        for line in process.stdout:
+            match = re.search(r'listening on (\S+) with 2 workers \(read-only\)', line)
+            if match:
+                target = match.group(1)
+                break
+        assert target, process.stderr.read()
+        with grpc.insecure_channel(target) as channel:
+            stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+            grpc.channel_ready_future(channel).result(timeout=10)
+            resp = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id='item-000003'), wait_for_ready=True, timeout=10)
+            assert resp.appitem.id == 'item-000003'
+            with pytest.raises(grpc.RpcError) as e:
+                stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='x')))
+            assert e.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.communicate(timeout=30)
+    assert process.returncode == 0
@@ -0,0 +1,234 @@
+import asyncio
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.metrics import MetricsRegistry
+from appitems.replica import Replica
+from appitems.server import (AioInMemoryAppItemsService, AppItemsHandler, InMemoryAppItemsService, ServiceError,
+                             start_local_aio_server, start_local_server)
+from appitems.store import AppItemStore
+
+Event = appitems_pb2.AppItemEvent
+
+
+def create(stub, **fields):
+    return stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(**fields))).appitem
+
+
+def until_synced(call):
+    events = []
+    for event in call:
+        events.append(event)
+        if event.type == Event.TYPE_SYNCED:
+            return events
+    raise AssertionError('stream ended before SYNCED')
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def test_watch_sends_initial_items_then_resumes_after_cursor(stub):
+    first = create(stub, name='First')
+    call = stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest(send_initial=True))
+    events = until_synced(call)
+    call.cancel()
+    assert [(e.type, e.id) for e in events[:-1]] == [(Event.TYPE_CREATED, first.id)]
+    cursor = events[-1].cursor
+    assert cursor
+
+    second = create(stub, name='Second')
+    stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id=first.id))
+    call = stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest(cursor=cursor))
+    events = until_synced(call)
+    call.cancel()
+    assert [(e.type, e.id) for e in events[:-1]] == [(Event.TYPE_CREATED, second.id), (Event.TYPE_DELETED, first.id)]
+    # Deletes carry the last version of the item
+    assert (events[0].appitem.name, events[1].appitem) == ('Second', first)
+    assert events[0].cursor != events[1].cursor == events[2].cursor
+
+
+def test_watch_rejects_expired_and_invalid_cursors():
+    handler = AppItemsHandler(AppItemStore(change_log_size=2))
+    cursor = handler.store.changes.cursor(0)
+    for name in 'abc':
+        handler.create(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name=name)))
+
+    with pytest.raises(ServiceError) as e:
+        next(handler.watch(appitems_pb2.WatchAppItemsRequest(cursor=cursor)))
+    assert e.value.code == grpc.StatusCode.OUT_OF_RANGE
+    with pytest.raises(ServiceError) as e:
+        next(handler.watch(appitems_pb2.WatchAppItemsRequest(cursor='not a cursor')))
+    assert e.value.code == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_watches_beyond_the_cap_are_rejected():
+    service = InMemoryAppItemsService(max_watches=1)
+    server, target = start_local_server(service, max_workers=4)
+    try:
+        with grpc.insecure_channel(target) as channel:
+            stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+            first = stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest())
+            until_synced(first)
+            with pytest.raises(grpc.RpcError) as e:
+                next(stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest()))
+            assert e.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+            # Closing a watch frees its slot once the server notices the cancel
+            first.cancel()
+            wait_for(lambda: service._watches == 0)
+            second = stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest())
+            until_synced(second)
+            second.cancel()
+    finally:
+        server.stop(None)
+
+
+def test_default_server_caps_watches_below_the_pool_size():
+    server, target = start_local_server(max_workers=8)
+    try:
+        with grpc.insecure_channel(target) as channel:
+            stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+            calls = [stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest()) for _ in range(2)]
+            for call in calls:
+                until_synced(call)
+            with pytest.raises(grpc.RpcError) as e:
+                next(stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest()))
+            assert e.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+            # Unary calls still get a thread
+            assert create(stub, name='Still served').id
+            for call in calls:
+                call.cancel()
+    finally:
+        server.stop(None)
+
+
+def test_aio_watches_hold_no_executor_threads():
+    async def first_events(stub, count):
+        events = []
+        async for event in stub.WatchAppItems(appitems_pb2.WatchAppItemsRequest()):
+            events.append(event)
+            if len(events) == count:
+                return events
+
+    async def run():
+        # Far more watchers than the default executor has threads
+        asyncio.get_running_loop().set_default_executor(futures.ThreadPoolExecutor(max_workers=2))
+        service = AioInMemoryAppItemsService()
+        server, target = await start_local_aio_server(service)
+        try:
+            async with grpc.aio.insecure_channel(target) as channel:
+                stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+                watches = [asyncio.ensure_future(first_events(stub, 2)) for _ in range(40)]
+                while len(service.handler.store.changes.listeners) < len(watches):
+                    await asyncio.sleep(0.01)
+                # The executor is still free for other work
+                assert await asyncio.wait_for(asyncio.to_thread(lambda: 'free'), 5) == 'free'
+                item = (await stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(
+                    appitem=models_pb2.AppItem(name='Seen')))).appitem
+                results = await asyncio.wait_for(asyncio.gather(*watches), 5)
+            # Finished watches unsubscribe from the change log
+            while service.handler.store.changes.listeners:
+                await asyncio.sleep(0.01)
+            return item, results
+        finally:
+            await server.stop(None)
+
+    item, results = asyncio.run(run())
+    for events in results:
+        assert [e.type for e in events] == [Event.TYPE_SYNCED, Event.TYPE_CREATED] and events[1].appitem == item
+
+
+def test_replica_follows_changes(stub):
+    existing = create(stub, name='Existing')
+    replica = Replica(stub).start()
+    try:
+        assert replica.wait_synced(5)
+        assert replica.get(existing.id) == existing
+
+        added = create(stub, name='Added')
+        stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id=existing.id))
+        wait_for(lambda: existing.id not in replica.items and added.id in replica.items)
+        assert len(replica) == 1 and replica.cursor
+    finally:
+        replica.stop()
+
+
+def test_replica_resyncs_when_its_cursor_expires():
+    service = InMemoryAppItemsService(AppItemsHandler(AppItemStore(change_log_size=2)))
+    server, target = start_local_server(service, max_workers=4)
+    registry = MetricsRegistry()
+    try:
+        with grpc.insecure_channel(target) as channel:
+            stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+            kept = create(stub, name='Kept')
+            replica = Replica(stub, backoff=0.01, registry=registry).start()
+            assert replica.wait_synced(5)
+            replica.stop()
+
+            # More changes than the log keeps while the replica is away
+            added = [create(stub, name=f'Added {i}') for i in range(3)]
+            replica.start()
+            try:
+                wait_for(lambda: replica.resyncs == 1 and len(replica) == 4)
+                assert set(replica.items) == {kept.id} | {item.id for item in added}
+                assert registry.counter('grpc_client_watch_resyncs_total', {'grpc_code': 'OUT_OF_RANGE'}) == 1
+            finally:
+                replica.stop()
+    finally:
+        server.stop(None)
+
+
+class Rejected(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class RejectingCall:
+    def __init__(self, code):
+        self.code = code
+
+    def __iter__(self):
+        raise Rejected(self.code)
+
+    def cancel(self):
+        pass
+
+
+class RejectingStub:
+    """Stub whose every watch fails straight away with `code`"""
+
+    def __init__(self, code):
+        self.code = code
+        self.requests = []
+
+    def WatchAppItems(self, request, metadata=None):
+        self.requests.append(request)
+        return RejectingCall(self.code)
+
+
+@pytest.mark.parametrize('code', [grpc.StatusCode.OUT_OF_RANGE, grpc.StatusCode.FAILED_PRECONDITION])
+def test_replica_backs_off_between_resyncs(code):
+    stub = RejectingStub(code)
+    replica = Replica(stub, backoff=0.05, max_backoff=0.05)
+    replica.cursor = 'stale'
+    replica.start()
+    time.sleep(0.3)
+    replica.stop()
+
+    # At least 25ms between attempts; without backoff this would be thousands
+    assert 2 <= len(stub.requests) <= 14
+    assert len(stub.requests) - 1 <= replica.resyncs == replica.reconnects <= len(stub.requests)
+    assert stub.requests[0].cursor == 'stale'
+    assert all(request.send_initial and not request.cursor for request in stub.requests[1:])
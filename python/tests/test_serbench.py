@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from apptemplate.v1 import appitems_pb2
+
+from appitems.serbench import (CORPORA, bench_case, build_messages, compare, make_items, measure_allocations,
+                               run_benchmarks, time_op)
+from appitems.startup import PYTHON_DIR
+
+
+def test_make_items_follows_the_shape():
+    items = make_items(3, seed=1, **CORPORA['many_tags'])
+    assert [item.id for item in items] == ['item-000000', 'item-000001', 'item-000002']
+    assert all(len(item.tags) == 100 and item.HasField('updated_at') for item in items)
+    assert make_items(3, seed=1, **CORPORA['many_tags']) == items
+
+
+def test_build_messages():
+    items = make_items(4, **CORPORA['typical'])
+    assert build_messages('AppItem', items) == items
+    (listed,) = build_messages('ListAppItemsResponse', items)
+    assert list(listed.items) == items and listed.pagination.total_results == 4
+    (mapped,) = build_messages('GetAppItemsResponse', items)
+    assert isinstance(mapped, appitems_pb2.GetAppItemsResponse) and set(mapped.appitems) == {i.id for i in items}
+    with pytest.raises(ValueError):
+        build_messages('Nope', items)
+
+
+def test_time_op_and_allocations():
+    assert time_op(lambda: None, min_seconds=0.001, repeats=2) > 0
+    alloc = measure_allocations(lambda: bytearray(10000), count=10)
+    assert alloc['bytes'] >= 10000
+
+
+def test_bench_case_reports_sizes():
+    items = make_items(10, **CORPORA['typical'])
+    case = bench_case('ListAppItemsResponse', items, min_seconds=0.001)
+    assert case['items'] == 10
+    assert case['bytes'] == build_messages('ListAppItemsResponse', items)[0].ByteSize()
+    assert case['serialize']['items_per_sec'] > 0 and case['parse']['us_per_item'] > 0
+
+
+def test_compare_matches_cases_by_backend_corpus_and_message():
+    report = run_benchmarks(batch=5, corpora=['minimal'], message_types=['AppItem'], min_seconds=0.001)
+    report['results'][0]['parse_alloc']['bytes_per_item'] = 100.0
+    baseline = {'runs': [report]}
+    current = json.loads(json.dumps(baseline))
+    case = current['runs'][0]['results'][0]
+    case['bytes_per_item'] *= 2
+    case['parse_alloc']['bytes_per_item'] = 50.0
+    changes = compare(baseline, current)
+    key = f"{report['backend']}/minimal/AppItem"
+    assert list(changes) == [key]
+    assert changes[key]['bytes_per_item'] == 1.0
+    assert changes[key]['serialize_items_per_sec'] == 0.0
+    assert changes[key]['parse_alloc_bytes_per_item'] == -0.5
+    current['runs'][0]['backend'] = 'other'
+    assert compare(baseline, current) == {}
+
+
+def test_cli_runs_each_backend_in_its_own_interpreter(tmp_path):
+    out = tmp_path / 'serbench.json'
+    subprocess.run([sys.executable, '-m', 'appitems.serbench', '--backend', 'python', '--batch', '2',
+                    '--corpus', 'minimal', '--message', 'AppItem', '--min-seconds', '0.001', '--out', str(out)],
+                   cwd=PYTHON_DIR, check=True, capture_output=True)
+    report = json.loads(out.read_text())
+    assert [run['backend'] for run in report['runs']] == ['python']
+    assert report['runs'][0]['results'][0]['corpus'] == 'minimal'
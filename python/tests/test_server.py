@@ -0,0 +1,99 @@
+import asyncio
+
+import grpc
+import pytest
+from google.protobuf import field_mask_pb2
+
+from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+from appitems.server import OWNER_METADATA_KEY, start_local_aio_server
+
+
+def create(stub, owner_id='', **fields):
+    metadata = [(OWNER_METADATA_KEY, owner_id)] if owner_id else None
+    request = appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(**fields))
+    return stub.CreateAppItem(request, metadata=metadata)
+
+
+def test_create_get_delete(stub):
+    created = create(stub, name='Chess', tags=['board'], difficulty='hard').appitem
+    assert created.id and created.created_at.seconds and created.updated_at == created.created_at
+
+    got = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=created.id)).appitem
+    assert got == created
+
+    stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id=created.id))
+    with pytest.raises(grpc.RpcError) as e:
+        stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=created.id))
+    assert e.value.code() == grpc.StatusCode.NOT_FOUND
+    with pytest.raises(grpc.RpcError) as e:
+        stub.DeleteAppItem(appitems_pb2.DeleteAppItemRequest(id=created.id))
+    assert e.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_create_validation_and_duplicates(stub):
+    resp = create(stub, name=' ', image_url='ftp://x', tags=[''])
+    assert set(resp.field_errors) == {'name', 'image_url', 'tags'}
+    assert not resp.appitem.id
+
+    create(stub, id='fixed', name='One')
+    with pytest.raises(grpc.RpcError) as e:
+        create(stub, id='fixed', name='Two')
+    assert e.value.code() == grpc.StatusCode.ALREADY_EXISTS
+
+
+def test_get_many_skips_missing(stub):
+    ids = [create(stub, name=f'item {i}').appitem.id for i in range(3)]
+    resp = stub.GetAppItems(appitems_pb2.GetAppItemsRequest(ids=ids + ['missing']))
+    assert set(resp.appitems) == set(ids)
+
+
+def test_update_applies_mask(stub):
+    item = create(stub, name='Old', description='keep', tags=['a']).appitem
+    request = appitems_pb2.UpdateAppItemRequest(
+        appitem=models_pb2.AppItem(id=item.id, name='New', description='ignored', tags=['b', 'c']),
+        update_mask=field_mask_pb2.FieldMask(paths=['name', 'appitem.tags']))
+    updated = stub.UpdateAppItem(request).appitem
+    assert (updated.name, updated.description, list(updated.tags)) == ('New', 'keep', ['b', 'c'])
+    assert updated.created_at == item.created_at
+    assert updated.updated_at.ToNanoseconds() > item.updated_at.ToNanoseconds()
+
+
+@pytest.mark.parametrize('path,message', [('created_at', 'cannot be updated'), ('nope', 'Unknown field')])
+def test_update_rejects_bad_mask(stub, path, message):
+    item = create(stub, name='Item').appitem
+    request = appitems_pb2.UpdateAppItemRequest(appitem=models_pb2.AppItem(id=item.id),
+                                                update_mask=field_mask_pb2.FieldMask(paths=[path]))
+    with pytest.raises(grpc.RpcError) as e:
+        stub.UpdateAppItem(request)
+    assert e.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert message in e.value.details()
+
+
+def test_list_filters_by_owner(stub):
+    for i in range(3):
+        create(stub, owner_id='alice', name=f'a{i}')
+    create(stub, owner_id='bob', name='b0')
+    resp = stub.ListAppItems(appitems_pb2.ListAppItemsRequest(owner_id='alice'))
+    assert sorted(item.name for item in resp.items) == ['a0', 'a1', 'a2']
+    assert resp.pagination.total_results == 3 and not resp.pagination.has_more
+
+
+def test_aio_server_matches():
+    async def run():
+        server, target = await start_local_aio_server()
+        try:
+            async with grpc.aio.insecure_channel(target) as channel:
+                stub = appitems_pb2_grpc.AppItemsServiceStub(channel)
+                created = await stub.CreateAppItem(
+                    appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='Go')))
+                got = await stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=created.appitem.id))
+                with pytest.raises(grpc.aio.AioRpcError) as e:
+                    await stub.GetAppItem(appitems_pb2.GetAppItemRequest(id='missing'))
+                return created.appitem, got.appitem, e.value.code()
+        finally:
+            await server.stop(None)
+
+    created, got, code = asyncio.run(run())
+    assert created == got
+    assert code == grpc.StatusCode.NOT_FOUND
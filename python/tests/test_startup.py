@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from appitems import pb
+from appitems.startup import PYTHON_DIR, SCENARIOS, run_startup_benchmark
+
+_LAZY_CHECK = '''
+import sys
+sys.path.insert(0, {python_dir!r})
+from appitems import pb
+assert pb.loaded_modules() == [], pb.loaded_modules()
+pb.AppItem(name="x")
+assert pb.loaded_modules() == ["apptemplate.v1.models_pb2"], pb.loaded_modules()
+pb.AppItemsServiceStub
+assert "grpc" in pb.loaded_modules()
+'''
+
+_PROBE_CHECK = '''
+import sys
+sys.path.insert(0, {python_dir!r})
+from appitems import pb
+for name in ("__wrapped__", "__path__", "_private", "NoSuchMessage"):
+    assert not hasattr(pb, name), name
+assert pb.loaded_modules() == [], pb.loaded_modules()
+assert "grpc" not in sys.modules
+'''
+
+
+def test_facade_imports_modules_on_first_use():
+    subprocess.run([sys.executable, '-c', _LAZY_CHECK.format(python_dir=PYTHON_DIR)], check=True)
+
+
+def test_attribute_probes_import_nothing():
+    subprocess.run([sys.executable, '-c', _PROBE_CHECK.format(python_dir=PYTHON_DIR)], check=True)
+
+
+def test_facade_names_cover_the_generated_modules():
+    for module_name in pb.MODULES:
+        module = getattr(pb, module_name)
+        exported = {name for name, value in vars(module).items()
+                    if not name.startswith('_') and name != 'DESCRIPTOR' and not isinstance(value, type(module))}
+        assert exported == {name for name, owner in pb._NAMES.items() if owner == module_name}, module_name
+
+
+def test_facade_exports_the_generated_names():
+    from apptemplate.v1 import appitems_pb2, appitems_pb2_grpc, models_pb2
+
+    assert pb.AppItem is models_pb2.AppItem
+    assert pb.WatchAppItemsRequest is appitems_pb2.WatchAppItemsRequest
+    assert pb.AppItemsServiceStub is appitems_pb2_grpc.AppItemsServiceStub
+    assert pb.appitems_pb2 is appitems_pb2
+    assert 'AppItem' in dir(pb)
+    assert pb.protobuf_backend() in ('upb', 'cpp', 'python')
+    with pytest.raises(AttributeError):
+        pb.NoSuchMessage
+
+
+def test_benchmark_report():
+    report = run_startup_benchmark(runs=2, scenarios=['baseline', 'facade'])
+    results = report['results']['default']
+    assert set(results) == {'baseline', 'facade'}
+    assert not results['facade']['grpc_loaded']
+    assert all(r['import_ms'] >= 0 and r['max_rss_mb'] > 0 for r in results.values())
+    assert set(SCENARIOS) >= set(results)
+
+
+def test_out_file_survives_a_closed_stdout(tmp_path):
+    out = tmp_path / 'startup.json'
+    process = subprocess.Popen([sys.executable, '-m', 'appitems.startup', '--runs', '1', '--scenario', 'baseline',
+                                '--out', str(out)], cwd=PYTHON_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    process.stdout.close()
+    process.wait(timeout=60)
+    assert json.loads(out.read_text())['results']['default']['baseline']['grpc_loaded'] is False
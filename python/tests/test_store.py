@@ -0,0 +1,122 @@
+import random
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.store import AppItemStore, InvalidCursor, SortedKeyList, decode_cursor, encode_cursor, sort_key
+
+OWNERS = ('', 'alice', 'bob')
+TAGS = ('red', 'green', 'blue')
+DIFFICULTIES = ('', 'easy', 'hard')
+
+
+def make_item(rng: random.Random, item_id: str) -> models_pb2.AppItem:
+    item = models_pb2.AppItem(id=item_id, name=item_id, difficulty=rng.choice(DIFFICULTIES),
+                              tags=rng.sample(TAGS, rng.randint(0, 2)))
+    item.updated_at.FromNanoseconds(rng.randint(1, 50) * 1000)
+    return item
+
+
+def populated_store(seed: int = 0, count: int = 300) -> AppItemStore:
+    rng = random.Random(seed)
+    store = AppItemStore()
+    for i in range(count):
+        store.insert(make_item(rng, f'item-{i:04d}'), rng.choice(OWNERS))
+    for i in rng.sample(range(count), count // 3):
+        store.replace(make_item(rng, f'item-{i:04d}'))
+    for i in rng.sample(range(count), count // 5):
+        store.delete(f'item-{i:04d}')
+    return store
+
+
+def brute_force(store: AppItemStore, owner_id='', tag='', difficulty=''):
+    items = [item for item in store.items.values()
+             if (not owner_id or store.owner_of(item.id) == owner_id)
+             and (not tag or tag in item.tags)
+             and (not difficulty or item.difficulty == difficulty)]
+    return sorted(items, key=sort_key)
+
+
+def test_sorted_key_list_positions_follow_writes():
+    rng = random.Random(1)
+    keys = SortedKeyList(load=4)
+    expected = []
+    for step in range(2000):
+        if expected and rng.random() < 0.4:
+            key = expected.pop(rng.randrange(len(expected)))
+            assert keys.remove(key)
+        else:
+            key = (rng.randint(-1000, 0), f'{step}')
+            keys.add(key)
+            expected.append(key)
+            expected.sort()
+        if step % 7 == 0 and expected:
+            index = rng.randrange(len(expected))
+            assert next(keys.iter_from_index(index)) == expected[index]
+    assert list(keys) == expected
+    assert list(keys.iter_from_index(len(expected))) == []
+    assert not keys.remove((1, 'missing'))
+
+
+@pytest.mark.parametrize('owner_id', OWNERS)
+@pytest.mark.parametrize('tag', ('',) + TAGS)
+@pytest.mark.parametrize('difficulty', DIFFICULTIES)
+def test_count_matches_brute_force(owner_id, tag, difficulty):
+    store = populated_store()
+    assert store.count(owner_id, tag, difficulty) == len(brute_force(store, owner_id, tag, difficulty))
+
+
+def test_count_after_everything_is_deleted():
+    store = populated_store(count=50)
+    for item_id in list(store.items):
+        store.delete(item_id)
+    assert store.count('alice', 'red', 'easy') == 0
+    assert not store.filter_counts
+
+
+@pytest.mark.parametrize('filters', [{}, {'owner_id': 'alice'}, {'tag': 'red', 'difficulty': 'hard'},
+                                     {'owner_id': 'bob', 'tag': 'green'}])
+def test_list_pages_by_key_and_offset(filters):
+    store = populated_store(seed=2)
+    expected = [item.id for item in brute_force(store, **filters)]
+
+    seen, page_key = [], ''
+    while True:
+        page, total, page_key = store.list(page_key=page_key, limit=7, **filters)
+        assert total == len(expected)
+        seen.extend(item.id for item in page)
+        if not page_key:
+            break
+    assert seen == expected
+
+    by_offset = []
+    for offset in range(0, len(expected), 7):
+        page, _, _ = store.list(offset=offset, limit=7, **filters)
+        by_offset.extend(item.id for item in page)
+    assert by_offset == expected
+
+
+def test_cursor_round_trip_and_validation():
+    assert decode_cursor(encode_cursor((-123, 'some-id'))) == (-123, 'some-id')
+    with pytest.raises(InvalidCursor):
+        decode_cursor('!!')
+
+
+def test_page_key_is_stable_across_inserts(stub):
+    for i in range(5):
+        stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name=f'item {i}')))
+    first = stub.ListAppItems(appitems_pb2.ListAppItemsRequest(pagination={'page_size': 2}))
+    assert first.pagination.has_more and first.pagination.next_page_offset == 2
+    # A newer item sorts first, so it must not shift the next page when paging by key
+    stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(appitem=models_pb2.AppItem(name='newest')))
+    rest = stub.ListAppItems(appitems_pb2.ListAppItemsRequest(
+        pagination={'page_key': first.pagination.next_page_key, 'page_size': 10}))
+    names = [item.name for item in list(first.items) + list(rest.items)]
+    assert sorted(names) == [f'item {i}' for i in range(5)]
+    assert rest.pagination.total_results == 6 and not rest.pagination.has_more
+
+    with pytest.raises(grpc.RpcError) as e:
+        stub.ListAppItems(appitems_pb2.ListAppItemsRequest(pagination={'page_key': '!!'}))
+    assert e.value.code() == grpc.StatusCode.INVALID_ARGUMENT
@@ -0,0 +1,96 @@
+from concurrent import futures
+
+import grpc
+import pytest
+
+from apptemplate.v1 import appitems_pb2, models_pb2
+
+from appitems.store import MUTABLE_FIELDS
+from appitems.updates import UpdateBatcher, changed_fields, diff_update, merge_update
+
+
+def test_diff_update_is_minimal():
+    before = models_pb2.AppItem(id='a', name='x', description='d', tags=['t'])
+    after = models_pb2.AppItem(id='a', name='y', description='d', tags=['t', 'u'])
+    request = diff_update(before, after)
+    assert list(request.update_mask.paths) == ['name', 'tags']
+    assert request.appitem == models_pb2.AppItem(id='a', name='y', tags=['t', 'u'])
+    assert diff_update(before, before) is None
+    assert changed_fields(before, before) == []
+    with pytest.raises(ValueError):
+        diff_update(before, models_pb2.AppItem(id='b'))
+
+
+def test_merge_update_unions_masks():
+    merged = appitems_pb2.UpdateAppItemRequest(appitem=models_pb2.AppItem(id='a', name='old'))
+    merged.update_mask.paths.append('name')
+    merge_update(merged, diff_update(models_pb2.AppItem(id='a'), models_pb2.AppItem(id='a', name='new', tags=['t'])))
+    assert list(merged.update_mask.paths) == ['name', 'tags']
+    assert merged.appitem.name == 'new'
+    everything = appitems_pb2.UpdateAppItemRequest(appitem=models_pb2.AppItem(id='a'))
+    merge_update(merged, everything)
+    assert sorted(merged.update_mask.paths) == sorted(MUTABLE_FIELDS)
+
+
+def test_batcher_merges_edits_per_id(stub):
+    ids = [stub.CreateAppItem(appitems_pb2.CreateAppItemRequest(
+        appitem=models_pb2.AppItem(name=f'item {i}'))).appitem.id for i in range(3)]
+    with UpdateBatcher(stub, max_in_flight=2) as batcher:
+        for item_id in ids:
+            base = models_pb2.AppItem(id=item_id, name='')
+            batcher.add(base, models_pb2.AppItem(id=item_id, description='first'))
+            batcher.add(base, models_pb2.AppItem(id=item_id, description='second', tags=['x']))
+    assert batcher.results.calls == 3 and not batcher.results.errors
+    for item_id in ids:
+        item = stub.GetAppItem(appitems_pb2.GetAppItemRequest(id=item_id)).appitem
+        assert (item.description, list(item.tags)) == ('second', ['x'])
+        assert item.name.startswith('item ')
+
+
+class Rejected(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.FAILED_PRECONDITION
+
+
+class ScriptedUpdate:
+    """UpdateAppItem that fails while `reject` is set"""
+
+    def __init__(self):
+        self.reject = False
+
+    def future(self, request, timeout=None, metadata=None):
+        future = futures.Future()
+        if self.reject:
+            future.set_exception(Rejected())
+        else:
+            future.set_result(appitems_pb2.UpdateAppItemResponse(appitem=request.appitem))
+        return future
+
+
+def edit(batcher, **fields):
+    request = diff_update(models_pb2.AppItem(id='a'), models_pb2.AppItem(id='a', **fields))
+    batcher.add_request(request)
+    return batcher.flush()
+
+
+def test_error_cleared_only_by_an_update_covering_its_fields():
+    stub = type('Stub', (), {})()
+    stub.UpdateAppItem = ScriptedUpdate()
+    batcher = UpdateBatcher(stub)
+
+    stub.UpdateAppItem.reject = True
+    results = edit(batcher, name='lost')
+    assert 'a' in results.errors and list(results.failed['a'].update_mask.paths) == ['name']
+
+    # A later success for another field must not hide the failed name edit
+    stub.UpdateAppItem.reject = False
+    results = edit(batcher, description='fine')
+    assert 'a' in results.errors
+    assert list(results.failed['a'].update_mask.paths) == ['name']
+    assert results.failed['a'].appitem.name == 'lost'
+
+    # Retrying the failed request clears it
+    batcher.add_request(results.failed['a'])
+    results = batcher.flush()
+    assert 'a' not in results.errors and 'a' not in results.failed
+    assert results.updated['a'].name == 'lost'
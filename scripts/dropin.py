@@ -10,28 +10,348 @@ Usage:
 
 Example:
     dropin /path/to/apptemplate . --entities Book,Library,Author --project-name bookstore
+
+The template can also be read from an archive and the output written to a
+tar/zip archive instead of a directory:
+
+    dropin apptemplate.tar.gz bookstore.zip --entities Book,Author
+
+As a library, pass a `source` (DirectorySource, MemorySource.from_archive)
+and a `sink` (DirectorySink, MemorySink, TarSink, ZipSink) to render
+without touching the disk:
+
+    sink = MemorySink()
+    AppTemplateDropin(None, None, ['Book'], project_name='bookstore',
+                      source=MemorySource.from_archive('apptemplate.zip'), sink=sink).render()
+    sink.files['protos/bookstore/v1/books.proto']
 """
 
 import os
 import sys
 import argparse
+import hashlib
+import io
 import shutil
 import re
 import json
+import tarfile
+import time
 import yaml
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import BinaryIO, List, Dict, Optional, Set, Tuple, Union
 import subprocess
 
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+
+def is_archive(path: str) -> bool:
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _strip_dot(rel_path: str) -> str:
+    return rel_path[2:] if rel_path.startswith('./') else rel_path
+
+
+class TemplateSource:
+    """Read-only view of an AppTemplate tree, paths are '/'-separated and relative to its root"""
+
+    def exists(self, rel_path: str) -> bool:
+        raise NotImplementedError
+
+    def is_dir(self, rel_path: str) -> bool:
+        raise NotImplementedError
+
+    def listdir(self, rel_path: str) -> List[str]:
+        """Names of the entries in a directory, sorted"""
+        raise NotImplementedError
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        raise NotImplementedError
+
+    def read_text(self, rel_path: str, errors: str = 'strict') -> str:
+        return self.read_bytes(rel_path).decode('utf-8', errors=errors)
+
+    def mode(self, rel_path: str) -> int:
+        """Permission bits of a file"""
+        return 0o644
+
+    def local_path(self, rel_path: str) -> Optional[Path]:
+        """Path on disk, if the source is a directory (enables plain file copies)"""
+        return None
+
+
+class DirectorySource(TemplateSource):
+    """An AppTemplate checkout on disk"""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).resolve()
+
+    def __str__(self):
+        return str(self.root)
+
+    def local_path(self, rel_path: str) -> Path:
+        return self.root / rel_path if rel_path else self.root
+
+    def exists(self, rel_path: str) -> bool:
+        return self.local_path(rel_path).exists()
+
+    def is_dir(self, rel_path: str) -> bool:
+        return self.local_path(rel_path).is_dir()
+
+    def listdir(self, rel_path: str) -> List[str]:
+        return sorted(item.name for item in self.local_path(rel_path).iterdir())
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        return self.local_path(rel_path).read_bytes()
+
+    def mode(self, rel_path: str) -> int:
+        return self.local_path(rel_path).stat().st_mode & 0o777
+
+
+class MemorySource(TemplateSource):
+    """A template held in memory as {path: bytes}, eg loaded from a tar or zip archive"""
+
+    def __init__(self, files: Dict[str, bytes], modes: Optional[Dict[str, int]] = None, name: str = '<memory>'):
+        self.files = files
+        self.modes = modes or {}
+        self.name = name
+        self.dirs: Dict[str, Set[str]] = {'': set()}
+        for rel_path in files:
+            parts = rel_path.split('/')
+            for depth in range(len(parts)):
+                parent = '/'.join(parts[:depth])
+                self.dirs.setdefault(parent, set()).add(parts[depth])
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def from_archive(cls, archive: Union[str, Path, BinaryIO]) -> 'MemorySource':
+        """Load a .zip or .tar(.gz/.bz2/.xz) archive.
+
+        A single top-level directory wrapping the whole tree (as in GitHub
+        source archives) is stripped.
+        """
+        files, modes = {}, {}
+        name = str(archive) if isinstance(archive, (str, Path)) else getattr(archive, 'name', '<archive>')
+        if zipfile.is_zipfile(archive):
+            with zipfile.ZipFile(archive) as zf:
+                for info in zf.infolist():
+                    if not info.is_dir():
+                        files[info.filename] = zf.read(info)
+                        modes[info.filename] = (info.external_attr >> 16) & 0o777 or 0o644
+        else:
+            if not isinstance(archive, (str, Path)):
+                archive.seek(0)
+            kwargs = {'name': archive} if isinstance(archive, (str, Path)) else {'fileobj': archive}
+            with tarfile.open(mode='r:*', **kwargs) as tf:
+                for member in tf:
+                    if member.isfile():
+                        files[member.name] = tf.extractfile(member).read()
+                        modes[member.name] = member.mode & 0o777
+        files = {_strip_dot(rel_path): data for rel_path, data in files.items()}
+        modes = {_strip_dot(rel_path): mode for rel_path, mode in modes.items()}
+        tops = {rel_path.split('/', 1)[0] for rel_path in files}
+        if len(tops) == 1 and all('/' in rel_path for rel_path in files):
+            prefix = tops.pop() + '/'
+            files = {rel_path[len(prefix):]: data for rel_path, data in files.items()}
+            modes = {rel_path[len(prefix):]: mode for rel_path, mode in modes.items()}
+        return cls(files, modes, name)
+
+    def exists(self, rel_path: str) -> bool:
+        return rel_path in self.files or rel_path in self.dirs
+
+    def is_dir(self, rel_path: str) -> bool:
+        return rel_path in self.dirs
+
+    def listdir(self, rel_path: str) -> List[str]:
+        return sorted(self.dirs.get(rel_path, ()))
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        try:
+            return self.files[rel_path]
+        except KeyError:
+            raise FileNotFoundError(f"{rel_path} not found in {self.name}") from None
+
+    def mode(self, rel_path: str) -> int:
+        return self.modes.get(rel_path, 0o644)
+
+
+class OutputSink:
+    """Where rendered files go.  Paths are '/'-separated and relative to the project root."""
+
+    # Whether the output is a real project directory (backups and code generation need one)
+    on_disk = False
+
+    def write(self, rel_path: str, data: bytes, mode: int = 0o644):
+        raise NotImplementedError
+
+    def read(self, rel_path: str) -> Optional[bytes]:
+        """Current content of a path, None if absent or the sink cannot be read back"""
+        return None
+
+    def close(self):
+        pass
+
+
+class DirectorySink(OutputSink):
+    """Writes files under a directory (the classic drop-in)"""
+
+    on_disk = True
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).resolve()
+
+    def __str__(self):
+        return str(self.root)
+
+    def write(self, rel_path: str, data: bytes, mode: int = 0o644):
+        path = self.root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def copy(self, rel_path: str, src_path: Path):
+        """Copy a file from disk as-is, keeping its metadata"""
+        path = self.root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src_path, path)
+
+    def read(self, rel_path: str) -> Optional[bytes]:
+        path = self.root / rel_path
+        return path.read_bytes() if path.is_file() else None
+
+
+class MemorySink(OutputSink):
+    """Collects the rendered project as {path: bytes}"""
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+        self.modes: Dict[str, int] = {}
+
+    def __str__(self):
+        return '<memory>'
+
+    def write(self, rel_path: str, data: bytes, mode: int = 0o644):
+        self.files[rel_path] = data
+        self.modes[rel_path] = mode
+
+    def read(self, rel_path: str) -> Optional[bytes]:
+        return self.files.get(rel_path)
+
+
+class TarSink(OutputSink):
+    """Streams the rendered project into a tar archive (gzip compressed by default).
+
+    Entries are written as they are rendered, so `fileobj` may be a pipe or
+    socket.  `prefix` puts every entry under a top-level directory.
+    """
+
+    def __init__(self, target: Union[str, Path, BinaryIO], compression: str = 'gz', prefix: str = ''):
+        mode = f'w|{compression}' if compression else 'w|'
+        if isinstance(target, (str, Path)):
+            self.name = str(target)
+            self.tar = tarfile.open(name=target, mode=mode)
+        else:
+            self.name = getattr(target, 'name', '<stream>')
+            self.tar = tarfile.open(fileobj=target, mode=mode)
+        self.prefix = prefix.strip('/') + '/' if prefix else ''
+        self.mtime = time.time()
+
+    def __str__(self):
+        return self.name
+
+    def write(self, rel_path: str, data: bytes, mode: int = 0o644):
+        info = tarfile.TarInfo(self.prefix + rel_path)
+        info.size = len(data)
+        info.mode = mode
+        info.mtime = self.mtime
+        self.tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self.tar.close()
+
+
+class ZipSink(OutputSink):
+    """Streams the rendered project into a zip archive (works on unseekable streams too)"""
+
+    def __init__(self, target: Union[str, Path, BinaryIO], prefix: str = ''):
+        self.name = str(target) if isinstance(target, (str, Path)) else getattr(target, 'name', '<stream>')
+        self.zip = zipfile.ZipFile(target, 'w', compression=zipfile.ZIP_DEFLATED)
+        self.prefix = prefix.strip('/') + '/' if prefix else ''
+        self.date_time = time.localtime()[:6]
+
+    def __str__(self):
+        return self.name
+
+    def write(self, rel_path: str, data: bytes, mode: int = 0o644):
+        info = zipfile.ZipInfo(self.prefix + rel_path, self.date_time)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = (0o100000 | mode) << 16
+        self.zip.writestr(info, data)
+
+    def close(self):
+        self.zip.close()
+
+
+def open_sink(target: str, prefix: str = '') -> OutputSink:
+    """Directory sink, or an archive sink picked from the extension of `target`"""
+    lower = target.lower()
+    if lower.endswith('.zip'):
+        return ZipSink(target, prefix)
+    if lower.endswith(('.tar.gz', '.tgz')):
+        return TarSink(target, 'gz', prefix)
+    if lower.endswith('.tar.bz2'):
+        return TarSink(target, 'bz2', prefix)
+    if lower.endswith('.tar.xz'):
+        return TarSink(target, 'xz', prefix)
+    if lower.endswith('.tar'):
+        return TarSink(target, '', prefix)
+    return DirectorySink(target)
+
+
+def open_source(source: str) -> TemplateSource:
+    return MemorySource.from_archive(source) if is_archive(source) and os.path.isfile(source) else DirectorySource(source)
+
+
+def archive_stem(path: str) -> str:
+    name = Path(path).name
+    for suffix in ARCHIVE_SUFFIXES:
+        if name.lower().endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+# Globs of target paths --check leaves out of its report, one per line ('#' starts a comment)
+CHECK_IGNORE_FILE = '.dropinignore'
+
+# Files whose project settings are rewritten as they are rendered: path -> label
+PROJECT_CONFIG_FILES = {
+    'go.mod': 'go.mod',
+    'web/package.json': 'package.json',
+    '.devloop.yaml': '.devloop.yaml',
+}
+
+
 class AppTemplateDropin:
-    def __init__(self, source_dir: str, target_dir: str, entities: List[str], **options):
-        self.source_dir = Path(source_dir).resolve()
-        self.target_dir = Path(target_dir).resolve()
+    def __init__(self, source_dir: Optional[str], target_dir: Optional[str], entities: List[str], **options):
+        # The template is read from `source` and the project written to `sink`;
+        # by default the source and target directories
+        self.source: TemplateSource = options.get('source') or open_source(source_dir)
+        self.sink: OutputSink = options.get('sink') or DirectorySink(target_dir)
+        self.target_dir = self.sink.root if isinstance(self.sink, DirectorySink) else None
         self.entities = entities
-        self.project_name = options.get('project_name') or self.target_dir.name
+        self.project_name = options.get('project_name') or (archive_stem(target_dir) if target_dir else None)
+        if not self.project_name:
+            raise ValueError("project_name is required when there is no target directory")
         self.module_path = options.get('module_path') or f'github.com/{os.getenv("USER", "user")}/{self.project_name}'
         self.exclude_appitem = options.get('exclude_appitem', True)
         self.dry_run = options.get('dry_run', False)
+        self.quiet = options.get('quiet', False)
+        
+        # Output paths written so far
+        self.written: Set[str] = set()
         
         # Load configuration from config file
         self.config = self.load_config()
@@ -45,31 +365,153 @@ class AppTemplateDropin:
         }
         
 
+    def log(self, message: str):
+        if not self.quiet:
+            print(message)
+
     def run(self):
         """Main execution method"""
-        print(f"🚀 AppTemplate Drop-in")
-        print(f"📁 Source: {self.source_dir}")
-        print(f"📁 Target: {self.target_dir}")
-        print(f"🎯 Entities: {', '.join(self.entities)}")
-        print(f"📦 Project: {self.project_name}")
-        print(f"🔗 Module: {self.module_path}")
+        self.log(f"🚀 AppTemplate Drop-in")
+        self.log(f"📁 Source: {self.source}")
+        self.log(f"📁 Target: {self.sink}")
+        self.log(f"🎯 Entities: {', '.join(self.entities)}")
+        self.log(f"📦 Project: {self.project_name}")
+        self.log(f"🔗 Module: {self.module_path}")
         
         if self.dry_run:
-            print("🧪 DRY RUN MODE - No files will be modified")
+            self.log("🧪 DRY RUN MODE - No files will be modified")
         
         try:
             self.validate_directories()
-            self.backup_target()
-            self.copy_infrastructure()
-            self.generate_entities()
-            self.update_project_configuration()
-            self.generate_code()
-            print("✅ Drop-in completed successfully!")
+            if self.sink.on_disk:
+                self.backup_target()
+            self.render()
+            self.sink.close()
+            if self.sink.on_disk:
+                self.generate_code()
+            self.log("✅ Drop-in completed successfully!")
             
         except Exception as e:
             print(f"❌ Error: {e}")
             sys.exit(1)
 
+    def render(self) -> OutputSink:
+        """Render the whole project into the sink, without backups or code generation.
+
+        Archive sinks are only complete once their close() has been called.
+        """
+        self.copy_infrastructure()
+        self.generate_entities()
+        self.update_project_configuration()
+        return self.sink
+
+    def render_expected(self) -> Dict[str, bytes]:
+        """Render the project into memory as {path: bytes}, leaving the configured sink untouched"""
+        saved = self.sink, self.written, self.dry_run, self.quiet
+        self.sink, self.written, self.dry_run, self.quiet = MemorySink(), set(), False, True
+        try:
+            self.render()
+            return self.sink.files
+        finally:
+            self.sink, self.written, self.dry_run, self.quiet = saved
+
+    def check(self, jobs: Optional[int] = None) -> Dict[str, List[str]]:
+        """Compare the target directory with what a drop-in would write, without writing anything.
+
+        Expected files are rendered in memory and compared with the target by
+        size, then by hash, on `jobs` threads.  Returns the relative paths
+        that are 'added', 'changed' or 'missing'.  Only directories the
+        template renders files into can have added files, so the project's
+        own code elsewhere is not reported.  The outputs of code generation
+        (the `out` directories of buf.gen.yaml) and paths matching the globs
+        in the target's .dropinignore are left out of the report.
+        """
+        if self.target_dir is None:
+            raise ValueError("check needs a target directory")
+        expected = self.render_expected()
+        ignored = self.check_ignores()
+        generated = self.generated_dirs(expected)
+        
+        def skipped(rel_path: str) -> bool:
+            return (self.should_exclude_path(rel_path) or self.matches_any(rel_path, ignored)
+                    or self.matches_any(rel_path, generated))
+        
+        # Directories holding rendered files, and every directory above them
+        owned_dirs = {rel_path.rsplit('/', 1)[0] for rel_path in expected if '/' in rel_path}
+        walked_dirs = {'/'.join(rel_dir.split('/')[:depth]) for rel_dir in owned_dirs
+                       for depth in range(1, rel_dir.count('/') + 2)}
+        
+        def compare(rel_path: str) -> Optional[str]:
+            path = self.target_dir / rel_path
+            try:
+                size = path.stat().st_size
+            except (FileNotFoundError, NotADirectoryError):
+                return 'missing'
+            if not path.is_file() or size != len(expected[rel_path]):
+                return 'changed'
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+            return 'changed' if digest.digest() != hashlib.sha256(expected[rel_path]).digest() else None
+        
+        compared = [rel_path for rel_path in expected if not self.matches_any(rel_path, ignored)]
+        report: Dict[str, List[str]] = {'added': [], 'changed': [], 'missing': []}
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for rel_path, status in zip(compared, pool.map(compare, compared)):
+                if status:
+                    report[status].append(rel_path)
+        
+        # Files in the target the template would not produce, inside the directories it renders into
+        for dirpath, dirnames, filenames in os.walk(self.target_dir):
+            rel_dir = os.path.relpath(dirpath, self.target_dir).replace(os.sep, '/')
+            rel_dir = '' if rel_dir == '.' else rel_dir
+            join = (lambda name: f"{rel_dir}/{name}") if rel_dir else (lambda name: name)
+            dirnames[:] = sorted(name for name in dirnames if join(name) in walked_dirs and not skipped(join(name)))
+            if rel_dir not in owned_dirs:
+                continue
+            for name in filenames:
+                rel_path = join(name)
+                if rel_path not in expected and not skipped(rel_path):
+                    report['added'].append(rel_path)
+        
+        for paths in report.values():
+            paths.sort()
+        return report
+
+    def check_ignores(self) -> List[str]:
+        """Globs from the target's .dropinignore (empty if it has none)"""
+        path = self.target_dir / CHECK_IGNORE_FILE
+        if not path.is_file():
+            return []
+        lines = (line.strip() for line in path.read_text().splitlines())
+        return [line for line in lines if line and not line.startswith('#')]
+
+    def generated_dirs(self, expected: Dict[str, bytes]) -> List[str]:
+        """Output directories of `buf generate`, from the rendered buf.gen.yaml (or the target's)"""
+        data = expected.get('buf.gen.yaml')
+        if data is None:
+            path = self.target_dir / 'buf.gen.yaml' if self.target_dir is not None else None
+            if path is None or not path.is_file():
+                return []
+            data = path.read_bytes()
+        try:
+            config = yaml.safe_load(data) or {}
+        except yaml.YAMLError:
+            return []
+        outs = (plugin.get('out') for plugin in config.get('plugins') or () if isinstance(plugin, dict))
+        return sorted({_strip_dot(out).strip('/') for out in outs if isinstance(out, str) and out.strip('./')})
+
+    @staticmethod
+    def matches_any(rel_path: str, patterns: List[str]) -> bool:
+        """Whether a path matches one of the globs, or lies under a directory one of them names"""
+        import fnmatch
+        for pattern in patterns:
+            pattern = pattern.rstrip('/')
+            if fnmatch.fnmatch(rel_path, pattern) or rel_path.startswith(pattern + '/'):
+                return True
+        return False
+
     def load_config(self):
         """Load configuration from dropin_config.yaml"""
         config_path = Path(__file__).parent / 'dropin_config.yaml'
@@ -85,20 +527,21 @@ class AppTemplateDropin:
 
     def validate_directories(self):
         """Validate source and target directories"""
-        if not self.source_dir.exists():
-            raise FileNotFoundError(f"Source directory not found: {self.source_dir}")
+        if not self.source.exists(''):
+            raise FileNotFoundError(f"Source directory not found: {self.source}")
             
-        if not (self.source_dir / 'protos').exists():
-            raise FileNotFoundError(f"Not a valid AppTemplate directory: {self.source_dir}")
+        if not self.source.is_dir('protos'):
+            raise FileNotFoundError(f"Not a valid AppTemplate directory: {self.source}")
             
-        self.target_dir.mkdir(parents=True, exist_ok=True)
+        if self.target_dir is not None:
+            self.target_dir.mkdir(parents=True, exist_ok=True)
         
-        print(f"✅ Validated directories")
+        self.log(f"✅ Validated directories")
 
     def backup_target(self):
         """Create backup of target directory"""
         if self.dry_run:
-            print("🧪 Would create backup")
+            self.log("🧪 Would create backup")
             return
             
         backup_dir = self.target_dir.parent / f"{self.target_dir.name}.backup"
@@ -107,50 +550,63 @@ class AppTemplateDropin:
         
         if list(self.target_dir.iterdir()):  # If target has files
             shutil.copytree(self.target_dir, backup_dir)
-            print(f"💾 Created backup at {backup_dir}")
+            self.log(f"💾 Created backup at {backup_dir}")
+
+    def emit(self, rel_path: str, data: bytes, mode: int = 0o644):
+        """Write one output file to the sink, applying the project configuration updates"""
+        self.sink.write(rel_path, self.finalize_content(rel_path, data), mode)
+        self.written.add(rel_path)
+
+    def copy_file(self, rel_path: str):
+        """Copy a template file unchanged"""
+        local_path = self.source.local_path(rel_path)
+        if local_path is not None and isinstance(self.sink, DirectorySink) and rel_path not in PROJECT_CONFIG_FILES:
+            self.sink.copy(rel_path, local_path)
+            self.written.add(rel_path)
+        else:
+            self.emit(rel_path, self.source.read_bytes(rel_path), self.source.mode(rel_path))
 
     def copy_infrastructure(self):
         """Copy all files except those excluded, using opt-out approach"""
-        print("📋 Copying infrastructure files...")
+        self.log("📋 Copying infrastructure files...")
         
-        def copy_recursive(src_path: Path, dst_path: Path, rel_path: str = ""):
+        def copy_recursive(rel_path: str = ""):
             """Recursively copy files, excluding based on config"""
-            if src_path.is_dir():
+            if self.source.is_dir(rel_path):
                 # Check if directory should be excluded
                 if self.should_exclude_path(rel_path):
                     return
                     
-                if dst_path.exists():
-                    if dst_path.is_file():
-                        dst_path.unlink()
-                else:
-                    dst_path.mkdir(parents=True, exist_ok=True)
+                if isinstance(self.sink, DirectorySink):
+                    dst_path = self.sink.root / rel_path
+                    if dst_path.exists():
+                        if dst_path.is_file():
+                            dst_path.unlink()
+                    else:
+                        dst_path.mkdir(parents=True, exist_ok=True)
                 
-                for item in src_path.iterdir():
-                    item_rel_path = f"{rel_path}/{item.name}" if rel_path else item.name
-                    copy_recursive(item, dst_path / item.name, item_rel_path)
+                for name in self.source.listdir(rel_path):
+                    copy_recursive(f"{rel_path}/{name}" if rel_path else name)
             else:
                 # Check if file should be excluded
                 if self.should_exclude_path(rel_path):
                     return
                 
                 if self.dry_run:
-                    print(f"🧪 Would copy: {rel_path}")
+                    self.log(f"🧪 Would copy: {rel_path}")
                     return
                 
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                
                 # Copy and transform file
-                if self.should_transform_file(src_path):
-                    content = src_path.read_text(encoding='utf-8', errors='ignore')
+                if self.should_transform_file(Path(rel_path)):
+                    content = self.source.read_text(rel_path, errors='ignore')
                     content = self.transform_project_content(content)
-                    dst_path.write_text(content, encoding='utf-8')
+                    self.emit(rel_path, content.encode('utf-8'), self.source.mode(rel_path))
                 else:
-                    shutil.copy2(src_path, dst_path)
-                print(f"📄 Copied: {rel_path}")
+                    self.copy_file(rel_path)
+                self.log(f"📄 Copied: {rel_path}")
         
-        # Start recursive copy from source directory
-        copy_recursive(self.source_dir, self.target_dir)
+        # Start recursive copy from source root
+        copy_recursive()
 
     def should_exclude_path(self, rel_path: str) -> bool:
         """Check if a path should be excluded based on config"""
@@ -186,7 +642,7 @@ class AppTemplateDropin:
                     content = self.transform_project_content(content)
                     file_path.write_text(content, encoding='utf-8')
                 except Exception as e:
-                    print(f"⚠️  Failed to transform {file_path}: {e}")
+                    self.log(f"⚠️  Failed to transform {file_path}: {e}")
 
     def should_transform_file(self, file_path: Path) -> bool:
         """Determine if a file should be transformed (text files only)"""
@@ -248,13 +704,13 @@ class AppTemplateDropin:
 
     def generate_entities(self):
         """Generate files for each entity"""
-        print("🏗️  Generating entity files...")
+        self.log("🏗️  Generating entity files...")
         
         # First copy the models.proto file
         self.copy_models_proto()
         
         for entity in self.entities:
-            print(f"🎯 Generating files for entity: {entity}")
+            self.log(f"🎯 Generating files for entity: {entity}")
             self.generate_proto_files(entity)
             self.generate_service_files(entity)
             self.generate_web_files(entity)
@@ -262,19 +718,17 @@ class AppTemplateDropin:
 
     def copy_models_proto(self):
         """Copy and update models.proto file"""
-        source_models = self.source_dir / 'protos/apptemplate/v1/models.proto'
-        if not source_models.exists():
+        source_models = 'protos/apptemplate/v1/models.proto'
+        if not self.source.exists(source_models):
             return
             
-        target_models = self.target_dir / f'protos/{self.project_name.lower()}/v1/models.proto'
+        target_models = f'protos/{self.project_name.lower()}/v1/models.proto'
         
         if self.dry_run:
-            print(f"🧪 Would copy: models.proto")
+            self.log(f"🧪 Would copy: models.proto")
             return
             
-        target_models.parent.mkdir(parents=True, exist_ok=True)
-        
-        content = source_models.read_text()
+        content = self.source.read_text(source_models)
         content = self.transform_project_content(content)
         
         # Replace AppItem with entity definitions if not excluding appitem
@@ -285,8 +739,8 @@ class AppTemplateDropin:
             # Remove AppItem and add entity definitions
             content = self.remove_appitem_and_add_entities(content)
         
-        target_models.write_text(content)
-        print(f"📄 Generated: models.proto")
+        self.emit(target_models, content.encode('utf-8'))
+        self.log(f"📄 Generated: models.proto")
 
     def remove_appitem_and_add_entities(self, content: str) -> str:
         """Remove AppItem definition and add entity definitions"""
@@ -339,53 +793,38 @@ message {entity} {{
         result = '\n'.join(filtered_lines) + '\n' + '\n'.join(entity_definitions) + '\n'
         return result
 
-    def generate_proto_files(self, entity: str):
-        """Generate protobuf files for entity"""
-        source_proto = self.source_dir / 'protos/apptemplate/v1/appitems.proto'
-        if not source_proto.exists():
-            print(f"⚠️  Source proto not found: {source_proto}")
-            return
+    def generate_from_template(self, source_file: str, target_file: str, entity: str) -> bool:
+        """Render one AppItem template file for an entity, returns False if the template is missing"""
+        if not self.source.exists(source_file):
+            return False
             
-        entity_plural = self.pluralize(entity.lower())
-        target_proto = self.target_dir / f'protos/{self.project_name.lower()}/v1/{entity_plural}.proto'
-        
         if self.dry_run:
-            print(f"🧪 Would generate: {target_proto}")
-            return
+            self.log(f"🧪 Would generate: {target_file}")
+            return True
             
-        target_proto.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Read and transform proto content
-        content = source_proto.read_text()
+        content = self.source.read_text(source_file)
         content = self.transform_entity_content(content, entity)
         content = self.transform_project_content(content)
         
-        target_proto.write_text(content)
-        print(f"📄 Generated: {target_proto}")
+        self.emit(target_file, content.encode('utf-8'))
+        self.log(f"📄 Generated: {target_file}")
+        return True
+
+    def generate_proto_files(self, entity: str):
+        """Generate protobuf files for entity"""
+        source_proto = 'protos/apptemplate/v1/appitems.proto'
+        entity_plural = self.pluralize(entity.lower())
+        target_proto = f'protos/{self.project_name.lower()}/v1/{entity_plural}.proto'
+        if not self.generate_from_template(source_proto, target_proto, entity):
+            self.log(f"⚠️  Source proto not found: {source_proto}")
 
     def generate_service_files(self, entity: str):
         """Generate Go service files for entity"""
-        source_service = self.source_dir / 'services/appitems_service.go'
-        if not source_service.exists():
-            print(f"⚠️  Source service not found: {source_service}")
-            return
-            
+        source_service = 'services/appitems_service.go'
         entity_plural = self.pluralize(entity.lower())
-        target_service = self.target_dir / f'services/{entity_plural}_service.go'
-        
-        if self.dry_run:
-            print(f"🧪 Would generate: {target_service}")
-            return
-            
-        target_service.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Read and transform service content
-        content = source_service.read_text()
-        content = self.transform_entity_content(content, entity)
-        content = self.transform_project_content(content)
-        
-        target_service.write_text(content)
-        print(f"📄 Generated: {target_service}")
+        target_service = f'services/{entity_plural}_service.go'
+        if not self.generate_from_template(source_service, target_service, entity):
+            self.log(f"⚠️  Source service not found: {source_service}")
 
     def generate_web_files(self, entity: str):
         """Generate web server files for entity"""
@@ -399,45 +838,12 @@ message {entity} {{
         ]
         
         for source_file, target_file in web_files:
-            source_path = self.source_dir / source_file
-            if not source_path.exists():
-                continue
-                
-            target_path = self.target_dir / target_file
-            
-            if self.dry_run:
-                print(f"🧪 Would generate: {target_file}")
-                continue
-                
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            content = source_path.read_text()
-            content = self.transform_entity_content(content, entity)
-            content = self.transform_project_content(content)
-            
-            target_path.write_text(content)
-            print(f"📄 Generated: {target_file}")
+            self.generate_from_template(source_file, target_file, entity)
 
     def generate_frontend_files(self, entity: str):
         """Generate frontend TypeScript files for entity"""
-        source_ts = self.source_dir / 'web/frontend/components/AppItemDetailsPage.ts'
-        if not source_ts.exists():
-            return
-            
-        target_ts = self.target_dir / f'web/frontend/components/{entity}DetailsPage.ts'
-        
-        if self.dry_run:
-            print(f"🧪 Would generate: {target_ts}")
-            return
-            
-        target_ts.parent.mkdir(parents=True, exist_ok=True)
-        
-        content = source_ts.read_text()
-        content = self.transform_entity_content(content, entity)
-        content = self.transform_project_content(content)
-        
-        target_ts.write_text(content)
-        print(f"📄 Generated: {target_ts}")
+        self.generate_from_template('web/frontend/components/AppItemDetailsPage.ts',
+                                    f'web/frontend/components/{entity}DetailsPage.ts', entity)
 
     def transform_entity_content(self, content: str, entity: str) -> str:
         """Transform content by replacing AppItem references with entity name"""
@@ -496,90 +902,78 @@ message {entity} {{
             return word + 's'
 
     def update_project_configuration(self):
-        """Update project-wide configuration files"""
-        print("⚙️  Updating project configuration...")
+        """Update project-wide configuration files.
+
+        Files rendered in this run were already updated as they were written
+        (which is what lets streaming sinks work); this handles the ones that
+        only exist in the target.
+        """
+        self.log("⚙️  Updating project configuration...")
         
-        self.update_go_mod()
-        self.update_package_json()
-        self.update_devloop_config()
+        for rel_path, label in PROJECT_CONFIG_FILES.items():
+            if rel_path in self.written:
+                self.log(f"📄 Updated {label}")
+                continue
+            data = self.sink.read(rel_path)
+            if data is None:
+                continue
+            if self.dry_run:
+                self.log(f"🧪 Would update {label}")
+                continue
+            self.sink.write(rel_path, self.finalize_content(rel_path, data))
+            self.log(f"📄 Updated {label}")
 
-    def update_go_mod(self):
+    def finalize_content(self, rel_path: str, data: bytes) -> bytes:
+        """Apply the project configuration update for `rel_path`, if it has one"""
+        if rel_path == 'go.mod':
+            return self.update_go_mod(data.decode('utf-8')).encode('utf-8')
+        if rel_path == 'web/package.json':
+            return self.update_package_json(data.decode('utf-8')).encode('utf-8')
+        if rel_path == '.devloop.yaml':
+            return self.update_devloop_config(data.decode('utf-8')).encode('utf-8')
+        return data
+
+    def update_go_mod(self, content: str) -> str:
         """Update go.mod with new module path"""
-        go_mod_path = self.target_dir / 'go.mod'
-        if not go_mod_path.exists():
-            return
-            
-        if self.dry_run:
-            print("🧪 Would update go.mod")
-            return
-            
-        content = go_mod_path.read_text()
-        content = re.sub(
+        return re.sub(
             r'module github\.com/panyam/apptemplate',
             f'module {self.module_path}',
             content
         )
-        go_mod_path.write_text(content)
-        print("📄 Updated go.mod")
 
-    def update_package_json(self):
+    def update_package_json(self, content: str) -> str:
         """Update package.json with project details"""
-        package_json_path = self.target_dir / 'web/package.json'
-        if not package_json_path.exists():
-            return
-            
-        if self.dry_run:
-            print("🧪 Would update package.json")
-            return
-            
-        with open(package_json_path, 'r') as f:
-            data = json.load(f)
-            
+        data = json.loads(content)
         data['name'] = self.project_name
         data['description'] = f'{self.project_name} web frontend'
-        
-        with open(package_json_path, 'w') as f:
-            json.dump(data, f, indent=2)
-            
-        print("📄 Updated package.json")
+        return json.dumps(data, indent=2)
 
-    def update_devloop_config(self):
-        """Update .devloop.yaml if it exists"""
-        devloop_path = self.target_dir / '.devloop.yaml'
-        if not devloop_path.exists():
-            return
-            
-        if self.dry_run:
-            print("🧪 Would update .devloop.yaml")
-            return
-            
-        content = devloop_path.read_text()
-        content = content.replace('apptemplate', self.project_name)
-        devloop_path.write_text(content)
-        print("📄 Updated .devloop.yaml")
+    def update_devloop_config(self, content: str) -> str:
+        """Update .devloop.yaml contents"""
+        return content.replace('apptemplate', self.project_name)
 
     def generate_code(self):
         """Run code generation commands"""
-        print("🔧 Running code generation...")
+        self.log("🔧 Running code generation...")
         
         if self.dry_run:
-            print("🧪 Would run: buf generate")
-            print("🧪 Would run: make build-frontend")
+            self.log("🧪 Would run: buf generate")
+            self.log("🧪 Would run: make build-frontend")
             return
             
         # Run buf generate for protobuf code
         try:
             subprocess.run(['buf', 'generate'], cwd=self.target_dir, check=True)
-            print("✅ Generated protobuf code")
+            self.log("✅ Generated protobuf code")
         except subprocess.CalledProcessError:
-            print("⚠️  Failed to run buf generate")
+            self.log("⚠️  Failed to run buf generate")
             
         # Run frontend build
         try:
             subprocess.run(['make', 'build-frontend'], cwd=self.target_dir / 'web', check=True)
-            print("✅ Built frontend")
+            self.log("✅ Built frontend")
         except subprocess.CalledProcessError:
-            print("⚠️  Failed to build frontend")
+            self.log("⚠️  Failed to build frontend")
 
 
 def auto_detect_source():
@@ -614,15 +1008,25 @@ Examples:
   # Full configuration
   dropin . ../new-project --entities Product,Category \\
     --project-name ecommerce --module-path github.com/company/ecommerce
+  
+  # Report drift of an existing project from the template (writes nothing, exit 1 on drift)
+  dropin . ../new-project --entities Product,Category --project-name ecommerce --check
+  
+  # Template from an archive, project written to an archive
+  dropin apptemplate.tar.gz ecommerce.zip --entities Product,Category --prefix ecommerce
         """
     )
     
-    parser.add_argument('args', nargs='+', help='[source] target - Target directory (source auto-detected if not provided)')
+    parser.add_argument('args', nargs='+', help='[source] target - Target directory or .zip/.tar(.gz) archive (source auto-detected if not provided)')
     parser.add_argument('--entities', required=True, help='Comma-separated list of entities')
     parser.add_argument('--project-name', help='Project name (default: target directory name)')
     parser.add_argument('--module-path', help='Go module path')
     parser.add_argument('--exclude-appitem', action='store_true', default=True, help='Exclude AppItem files')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without executing')
+    parser.add_argument('--prefix', default='', help='Top-level directory for entries of an archive target')
+    parser.add_argument('--check', action='store_true', help='Report files that differ from what a drop-in would write, without writing')
+    parser.add_argument('--jobs', type=int, help='Threads comparing files in --check mode')
+    parser.add_argument('--json', action='store_true', help='Print the --check report as JSON')
     
     args = parser.parse_args()
     
@@ -645,6 +1049,12 @@ Examples:
     
     entities = [e.strip() for e in args.entities.split(',')]
     
+    sink = None
+    if is_archive(target):
+        if args.check:
+            parser.error("--check needs a target directory")
+        sink = MemorySink() if args.dry_run else open_sink(target, args.prefix)
+    
     dropin = AppTemplateDropin(
         source_dir=source,
         target_dir=target,
@@ -653,10 +1063,40 @@ Examples:
         module_path=args.module_path,
         exclude_appitem=args.exclude_appitem,
         dry_run=args.dry_run,
+        sink=sink,
     )
     
+    if args.check:
+        sys.exit(run_check(dropin, args.jobs, args.json))
+    
     dropin.run()
 
 
+def run_check(dropin: AppTemplateDropin, jobs: Optional[int] = None, as_json: bool = False) -> int:
+    """Print the drift report of a target, returns the exit status (1 if it drifted)"""
+    if not dropin.source.is_dir('protos'):
+        print(f"❌ Error: Not a valid AppTemplate directory: {dropin.source}")
+        return 2
+    if not dropin.target_dir.is_dir():
+        print(f"❌ Error: Target directory not found: {dropin.target_dir}")
+        return 2
+    report = dropin.check(jobs)
+    drifted = any(report.values())
+    if as_json:
+        print(json.dumps(dict(report, target=str(dropin.target_dir), drifted=drifted), indent=2))
+        return 1 if drifted else 0
+    
+    labels = {'added': '➕ Added', 'changed': '✏️  Changed', 'missing': '➖ Missing'}
+    for status, label in labels.items():
+        for rel_path in report[status]:
+            print(f"{label}: {rel_path}")
+    if drifted:
+        counts = ', '.join(f"{len(report[status])} {status}" for status in labels)
+        print(f"⚠️  {dropin.target_dir} has drifted from the template: {counts}")
+        return 1
+    print(f"✅ {dropin.target_dir} matches the template")
+    return 0
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the dropin tests.
+
+Run from scripts/:
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A small AppTemplate tree: infrastructure, AppItem templates and generated code
+TEMPLATE_FILES = {
+    'go.mod': 'module github.com/panyam/apptemplate\n\ngo 1.24.0\n',
+    'main.go': 'package main\n\nimport "github.com/panyam/apptemplate/web/server"\n',
+    'Makefile': 'run:\n\tgo run ./ APPTEMPLATE_PORT=8080\n',
+    '.devloop.yaml': 'name: apptemplate\n',
+    '.env': 'SECRET=1\n',
+    'buf.gen.yaml': ('version: v2\nplugins:\n  - local: protoc-gen-go\n    out: gen/go\n'
+                     '  - local: protoc-gen-es\n    out: web/frontend/gen\n'),
+    'protos/apptemplate/v1/models.proto': ('syntax = "proto3";\npackage apptemplate.v1;\n\n'
+                                           'message AppItem {\n  string id = 1;\n}\n\nmessage Pagination {\n}\n'),
+    'protos/apptemplate/v1/appitems.proto': ('syntax = "proto3";\npackage apptemplate.v1;\n'
+                                             'import "apptemplate/v1/models.proto";\n'
+                                             'service AppItemsService {\n  rpc ListAppItems(Pagination) returns (AppItem);\n}\n'),
+    'services/appitems_service.go': 'package services\n\n// AppItemsServiceImpl serves appitems\n',
+    'services/grpcserver.go': 'package services\n',
+    'web/package.json': '{"name": "apptemplate", "description": "x"}',
+    'web/server/AppItemDetailPage.go': 'package server\n\ntype AppItemDetailPage struct{}\n',
+    'web/server/views.go': 'package server\n',
+    'web/templates/AppItemList.html': '<h1>AppItems</h1>\n',
+    'web/static/logo.png': b'\x89PNG\x00\xff',
+    'gen/go/apptemplate/v1/models.pb.go': 'package v1\n',
+    'python/appitems/__init__.py': '',
+    'python/tests/test_loadgen.py': 'from appitems import loadgen\n',
+    'python/README.md': '# AppItems Python tools\n',
+}
+
+
+def write_tree(root, files):
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+    return root
+
+
+@pytest.fixture
+def template(tmp_path):
+    return write_tree(tmp_path / 'apptemplate', TEMPLATE_FILES)
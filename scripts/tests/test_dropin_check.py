@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from dropin import AppTemplateDropin, DirectorySink, DirectorySource, run_check
+
+
+def dropin(template, target):
+    return AppTemplateDropin(None, None, ['Book'], module_path='github.com/acme/bookstore', quiet=True,
+                             project_name='bookstore', source=DirectorySource(template), sink=DirectorySink(target))
+
+
+@pytest.fixture
+def target(template, tmp_path):
+    target = tmp_path / 'bookstore'
+    dropin(template, target).render()
+    return target
+
+
+def test_fresh_drop_in_has_no_drift(template, target, capsys):
+    assert dropin(template, target).check() == {'added': [], 'changed': [], 'missing': []}
+    assert run_check(dropin(template, target)) == 0
+    assert 'matches the template' in capsys.readouterr().out
+
+
+def test_check_reports_added_changed_and_missing(template, target):
+    (target / 'services/books_service.go').write_text('package services\n\n// edited\n')
+    (target / 'web/server/views.go').unlink()
+    (target / 'services/extra.go').write_text('package services\n')
+    (target / 'web/templates/Extra.html').write_text('<p>extra</p>\n')
+
+    report = dropin(template, target).check(jobs=2)
+    assert report == {'added': ['services/extra.go', 'web/templates/Extra.html'],
+                      'changed': ['services/books_service.go'], 'missing': ['web/server/views.go']}
+
+
+def test_project_files_outside_the_template_are_not_added(template, target):
+    extras = ['cmd/tool/main.go', 'docs/index.md', 'web/server/admin/page.go', 'protos/other/v1/x.proto',
+              # Outputs of buf generate, from the out entries of buf.gen.yaml
+              'gen/go/bookstore/v1/books.pb.go', 'web/frontend/gen/bookstore/v1/books_pb.ts',
+              'node_modules/x/index.js']
+    for rel_path in extras:
+        path = target / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x\n')
+    assert dropin(template, target).check()['added'] == []
+
+
+def test_generated_dirs_follow_buf_gen_yaml(template, target):
+    (template / 'buf.gen.yaml').write_text('version: v2\nplugins:\n  - local: protoc-gen-go\n    out: ./services/pb/\n')
+    (target / 'services/pb').mkdir()
+    (target / 'services/pb/books.pb.go').write_text('package pb\n')
+    (target / 'services/extra.go').write_text('package services\n')
+    checker = dropin(template, target)
+    assert checker.generated_dirs(checker.render_expected()) == ['services/pb']
+    assert checker.check() == {'added': ['services/extra.go'], 'changed': ['buf.gen.yaml'], 'missing': []}
+
+
+def test_dropinignore_hides_paths(template, target):
+    (target / '.dropinignore').write_text('# customised on purpose\nservices/*.go\n\nweb/server/\n')
+    (target / 'services/books_service.go').write_text('edited\n')
+    (target / 'services/extra.go').write_text('package services\n')
+    (target / 'web/server/views.go').unlink()
+    (target / 'web/templates/Extra.html').write_text('<p>extra</p>\n')
+
+    checker = dropin(template, target)
+    assert checker.check_ignores() == ['services/*.go', 'web/server/']
+    assert checker.check() == {'added': ['web/templates/Extra.html'], 'changed': [], 'missing': []}
+
+
+def test_run_check_exit_codes_and_json(template, target, tmp_path, capsys):
+    (target / 'services/extra.go').write_text('package services\n')
+    assert run_check(dropin(template, target), as_json=True) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report['drifted'] and report['added'] == ['services/extra.go'] and report['target'] == str(target)
+
+    assert run_check(dropin(template, target)) == 1
+    out = capsys.readouterr().out
+    assert 'Added: services/extra.go' in out and '1 added, 0 changed, 0 missing' in out
+
+    assert run_check(dropin(template, tmp_path / 'nowhere')) == 2
@@ -0,0 +1,110 @@
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from dropin import (AppTemplateDropin, DirectorySink, DirectorySource, MemorySink, MemorySource, TarSink, ZipSink,
+                    open_sink, open_source)
+
+
+def render(source, sink=None, entities=('Book',), **options):
+    sink = sink if sink is not None else MemorySink()
+    options.setdefault('project_name', 'bookstore')
+    AppTemplateDropin(None, None, list(entities), module_path='github.com/acme/bookstore', quiet=True,
+                      source=source, sink=sink, **options).render()
+    return sink
+
+
+def archive(template, path, fmt):
+    """Pack the template under a top-level directory, as GitHub source archives do"""
+    if fmt == 'zip':
+        with zipfile.ZipFile(path, 'w') as zf:
+            for file in sorted(template.rglob('*')):
+                if file.is_file():
+                    zf.write(file, 'apptemplate-main/' + file.relative_to(template).as_posix())
+    else:
+        with tarfile.open(path, 'w:gz') as tf:
+            tf.add(template, 'apptemplate-main')
+    return str(path)
+
+
+def test_render_into_memory(template):
+    files = render(DirectorySource(template)).files
+    assert 'protos/bookstore/v1/books.proto' in files
+    assert 'services/books_service.go' in files and 'web/server/BookDetailPage.go' in files
+    assert b'BooksServiceImpl serves books' in files['services/books_service.go']
+    assert b'package bookstore.v1' in files['protos/bookstore/v1/models.proto']
+    assert b'message AppItem' not in files['protos/bookstore/v1/models.proto']
+
+    # Project settings are rewritten as the files are rendered
+    assert files['go.mod'].startswith(b'module github.com/acme/bookstore\n')
+    assert json.loads(files['web/package.json'])['name'] == 'bookstore'
+    assert files['.devloop.yaml'] == b'name: bookstore\n'
+
+    # Generated code, hidden files and the AppItem templates themselves are not copied
+    for rel_path in files:
+        assert not rel_path.startswith(('gen/', 'python/', '.env'))
+    assert 'services/appitems_service.go' not in files and 'protos/apptemplate/v1/appitems.proto' not in files
+
+
+@pytest.mark.parametrize('fmt, name', [('zip', 'apptemplate.zip'), ('tar', 'apptemplate.tar.gz')])
+def test_archive_source_renders_like_the_directory(template, tmp_path, fmt, name):
+    path = archive(template, tmp_path / name, fmt)
+    source = open_source(path)
+    assert isinstance(source, MemorySource)
+    assert source.is_dir('protos') and source.listdir('web') == ['package.json', 'server', 'static', 'templates']
+    assert source.read_bytes('web/static/logo.png') == b'\x89PNG\x00\xff'
+    with pytest.raises(FileNotFoundError):
+        source.read_bytes('missing.txt')
+
+    assert render(source).files == render(DirectorySource(template)).files
+
+
+def test_directory_sink_writes_the_same_files(template, tmp_path):
+    target = tmp_path / 'bookstore'
+    sink = render(DirectorySource(template), DirectorySink(target))
+    expected = render(DirectorySource(template)).files
+    written = {path.relative_to(target).as_posix(): path.read_bytes() for path in target.rglob('*') if path.is_file()}
+    assert written == expected
+    assert sink.read('go.mod') == expected['go.mod'] and sink.read('nope') is None
+
+
+def test_config_files_only_in_the_target_are_updated(template, tmp_path):
+    (template / 'go.mod').unlink()
+    target = tmp_path / 'bookstore'
+    target.mkdir()
+    (target / 'go.mod').write_text('module github.com/panyam/apptemplate\n')
+    render(DirectorySource(template), DirectorySink(target))
+    assert (target / 'go.mod').read_text() == 'module github.com/acme/bookstore\n'
+
+
+@pytest.mark.parametrize('name', ['bookstore.zip', 'bookstore.tar.gz', 'bookstore.tar'])
+def test_archive_sinks_round_trip(template, tmp_path, name):
+    (template / 'main.go').chmod(0o755)
+    target = str(tmp_path / name)
+    sink = open_sink(target, prefix='bookstore')
+    assert isinstance(sink, ZipSink if name.endswith('.zip') else TarSink)
+    render(DirectorySource(template), sink)
+    sink.close()
+
+    expected = render(DirectorySource(template)).files
+    source = MemorySource.from_archive(target)
+    assert source.files == expected
+    # File modes survive the trip
+    assert (source.mode('main.go'), source.mode('go.mod')) == (0o755, 0o644)
+
+
+def test_tar_sink_streams_to_a_file_object(template):
+    buf = io.BytesIO()
+    sink = TarSink(buf, compression='')
+    render(DirectorySource(template), sink)
+    sink.close()
+    with tarfile.open(fileobj=io.BytesIO(buf.getvalue())) as tf:
+        assert 'protos/bookstore/v1/books.proto' in tf.getnames()
+
+
+def test_project_name_is_required_without_a_target(template):
+    with pytest.raises(ValueError, match='project_name'):
+        AppTemplateDropin(None, None, ['Book'], source=DirectorySource(template), sink=MemorySink())
@@ -5,11 +5,19 @@ import (
 
 	"connectrpc.com/connect"
 	v1 "github.com/panyam/apptemplate/gen/go/apptemplate/v1"
+	"github.com/panyam/apptemplate/gen/go/apptemplate/v1/v1connect"
 	"github.com/panyam/apptemplate/services"
 )
 
 // ConnectAppItemsServiceAdapter adapts the gRPC AppItemsService to Connect's interface
+//
+// RPCs that answer Unimplemented:
+//   - CreateAppItems and WatchAppItems are not forwarded, the embedded
+//     UnimplementedAppItemsServiceHandler answers them
+//   - CreateAppItem, GetAppItems, DeleteAppItem and UpdateAppItem are forwarded, but
+//     services.AppItemsServiceImpl only implements ListAppItems and GetAppItem
 type ConnectAppItemsServiceAdapter struct {
+	v1connect.UnimplementedAppItemsServiceHandler
 	svc *services.AppItemsServiceImpl
 }
 